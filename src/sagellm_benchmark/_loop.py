@@ -0,0 +1,58 @@
+"""Event loop selection for the benchmark entry points.
+
+Streamed benchmarks are sensitive to event-loop overhead at high
+concurrency, so entry points run their top-level coroutine through
+:func:`run`, which opts into uvloop when ``SAGELLM_UVLOOP=1`` is set
+(requires ``pip install uvloop``). The loop is chosen per call via a
+loop factory, so no global event loop policy is changed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Set to "1" to run the benchmark entry points on uvloop.
+_UVLOOP_ENV = "SAGELLM_UVLOOP"
+
+
+def uvloop_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when ``SAGELLM_UVLOOP=1`` is set.
+
+    Returns:
+        ``uvloop.new_event_loop``, or None if uvloop was not requested or
+        is not installed.
+    """
+    if os.environ.get(_UVLOOP_ENV) != "1":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("uvloop not installed; using the default asyncio event loop")
+        return None
+    logger.info("Using uvloop event loop")
+    return uvloop.new_event_loop
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run ``main`` in a fresh event loop, like :func:`asyncio.run`.
+
+    Uses uvloop when :func:`uvloop_loop_factory` provides one.
+    :class:`asyncio.Runner` takes the same ``loop_factory`` argument as
+    ``asyncio.run`` on Python 3.12+, and is also available on 3.11.
+
+    Args:
+        main: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    with asyncio.Runner(loop_factory=uvloop_loop_factory()) as runner:
+        return runner.run(main)
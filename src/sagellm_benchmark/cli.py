@@ -1333,7 +1333,9 @@ def run(
     console.print(f"Workloads: {len(workloads)}\n")
 
     try:
-        results = asyncio.run(runner.run())
+        from sagellm_benchmark import _loop
+
+        results = _loop.run(runner.run())
 
         # Display summary
         console.print("\n[bold green]✓ Benchmark completed![/bold green]\n")
@@ -1351,9 +1353,7 @@ def run(
             # Convert results to serializable format
             json_results = {}
             for name, metrics in results.items():
-                from dataclasses import asdict
-
-                json_results[name] = asdict(metrics)
+                json_results[name] = metrics.to_dict()
 
             with open(output_json_path, "w") as f:
                 json.dump(json_results, f, indent=2)
@@ -12,15 +12,50 @@ All implementations must return BenchmarkResult with complete Metrics.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from sagellm_benchmark.types import BenchmarkResult
+
 if TYPE_CHECKING:
-    from sagellm_benchmark.types import BenchmarkRequest, BenchmarkResult
+    from collections.abc import Callable
+
+    from sagellm_benchmark.types import BenchmarkRequest
+
+    ResultCallback = Callable[[BenchmarkResult], None]
 
 logger = logging.getLogger(__name__)
 
+# Clients time requests with integer ``time.perf_counter_ns()`` readings and
+# convert to milliseconds/seconds only when reporting.
+NS_PER_MS = 1_000_000
+NS_PER_S = 1_000_000_000
+
+# Failed requests log one line each; only every N-th failure (and every failure
+# at DEBUG level) carries a traceback so provider outages do not flood the log.
+_TRACEBACK_SAMPLE_EVERY = 100
+
+try:
+    from sagellm_protocol import Metrics
+except ImportError:  # pragma: no cover - sagellm_protocol is a core dependency
+    EMPTY_METRICS = None
+else:
+    # Zero-valued template: clients fill the fields they measured via
+    # ``EMPTY_METRICS.model_copy(update=...)`` instead of validating a fresh
+    # pydantic model for every request.
+    EMPTY_METRICS = Metrics(ttft_ms=0.0, throughput_tps=0.0, peak_mem_mb=0, error_rate=0.0)
+
+
+@functools.lru_cache(maxsize=4096)
+def prompt_word_count(prompt: str) -> int:
+    """Whitespace word count used to estimate prompt tokens without a tokenizer.
+
+    Cached because benchmark replays send the same prompts many times.
+    """
+    return len(prompt.split())
+
 
 class BenchmarkClient(ABC):
     """Abstract base class for benchmark clients.
@@ -39,6 +74,9 @@ class BenchmarkClient(ABC):
         timeout: Default timeout for requests (seconds).
     """
 
+    # Failed requests seen so far, used to sample tracebacks
+    _error_count = 0
+
     def __init__(self, name: str = "base", timeout: float = 60.0) -> None:
         """Initialize client.
 
@@ -48,7 +86,7 @@ class BenchmarkClient(ABC):
         """
         self.name = name
         self.timeout = timeout
-        logger.info(f"Initialized {self.name} client (timeout={timeout}s)")
+        logger.info("Initialized %s client (timeout=%ss)", self.name, timeout)
 
     @abstractmethod
     async def generate(self, request: BenchmarkRequest) -> BenchmarkResult:
@@ -71,6 +109,7 @@ class BenchmarkClient(ABC):
         requests: list[BenchmarkRequest],
         concurrent: bool = False,
         timeout: float | None = None,
+        on_result: ResultCallback | None = None,
     ) -> list[BenchmarkResult]:
         """Execute a batch of requests.
 
@@ -78,6 +117,8 @@ class BenchmarkClient(ABC):
             requests: List of benchmark requests.
             concurrent: If True, execute concurrently. If False, sequential.
             timeout: Timeout for each request (uses self.timeout if None).
+            on_result: Called with each result as soon as its request
+                completes (completion order), e.g. ``MetricsAggregator.update``.
 
         Returns:
             List of benchmark results in the same order as input.
@@ -96,49 +137,64 @@ class BenchmarkClient(ABC):
 
         try:
             if concurrent:
-                logger.info(f"Running {len(requests)} requests concurrently")
-                results = await self._run_concurrent(requests)
+                logger.info("Running %d requests concurrently", len(requests))
+                results = await self._run_concurrent(requests, on_result)
             else:
-                logger.info(f"Running {len(requests)} requests sequentially")
-                results = await self._run_sequential(requests)
+                logger.info("Running %d requests sequentially", len(requests))
+                results = await self._run_sequential(requests, on_result)
 
             return results
         finally:
             self.timeout = original_timeout
 
-    async def _run_concurrent(self, requests: list[BenchmarkRequest]) -> list[BenchmarkResult]:
+    async def _run_concurrent(
+        self,
+        requests: list[BenchmarkRequest],
+        on_result: ResultCallback | None = None,
+    ) -> list[BenchmarkResult]:
         """Run requests concurrently with asyncio.gather.
 
         Args:
             requests: List of requests.
+            on_result: Optional per-result completion callback.
 
         Returns:
             Results in the same order as input.
         """
-        tasks = [self._safe_generate(req) for req in requests]
+        tasks = [self._safe_generate(req, on_result) for req in requests]
         results = await asyncio.gather(*tasks, return_exceptions=False)
         return list(results)
 
-    async def _run_sequential(self, requests: list[BenchmarkRequest]) -> list[BenchmarkResult]:
+    async def _run_sequential(
+        self,
+        requests: list[BenchmarkRequest],
+        on_result: ResultCallback | None = None,
+    ) -> list[BenchmarkResult]:
         """Run requests sequentially.
 
         Args:
             requests: List of requests.
+            on_result: Optional per-result completion callback.
 
         Returns:
             Results in the same order as input.
         """
         results = []
         for req in requests:
-            result = await self._safe_generate(req)
+            result = await self._safe_generate(req, on_result)
             results.append(result)
         return results
 
-    async def _safe_generate(self, request: BenchmarkRequest) -> BenchmarkResult:
+    async def _safe_generate(
+        self,
+        request: BenchmarkRequest,
+        on_result: ResultCallback | None = None,
+    ) -> BenchmarkResult:
         """Safely execute a request with error handling.
 
         Args:
             request: Benchmark request.
+            on_result: Optional callback invoked with the result.
 
         Returns:
             BenchmarkResult (success=False if error occurs).
@@ -146,29 +202,46 @@ class BenchmarkClient(ABC):
         try:
             # Add timeout wrapper
             result = await asyncio.wait_for(self.generate(request), timeout=self.timeout)
-            return result
         except TimeoutError:
-            logger.error(f"Request {request.request_id} timed out after {self.timeout}s")
-            # Import here to avoid circular dependency
-            from sagellm_benchmark.types import BenchmarkResult
-
-            return BenchmarkResult(
+            logger.error("Request %s timed out after %ss", request.request_id, self.timeout)
+            result = BenchmarkResult(
                 request_id=request.request_id,
                 success=False,
                 error=f"Timeout after {self.timeout}s",
                 metrics=None,
             )
         except Exception as e:
-            logger.error(f"Request {request.request_id} failed: {e}", exc_info=True)
-            from sagellm_benchmark.types import BenchmarkResult
-
-            return BenchmarkResult(
+            self._log_request_error("Request %s failed", request.request_id, exc=e)
+            result = BenchmarkResult(
                 request_id=request.request_id,
                 success=False,
                 error=str(e),
                 metrics=None,
             )
 
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    def _log_request_error(self, message: str, *args: object, exc: BaseException) -> None:
+        """Log a failed request as ``message: ExcType: exc`` using %-style args.
+
+        The first failure and every ``_TRACEBACK_SAMPLE_EVERY``-th one after it
+        include the traceback; formatting a traceback for every request of a
+        failing run costs more than the run itself.
+        """
+        self._error_count += 1
+        with_traceback = (self._error_count - 1) % _TRACEBACK_SAMPLE_EVERY == 0
+        # Log under the concrete client's module, as the inline calls did
+        client_logger = logging.getLogger(type(self).__module__)
+        client_logger.error(
+            message + ": %s: %s",
+            *args,
+            type(exc).__name__,
+            exc,
+            exc_info=exc if with_traceback or client_logger.isEnabledFor(logging.DEBUG) else None,
+        )
+
     async def health_check(self) -> bool:
         """Check if backend is healthy.
 
@@ -178,13 +251,29 @@ class BenchmarkClient(ABC):
         Note:
             Default implementation returns True. Override for real backends.
         """
-        logger.info(f"{self.name} health check (default=True)")
+        logger.info("%s health check (default=True)", self.name)
         return True
 
+    async def prime_connections(self, count: int) -> int:
+        """Open keep-alive connections before measurement starts.
+
+        Args:
+            count: Number of connections to establish.
+
+        Returns:
+            Number of priming requests that succeeded.
+
+        Note:
+            Default implementation does nothing. Override for HTTP backends so
+            the first measured requests do not pay for TCP/TLS setup.
+        """
+        del count
+        return 0
+
     async def close(self) -> None:
         """Close client and cleanup resources.
 
         Override this method if your client needs cleanup (e.g., close HTTP session).
         """
-        logger.info(f"Closing {self.name} client")
+        logger.info("Closing %s client", self.name)
         pass
@@ -0,0 +1,141 @@
+"""Request coalescing for micro-batched dispatch.
+
+Concurrent ``generate()`` calls arrive one request at a time. Backends that
+accept several prompts per call (multi-prompt ``/v1/completions``, batched
+engine ``generate``) are much more efficient when those requests are sent
+together. ``RequestCoalescer`` collects submissions for up to ``window_ms`` or
+until ``max_batch_size`` items are pending, then hands the whole batch to a
+dispatch coroutine and routes each result back to its caller. The dispatch
+coroutine also receives each item's ``time.perf_counter_ns()`` submit time,
+so latency measured from it includes the wait for the batch to fill.
+
+Example::
+
+    coalescer = RequestCoalescer(
+        dispatch=client._generate_many,
+        window_ms=5.0,
+        max_batch_size=16,
+        key=lambda req: (req.model, req.max_tokens),
+    )
+    result = await coalescer.submit(request)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from sagellm_benchmark.types import BenchmarkRequest
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def sampling_key(request: BenchmarkRequest) -> tuple[Any, ...]:
+    """Group key for requests that can share one batched generate call.
+
+    Requests with equal model and sampling parameters can be served by a
+    single multi-prompt call.
+    """
+    return (request.model, request.max_tokens, request.temperature, request.top_p)
+
+
+@dataclass(slots=True)
+class _Pending(Generic[T, R]):
+    """One queued submission: the item, its submit time and the future its caller awaits."""
+
+    item: T
+    future: asyncio.Future[R]
+    submitted_ns: int
+
+
+class RequestCoalescer(Generic[T, R]):
+    """Group concurrent submissions into batches for a single dispatch call.
+
+    Items are grouped by ``key`` so only compatible items (e.g. same model and
+    sampling parameters) share a batch. ``dispatch`` is called with the items
+    and their ``time.perf_counter_ns()`` submit times, and must return one
+    result per input item, in input order.
+
+    Args:
+        dispatch: Coroutine executing a batch and returning aligned results.
+        window_ms: How long the first item of a batch waits for companions.
+        max_batch_size: Flush immediately once this many items are pending.
+        key: Grouping function; all items share one group when None.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[list[T], list[int]], Awaitable[list[R]]],
+        window_ms: float,
+        max_batch_size: int = 16,
+        key: Callable[[T], Hashable] | None = None,
+    ) -> None:
+        if window_ms < 0:
+            raise ValueError("window_ms must be >= 0")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self.dispatch = dispatch
+        self.window_s = window_ms / 1000.0
+        self.max_batch_size = max_batch_size
+        self.key = key
+        self._pending: dict[Hashable, list[_Pending[T, R]]] = {}
+        self._timers: dict[Hashable, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, item: T) -> R:
+        """Queue ``item`` for the next batch of its group and await its result."""
+        submitted_ns = time.perf_counter_ns()
+        loop = asyncio.get_running_loop()
+        group = self.key(item) if self.key is not None else None
+        future: asyncio.Future[R] = loop.create_future()
+
+        batch = self._pending.setdefault(group, [])
+        batch.append(_Pending(item, future, submitted_ns))
+        if len(batch) >= self.max_batch_size:
+            self._flush(group)
+        elif group not in self._timers:
+            self._timers[group] = loop.call_later(self.window_s, self._flush, group)
+
+        return await future
+
+    def _flush(self, group: Hashable) -> None:
+        """Dispatch the pending batch of ``group`` as a background task."""
+        timer = self._timers.pop(group, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(group, None)
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        # Keep a strong reference until the batch completes
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[_Pending[T, R]]) -> None:
+        """Execute one batch and resolve each caller's future."""
+        items = [pending.item for pending in batch]
+        try:
+            results = await self.dispatch(items, [pending.submitted_ns for pending in batch])
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"Coalesced dispatch returned {len(results)} result(s) for {len(items)} item(s)"
+                )
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Coalesced batch of %d failed: %s", len(items), exc)
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(exc)
+            return
+
+        for pending, result in zip(batch, results, strict=True):
+            # Callers may have been cancelled (e.g. per-request timeout)
+            if not pending.future.done():
+                pending.future.set_result(result)
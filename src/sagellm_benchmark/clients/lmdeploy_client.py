@@ -10,14 +10,21 @@ Two modes:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import TYPE_CHECKING
 
-from sagellm_benchmark.clients.base import BenchmarkClient
+from sagellm_benchmark.clients.base import (
+    EMPTY_METRICS,
+    NS_PER_S,
+    BenchmarkClient,
+    prompt_word_count,
+)
+from sagellm_benchmark.types import BenchmarkResult
 
 if TYPE_CHECKING:
-    from sagellm_benchmark.types import BenchmarkRequest, BenchmarkResult
+    from sagellm_benchmark.types import BenchmarkRequest
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +81,7 @@ class LMDeployClient(BenchmarkClient):
                     f"Install with: {_INSTALL_HINT}"
                 )
             self.client = httpx.AsyncClient(base_url=base_url, timeout=timeout)
-            logger.info(f"LMDeploy client (server mode): {base_url}")
+            logger.info("LMDeploy client (server mode): %s", base_url)
 
         elif mode == "local":
             # Use LMDeploy pipeline for local mode
@@ -91,7 +98,7 @@ class LMDeployClient(BenchmarkClient):
 
             self.pipeline = pipeline(model_path, tp=tp)
             self.GenerationConfig = GenerationConfig
-            logger.info(f"LMDeploy client (local mode): {model_path}, tp={tp}")
+            logger.info("LMDeploy client (local mode): %s, tp=%s", model_path, tp)
 
     async def generate(self, request: BenchmarkRequest) -> BenchmarkResult:
         """Execute request via LMDeploy.
@@ -109,11 +116,7 @@ class LMDeployClient(BenchmarkClient):
 
     async def _generate_server(self, request: BenchmarkRequest) -> BenchmarkResult:
         """Execute via LMDeploy server."""
-        from sagellm_benchmark.types import BenchmarkResult
-
-        try:
-            from sagellm_protocol import Metrics
-        except ImportError:
+        if EMPTY_METRICS is None:
             return BenchmarkResult(
                 request_id=request.request_id,
                 success=False,
@@ -121,7 +124,7 @@ class LMDeployClient(BenchmarkClient):
                 metrics=None,
             )
 
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Build LMDeploy API request
@@ -137,30 +140,23 @@ class LMDeployClient(BenchmarkClient):
             response.raise_for_status()
             result = response.json()
 
-            end_time = time.perf_counter()
+            end_ns = time.perf_counter_ns()
 
             # Extract output
             output_text = result.get("text", "")
             output_tokens = result.get("tokens", len(output_text.split()))
 
             # Calculate metrics
-            total_time_s = end_time - start_time
+            total_time_s = (end_ns - start_ns) / NS_PER_S
             tpot_ms = (total_time_s * 1000 / output_tokens) if output_tokens > 0 else 0.0
             throughput_tps = output_tokens / total_time_s if total_time_s > 0 else 0.0
 
-            metrics = Metrics(
-                ttft_ms=0.0,  # Not available from server response
-                tbt_ms=0.0,
-                tpot_ms=tpot_ms,
-                throughput_tps=throughput_tps,
-                peak_mem_mb=0,
-                error_rate=0.0,
-                kv_used_tokens=0,
-                kv_used_bytes=0,
-                prefix_hit_rate=0.0,
-                evict_count=0,
-                evict_ms=0.0,
-                spec_accept_rate=0.0,
+            # TTFT/TBT are not available from server response and stay zero
+            metrics = EMPTY_METRICS.model_copy(
+                update={
+                    "tpot_ms": tpot_ms,
+                    "throughput_tps": throughput_tps,
+                }
             )
 
             return BenchmarkResult(
@@ -170,11 +166,11 @@ class LMDeployClient(BenchmarkClient):
                 metrics=metrics,
                 output_text=output_text,
                 output_tokens=output_tokens,
-                prompt_tokens=len(request.prompt.split()),
+                prompt_tokens=prompt_word_count(request.prompt),
             )
 
         except Exception as e:
-            logger.error(f"LMDeploy server request failed: {e}", exc_info=True)
+            self._log_request_error("LMDeploy server request failed", exc=e)
             return BenchmarkResult(
                 request_id=request.request_id,
                 success=False,
@@ -184,13 +180,7 @@ class LMDeployClient(BenchmarkClient):
 
     async def _generate_local(self, request: BenchmarkRequest) -> BenchmarkResult:
         """Execute via LMDeploy pipeline (local in-process)."""
-        import asyncio
-
-        from sagellm_benchmark.types import BenchmarkResult
-
-        try:
-            from sagellm_protocol import Metrics
-        except ImportError:
+        if EMPTY_METRICS is None:
             return BenchmarkResult(
                 request_id=request.request_id,
                 success=False,
@@ -199,7 +189,7 @@ class LMDeployClient(BenchmarkClient):
             )
 
         try:
-            start_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
 
             # Create generation config
             gen_config = self.GenerationConfig(
@@ -209,13 +199,13 @@ class LMDeployClient(BenchmarkClient):
             )
 
             # Run in thread pool (LMDeploy may be blocking)
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             outputs = await loop.run_in_executor(
                 None,
                 lambda: self.pipeline([request.prompt], gen_config=gen_config),
             )
 
-            end_time = time.perf_counter()
+            end_ns = time.perf_counter_ns()
 
             # Extract output
             output = outputs[0]
@@ -223,23 +213,16 @@ class LMDeployClient(BenchmarkClient):
             output_tokens = len(output_text.split())
 
             # Calculate metrics
-            total_time_s = end_time - start_time
+            total_time_s = (end_ns - start_ns) / NS_PER_S
             tpot_ms = (total_time_s * 1000 / output_tokens) if output_tokens > 0 else 0.0
             throughput_tps = output_tokens / total_time_s if total_time_s > 0 else 0.0
 
-            metrics = Metrics(
-                ttft_ms=0.0,  # Not available in local mode
-                tbt_ms=0.0,
-                tpot_ms=tpot_ms,
-                throughput_tps=throughput_tps,
-                peak_mem_mb=0,
-                error_rate=0.0,
-                kv_used_tokens=0,
-                kv_used_bytes=0,
-                prefix_hit_rate=0.0,
-                evict_count=0,
-                evict_ms=0.0,
-                spec_accept_rate=0.0,
+            # TTFT/TBT are not available in local mode and stay zero
+            metrics = EMPTY_METRICS.model_copy(
+                update={
+                    "tpot_ms": tpot_ms,
+                    "throughput_tps": throughput_tps,
+                }
             )
 
             return BenchmarkResult(
@@ -249,11 +232,11 @@ class LMDeployClient(BenchmarkClient):
                 metrics=metrics,
                 output_text=output_text,
                 output_tokens=output_tokens,
-                prompt_tokens=len(request.prompt.split()),
+                prompt_tokens=prompt_word_count(request.prompt),
             )
 
         except Exception as e:
-            logger.error(f"LMDeploy local request failed: {e}", exc_info=True)
+            self._log_request_error("LMDeploy local request failed", exc=e)
             return BenchmarkResult(
                 request_id=request.request_id,
                 success=False,
@@ -274,7 +257,7 @@ class LMDeployClient(BenchmarkClient):
                 logger.info("LMDeploy server health check OK")
                 return True
             except Exception as e:
-                logger.error(f"LMDeploy server health check failed: {e}")
+                logger.error("LMDeploy server health check failed: %s", e)
                 return False
         else:
             # Local mode: assume healthy if pipeline loaded
@@ -36,6 +36,8 @@ from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
+from sagellm_benchmark import _loop
+
 if TYPE_CHECKING:
     from sagellm_benchmark.clients.base import BenchmarkClient
     from sagellm_benchmark.types import AggregatedMetrics, BenchmarkRequest
@@ -43,6 +45,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on keep-alive connections opened before measurement
+# (matches the openai SDK's default keep-alive pool size).
+_MAX_PRIMED_CONNECTIONS = 100
+
 
 class EngineType(StrEnum):
     """Supported LLM inference backends.
@@ -121,20 +127,39 @@ class MultiEngineRunner:
     Args:
         engines: List of engines to benchmark.
         warmup_requests: Number of warmup requests to discard before measurement.
+        warmup_passes: How many times the warmup requests are replayed. A
+            second pass helps when the first one only absorbs compilation and
+            allocation.
+        warmup_settle_s: Pause after warmup so the server can finish graph
+            capture / JIT work triggered by the warmup requests before
+            measurement starts.
+        prime_connection_pool: Open one keep-alive connection per concurrent
+            request (via ``BenchmarkClient.prime_connections``) before timing
+            starts, so measured TTFTs do not include TCP/TLS setup. Off by
+            default to keep results comparable with earlier runs.
     """
 
     def __init__(
         self,
         engines: list[EngineInfo],
         warmup_requests: int = 0,
+        warmup_passes: int = 1,
+        warmup_settle_s: float = 0.0,
+        prime_connection_pool: bool = False,
     ) -> None:
         if not engines:
             raise ValueError("At least one engine is required")
+        if warmup_passes < 1:
+            raise ValueError("warmup_passes must be >= 1")
         self.engines = engines
         self.warmup_requests = warmup_requests
+        self.warmup_passes = warmup_passes
+        self.warmup_settle_s = warmup_settle_s
+        self.prime_connection_pool = prime_connection_pool
         logger.info(
-            f"MultiEngineRunner initialized with {len(engines)} engine(s): "
-            + ", ".join(e.label for e in engines)
+            "MultiEngineRunner initialized with %d engine(s): %s",
+            len(engines),
+            ", ".join(e.label for e in engines),
         )
 
     async def run_workload(
@@ -171,27 +196,29 @@ class MultiEngineRunner:
         from sagellm_benchmark.metrics.aggregator import MetricsAggregator
 
         label = engine.label
-        logger.info(f"[{label}] Starting benchmark — {len(requests)} request(s)")
+        logger.info("[%s] Starting benchmark — %d request(s)", label, len(requests))
 
         # ---- warmup ----
         warmup_n = getattr(workload, "warmup_rounds", self.warmup_requests)
         if warmup_n > 0 and requests:
-            warmup_reqs = requests[:warmup_n]
-            logger.info(f"[{label}] Warming up with {len(warmup_reqs)} request(s)")
-            try:
-                await engine.client.generate_batch(warmup_reqs, concurrent=False)
-            except Exception as exc:  # noqa: BLE001
-                logger.warning(f"[{label}] Warmup failed (ignored): {exc}")
+            await self._warmup_engine(engine, workload, requests[:warmup_n])
+        if self.prime_connection_pool and requests:
+            await self._prime_engine(engine, workload, len(requests))
 
         # ---- measurement ----
+        # Fresh aggregator per engine, fed as each request completes so the
+        # per-request results need not be retained after the batch.
+        aggregator = MetricsAggregator(n_hint=len(requests))
         t0 = time.perf_counter()
         try:
             concurrent = getattr(workload, "concurrent", False)
-            raw_results = await engine.client.generate_batch(requests, concurrent=concurrent)
+            await engine.client.generate_batch(
+                requests, concurrent=concurrent, on_result=aggregator.update
+            )
         except Exception as exc:  # noqa: BLE001
-            logger.error(f"[{label}] Run failed: {exc}")
+            logger.error("[%s] Run failed: %s", label, exc)
             # Return a zero-metric placeholder so comparison still works
-            metrics = MetricsAggregator.aggregate([])
+            metrics = MetricsAggregator().finalize()
             return EngineRunResult(
                 engine_info=engine,
                 engine_label=label,
@@ -203,18 +230,19 @@ class MultiEngineRunner:
         wall_time = time.perf_counter() - t0
 
         # ---- aggregate ----
-        metrics = MetricsAggregator.aggregate(raw_results)
+        metrics = aggregator.finalize()
         logger.info(
-            f"[{label}] Done — "
-            f"throughput={metrics.output_throughput_tps:.1f} tok/s, "
-            f"p99_ttft={metrics.p99_ttft_ms:.1f} ms, "
-            f"wall={wall_time:.1f}s"
+            "[%s] Done — throughput=%.1f tok/s, p99_ttft=%.1f ms, wall=%.1fs",
+            label,
+            metrics.output_throughput_tps,
+            metrics.p99_ttft_ms,
+            wall_time,
         )
         # Mark as failed if all requests failed
         run_error: str | None = None
         if requests and metrics.error_rate >= 1.0:
             run_error = f"All {metrics.failed_requests} request(s) failed (error_rate=1.0)"
-            logger.error(f"[{label}] {run_error}")
+            logger.error("[%s] %s", label, run_error)
         return EngineRunResult(
             engine_info=engine,
             engine_label=label,
@@ -223,6 +251,51 @@ class MultiEngineRunner:
             wall_time_s=wall_time,
         )
 
+    async def _warmup_engine(
+        self,
+        engine: EngineInfo,
+        workload: WorkloadConfig,
+        warmup_reqs: list[BenchmarkRequest],
+    ) -> None:
+        """Replay warmup requests ``warmup_passes`` times, then optionally settle.
+
+        Warmup requests are taken from the head of the measured request list so
+        they match the real input-length distribution. Their results are
+        discarded; only the measurement batch is aggregated.
+        """
+        label = engine.label
+        concurrent = getattr(workload, "warmup_concurrent", False)
+        logger.info(
+            "[%s] Warming up with %d request(s) x %d pass(es)",
+            label,
+            len(warmup_reqs),
+            self.warmup_passes,
+        )
+        for _ in range(self.warmup_passes):
+            try:
+                await engine.client.generate_batch(warmup_reqs, concurrent=concurrent)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("[%s] Warmup failed (ignored): %s", label, exc)
+                return
+        if self.warmup_settle_s > 0:
+            await asyncio.sleep(self.warmup_settle_s)
+
+    async def _prime_engine(
+        self,
+        engine: EngineInfo,
+        workload: WorkloadConfig,
+        num_requests: int,
+    ) -> None:
+        """Best-effort: open as many keep-alive connections as the run will use."""
+        concurrency = getattr(workload, "concurrency", None)
+        if not concurrency:
+            concurrency = num_requests if getattr(workload, "concurrent", False) else 1
+        count = min(concurrency, _MAX_PRIMED_CONNECTIONS)
+        try:
+            await engine.client.prime_connections(count)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("[%s] Connection priming failed (ignored): %s", engine.label, exc)
+
     def run_workload_sync(
         self,
         workload: WorkloadConfig,
@@ -230,11 +303,27 @@ class MultiEngineRunner:
     ) -> list[EngineRunResult]:
         """Synchronous wrapper around :meth:`run_workload`.
 
+        Runs the workload in a fresh event loop via
+        :func:`sagellm_benchmark._loop.run`, so all engines share one loop
+        (and the connection pools bound to it). Inside an already running
+        loop (Jupyter, async applications) await :meth:`run_workload`
+        directly instead. Set ``SAGELLM_UVLOOP=1`` to run on uvloop.
+
         Args:
             workload: Workload configuration.
             requests: Pre-generated benchmark requests.
 
         Returns:
             List of EngineRunResult.
+
+        Raises:
+            RuntimeError: If called while an event loop is already running.
         """
-        return asyncio.get_event_loop().run_until_complete(self.run_workload(workload, requests))
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return _loop.run(self.run_workload(workload, requests))
+        raise RuntimeError(
+            "run_workload_sync() cannot be called from a running event loop; "
+            "use 'await runner.run_workload(...)' instead"
+        )
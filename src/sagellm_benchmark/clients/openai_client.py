@@ -12,25 +12,61 @@ Note: This is NOT OpenAI-specific. It's a generic client for
 OpenAI-protocol APIs. For sageLLM benchmarks, use this to
 connect to sagellm-gateway.
 
-Uses the official openai Python SDK.
+Uses the official openai Python SDK; ``raw_sse=True`` streams chat
+completions through httpx and parses the SSE lines directly instead.
 """
 
 from __future__ import annotations
 
+import array
 import asyncio
+import json
 import logging
 import os
 import time
 from pathlib import Path
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any
 
-from sagellm_benchmark.clients.base import BenchmarkClient
+import numpy as np
+
+from sagellm_benchmark.clients.base import (
+    EMPTY_METRICS,
+    NS_PER_MS,
+    NS_PER_S,
+    BenchmarkClient,
+    prompt_word_count,
+)
+from sagellm_benchmark.clients.coalescing import RequestCoalescer, sampling_key
+from sagellm_benchmark.types import BenchmarkResult
 
 if TYPE_CHECKING:
-    from sagellm_benchmark.types import BenchmarkRequest, BenchmarkResult
+    from collections.abc import AsyncIterator
+
+    from sagellm_benchmark.types import BenchmarkRequest
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+
+def _inter_token_latencies_ms(token_ns: array.array) -> array.array:
+    """Turn per-chunk ``perf_counter_ns()`` readings into inter-token latencies (ms).
+
+    The streaming loop only appends raw readings; the differences and unit
+    conversion run once here as a single numpy pass.
+    """
+    itl_ms = array.array("d")
+    if len(token_ns) > 1:
+        diffs = np.diff(np.frombuffer(token_ns, dtype=np.int64)) / NS_PER_MS
+        itl_ms.frombytes(diffs.tobytes())
+    return itl_ms
+
 
 class GatewayClient(BenchmarkClient):
     """Client for OpenAI-protocol HTTP APIs (sagellm-gateway, etc.).
@@ -42,6 +78,12 @@ class GatewayClient(BenchmarkClient):
         base_url: API base URL (e.g., http://localhost:8000/v1).
         api_key: API key (default: "sagellm-benchmark").
         client: OpenAI async client instance.
+        collect_itl: Whether per-chunk inter-token latencies are recorded.
+        probe_ttl_s: How long successful health/model probes are cached.
+        coalesce_window_ms: Micro-batching window (0 disables coalescing).
+        raw_sse: Whether chat completions are streamed via httpx instead of the SDK.
+        max_connections: Size of the explicit request connection pool (None = SDK default).
+        token_metrics: Whether requests stream to measure TTFT/TBT (False = throughput only).
     """
 
     def __init__(
@@ -49,6 +91,13 @@ class GatewayClient(BenchmarkClient):
         base_url: str = "http://localhost:8000/v1",
         api_key: str = "sagellm-benchmark",
         timeout: float = 60.0,
+        collect_itl: bool = False,
+        probe_ttl_s: float = 30.0,
+        coalesce_window_ms: float = 0.0,
+        max_batch_size: int = 16,
+        raw_sse: bool = False,
+        max_connections: int | None = None,
+        token_metrics: bool = True,
     ) -> None:
         """Initialize Gateway client.
 
@@ -56,6 +105,32 @@ class GatewayClient(BenchmarkClient):
             base_url: API base URL.
             api_key: API key.
             timeout: Request timeout (seconds).
+            collect_itl: Timestamp every streamed chunk and return the
+                inter-token latencies in ``BenchmarkResult.itl_list`` so the
+                aggregator can report ITL percentiles. Off by default to keep
+                the streaming loop to a single clock read per request.
+            probe_ttl_s: Seconds a successful ``health_check``/``discover_model``
+                result is reused before the server is probed again. Failed
+                probes are never cached so readiness polling keeps working.
+            coalesce_window_ms: When > 0, concurrent requests sharing model and
+                sampling parameters are collected for up to this many
+                milliseconds and sent as one multi-prompt ``/v1/completions``
+                call. TTFT then includes the wait for the batch to fill.
+            max_batch_size: Maximum number of prompts per coalesced call.
+            raw_sse: POST to ``{base_url}/chat/completions`` with httpx and parse
+                the ``data:`` lines directly (orjson when installed) instead
+                of building SDK chunk objects for every token. Falls back to
+                the SDK path when httpx is unavailable; disable it for servers
+                whose deltas do not follow the OpenAI schema.
+            max_connections: When set, requests go through one explicit httpx
+                pool of this size in which every connection is kept alive,
+                shared by the SDK and raw SSE paths. None keeps the SDK's
+                default pool.
+            token_metrics: When False, chat completions are requested with
+                ``stream=False`` and measured end to end: one response parse
+                per request instead of one per chunk, with TTFT/TBT reported
+                as zero. Use for throughput-only runs. Coalesced batches are
+                unaffected.
 
         Raises:
             ImportError: If openai package not installed.
@@ -72,126 +147,366 @@ class GatewayClient(BenchmarkClient):
 
         self.base_url = base_url
         self.api_key = api_key
-        self.client = AsyncOpenAI(base_url=base_url, api_key=api_key)
+        self.collect_itl = collect_itl
+        self.probe_ttl_s = probe_ttl_s
+        self.max_connections = max_connections
+        self.token_metrics = token_metrics
+        # Streaming httpx client for raw SSE mode; the explicit pool when one
+        # is configured, otherwise created on first use
+        self._stream_client: Any | None = None
+        if max_connections is not None:
+            self._stream_client = self._create_request_pool(max_connections)
+        self.client = AsyncOpenAI(
+            base_url=base_url, api_key=api_key, http_client=self._stream_client
+        )
+        self._auth_headers = {"Authorization": f"Bearer {api_key}"}
+        # Request-independent chat completion kwargs, copied per request
+        self._base_api_kwargs: dict[str, Any] = {
+            "stream": True,  # Always stream for metrics collection
+            # Ask the server for exact token counts in the final chunk
+            "stream_options": {"include_usage": True},
+        }
         self._tokenizer_cache: dict[str, Any | None] = {}
+        # (monotonic timestamp, value) of the last successful probe
+        self._health_cache: tuple[float, bool] | None = None
+        self._model_cache: tuple[float, str] | None = None
+        # Keep-alive httpx client shared by all probes, created on first use
+        self._probe_client: Any | None = None
+        self.raw_sse = raw_sse
+        self.coalesce_window_ms = coalesce_window_ms
+        self._coalescer: RequestCoalescer[BenchmarkRequest, BenchmarkResult] | None = None
+        if coalesce_window_ms > 0:
+            self._coalescer = RequestCoalescer(
+                dispatch=self._generate_many,
+                window_ms=coalesce_window_ms,
+                max_batch_size=max_batch_size,
+                key=sampling_key,
+            )
 
-        logger.info(f"OpenAI client initialized: base_url={base_url}")
+        logger.info("OpenAI client initialized: base_url=%s", base_url)
 
     async def generate(self, request: BenchmarkRequest) -> BenchmarkResult:
         """Execute request via OpenAI API.
 
+        When request coalescing is enabled the request is queued and sent
+        together with concurrent compatible requests.
+
         Args:
             request: Benchmark request.
 
         Returns:
             Benchmark result with metrics.
         """
-        from sagellm_benchmark.types import BenchmarkResult
+        if self._coalescer is not None:
+            return await self._coalescer.submit(request)
+        if not self.token_metrics:
+            return await self._generate_unstreamed(request)
+        return await self._generate_single(request)
+
+    async def _generate_single(self, request: BenchmarkRequest) -> BenchmarkResult:
+        """Stream one chat completion and measure it."""
+        start_ns = time.perf_counter_ns()
+        first_token_ns = None
+        streamed_chunks = 0
+        collect_itl = self.collect_itl
+        # Raw int64 chunk timestamps (8 bytes/entry); converted to ITL after the stream.
+        token_ns = array.array("q")
 
         try:
-            from sagellm_protocol import Metrics
-        except ImportError:
-            logger.error("sagellm_protocol not installed")
+            # Build API request
+            api_kwargs = self._base_api_kwargs.copy()
+            api_kwargs["model"] = request.model
+            api_kwargs["messages"] = [{"role": "user", "content": request.prompt}]
+            api_kwargs["max_tokens"] = request.max_tokens
+            if request.temperature is not None:
+                api_kwargs["temperature"] = request.temperature
+            if request.top_p is not None:
+                api_kwargs["top_p"] = request.top_p
+
+            # Execute streaming request
+            stream_client = self._get_stream_client() if self.raw_sse else None
+            if stream_client is not None:
+                chunks = self._iter_raw_sse(stream_client, api_kwargs)
+            else:
+                chunks = self._iter_sdk_chunks(api_kwargs)
+
+            output_chunks: list[str] = []
+            usage = None
+            async for content, chunk_usage in chunks:
+                if chunk_usage is not None:
+                    usage = chunk_usage
+
+                if content:
+                    output_chunks.append(content)
+                    streamed_chunks += 1
+
+                    # Only the first token needs a timestamp: TBT is derived from
+                    # end_ns and the real output token count below.
+                    if first_token_ns is None:
+                        first_token_ns = time.perf_counter_ns()
+                        token_ns.append(first_token_ns)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "TTFT for %s: %.2fms",
+                                request.request_id,
+                                (first_token_ns - start_ns) / NS_PER_MS,
+                            )
+                    elif collect_itl:
+                        token_ns.append(time.perf_counter_ns())
+
+            end_ns = time.perf_counter_ns()
+
+            return self._build_result(
+                request,
+                start_ns=start_ns,
+                first_token_ns=first_token_ns,
+                end_ns=end_ns,
+                output_text="".join(output_chunks),
+                streamed_chunks=streamed_chunks,
+                usage=usage,
+                itl_ms=_inter_token_latencies_ms(token_ns),
+            )
+
+        except Exception as e:
+            self._log_request_error("OpenAI request %s failed", request.request_id, exc=e)
             return BenchmarkResult(
                 request_id=request.request_id,
                 success=False,
-                error="sagellm_protocol not installed",
+                error=str(e),
                 metrics=None,
             )
 
-        start_time = time.perf_counter()
-        first_token_time = None
-        streamed_chunks = 0
-
+    async def _generate_unstreamed(self, request: BenchmarkRequest) -> BenchmarkResult:
+        """Send one non-streaming chat completion and measure it end to end."""
+        start_ns = time.perf_counter_ns()
         try:
-            # Build API request
             api_kwargs: dict[str, Any] = {
                 "model": request.model,
                 "messages": [{"role": "user", "content": request.prompt}],
                 "max_tokens": request.max_tokens,
-                "stream": True,  # Always stream for metrics collection
+                "stream": False,
             }
-
             if request.temperature is not None:
                 api_kwargs["temperature"] = request.temperature
             if request.top_p is not None:
                 api_kwargs["top_p"] = request.top_p
 
-            # Execute streaming request
-            output_text = ""
-            async for chunk in await self.client.chat.completions.create(**api_kwargs):
-                current_time = time.perf_counter()
-
-                if chunk.choices and chunk.choices[0].delta.content:
-                    content = chunk.choices[0].delta.content
-                    output_text += content
-                    streamed_chunks += 1
-
-                    if first_token_time is None:
-                        first_token_time = current_time
-                        logger.debug(
-                            f"TTFT for {request.request_id}: "
-                            f"{(first_token_time - start_time) * 1000:.2f}ms"
-                        )
-
-            end_time = time.perf_counter()
-
-            # Calculate metrics
-            total_time_s = end_time - start_time
-            ttft_ms = (first_token_time - start_time) * 1000 if first_token_time else 0.0
-            output_tokens = self._count_text_tokens(output_text, request.model) or streamed_chunks
-            prompt_tokens = self._count_text_tokens(request.prompt, request.model)
-            if prompt_tokens <= 0:
-                prompt_tokens = len(request.prompt.split())
-
-            # Calculate TBT using real output token count when available.
-            if first_token_time is not None and output_tokens > 1:
-                tbt_ms = ((end_time - first_token_time) * 1000) / (output_tokens - 1)
-            else:
-                tbt_ms = 0.0
-
-            # TPOT (time per output token)
-            tpot_ms = (total_time_s * 1000 / output_tokens) if output_tokens > 0 else 0.0
-
-            # Throughput
-            throughput_tps = output_tokens / total_time_s if total_time_s > 0 else 0.0
-
-            # Create metrics (OpenAI API doesn't provide all metrics)
-            metrics = Metrics(
-                ttft_ms=ttft_ms,
-                tbt_ms=tbt_ms,
-                tpot_ms=tpot_ms,
-                throughput_tps=throughput_tps,
-                peak_mem_mb=0,
-                error_rate=0.0,
-                # Unavailable from OpenAI API
-                kv_used_tokens=0,
-                kv_used_bytes=0,
-                prefix_hit_rate=0.0,
-                evict_count=0,
-                evict_ms=0.0,
-                spec_accept_rate=0.0,
-            )
-
+            completion = await self.client.chat.completions.create(**api_kwargs)
+            end_ns = time.perf_counter_ns()
+        except Exception as e:
+            self._log_request_error("OpenAI request %s failed", request.request_id, exc=e)
             return BenchmarkResult(
                 request_id=request.request_id,
-                success=True,
-                error=None,
-                metrics=metrics,
-                output_text=output_text,
-                output_tokens=output_tokens,
-                prompt_tokens=prompt_tokens,
+                success=False,
+                error=str(e),
+                metrics=None,
             )
 
+        choices = completion.choices
+        output_text = (choices[0].message.content if choices else None) or ""
+        return self._build_result(
+            request,
+            start_ns=start_ns,
+            first_token_ns=None,
+            end_ns=end_ns,
+            output_text=output_text,
+            # Last-resort token estimate when neither usage nor a tokenizer is available
+            streamed_chunks=prompt_word_count(output_text),
+            usage=getattr(completion, "usage", None),
+            itl_ms=array.array("d"),
+        )
+
+    async def _iter_sdk_chunks(self, api_kwargs: dict[str, Any]) -> AsyncIterator[tuple[Any, Any]]:
+        """Yield ``(delta content, usage)`` pairs from the openai SDK stream."""
+        async for chunk in await self.client.chat.completions.create(**api_kwargs):
+            choices = chunk.choices
+            yield (choices[0].delta.content if choices else None), getattr(chunk, "usage", None)
+
+    async def _iter_raw_sse(
+        self, http: Any, api_kwargs: dict[str, Any]
+    ) -> AsyncIterator[tuple[Any, Any]]:
+        """Yield ``(delta content, usage)`` pairs parsed straight from the SSE stream.
+
+        Usage payloads are wrapped in a ``SimpleNamespace`` so ``_build_result``
+        reads them exactly like SDK usage objects.
+
+        Raises:
+            RuntimeError: If the server sends an ``error`` event mid-stream.
+        """
+        url = f"{self.base_url.rstrip('/')}/chat/completions"
+        async with http.stream(
+            "POST", url, json=api_kwargs, headers=self._auth_headers
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                payload = _json_loads(data)
+                error = payload.get("error")
+                if error:
+                    # The SDK raises APIError on in-stream error events; match it
+                    # so the request is reported as failed, not truncated.
+                    message = error.get("message") if isinstance(error, dict) else None
+                    raise RuntimeError(message or f"Server error in stream: {error}")
+                raw_usage = payload.get("usage")
+                usage = SimpleNamespace(**raw_usage) if raw_usage else None
+                choices = payload.get("choices")
+                content = choices[0].get("delta", {}).get("content") if choices else None
+                yield (content if isinstance(content, str) else None), usage
+
+    async def _generate_many(
+        self, requests: list[BenchmarkRequest], submitted_ns: list[int]
+    ) -> list[BenchmarkResult]:
+        """Stream several prompts through one multi-prompt ``/v1/completions`` call.
+
+        All requests must share model and sampling parameters (guaranteed by the
+        coalescer key). Chunks are routed back to their request via
+        ``choice.index``. The completions endpoint does not apply the chat
+        template, and usage is only reported for the whole batch, so token
+        counts come from the tokenizer fallback.
+
+        Each request's TTFT and e2e latency are measured from its own submit
+        time in ``submitted_ns``, so they include the coalescing wait.
+        """
+        n = len(requests)
+        head = requests[0]
+        collect_itl = self.collect_itl
+        output_chunks: list[list[str]] = [[] for _ in range(n)]
+        streamed_chunks = [0] * n
+        first_token_ns: list[int | None] = [None] * n
+        end_ns: list[int | None] = [None] * n
+        token_ns = [array.array("q") for _ in range(n)]
+
+        try:
+            api_kwargs: dict[str, Any] = {
+                "model": head.model,
+                "prompt": [request.prompt for request in requests],
+                "max_tokens": head.max_tokens,
+                "stream": True,
+            }
+            if head.temperature is not None:
+                api_kwargs["temperature"] = head.temperature
+            if head.top_p is not None:
+                api_kwargs["top_p"] = head.top_p
+
+            async for chunk in await self.client.completions.create(**api_kwargs):
+                for choice in chunk.choices:
+                    index = choice.index
+                    if choice.text:
+                        output_chunks[index].append(choice.text)
+                        streamed_chunks[index] += 1
+                        if first_token_ns[index] is None:
+                            first_token_ns[index] = time.perf_counter_ns()
+                            token_ns[index].append(first_token_ns[index])
+                        elif collect_itl:
+                            token_ns[index].append(time.perf_counter_ns())
+                    if choice.finish_reason is not None:
+                        end_ns[index] = time.perf_counter_ns()
+
+            batch_end_ns = time.perf_counter_ns()
+
         except Exception as e:
-            logger.error(f"OpenAI request {request.request_id} failed: {e}", exc_info=True)
+            self._log_request_error("Coalesced OpenAI request batch of %d failed", n, exc=e)
+            return [
+                BenchmarkResult(
+                    request_id=request.request_id,
+                    success=False,
+                    error=str(e),
+                    metrics=None,
+                )
+                for request in requests
+            ]
+
+        return [
+            self._build_result(
+                request,
+                start_ns=submitted_ns[i],
+                first_token_ns=first_token_ns[i],
+                end_ns=end_ns[i] or batch_end_ns,
+                output_text="".join(output_chunks[i]),
+                streamed_chunks=streamed_chunks[i],
+                usage=None,
+                itl_ms=_inter_token_latencies_ms(token_ns[i]),
+            )
+            for i, request in enumerate(requests)
+        ]
+
+    def _build_result(
+        self,
+        request: BenchmarkRequest,
+        *,
+        start_ns: int,
+        first_token_ns: int | None,
+        end_ns: int,
+        output_text: str,
+        streamed_chunks: int,
+        usage: Any | None,
+        itl_ms: array.array,
+    ) -> BenchmarkResult:
+        """Turn the timings of one streamed response into a BenchmarkResult.
+
+        Timestamps are ``time.perf_counter_ns()`` readings.
+        """
+        if EMPTY_METRICS is None:
+            logger.error("sagellm_protocol not installed")
             return BenchmarkResult(
                 request_id=request.request_id,
                 success=False,
-                error=str(e),
+                error="sagellm_protocol not installed",
                 metrics=None,
             )
 
+        # Calculate metrics
+        total_time_s = (end_ns - start_ns) / NS_PER_S
+        ttft_ms = (first_token_ns - start_ns) / NS_PER_MS if first_token_ns is not None else 0.0
+        # Prefer server-reported usage; tokenize locally only when it is missing.
+        output_tokens = getattr(usage, "completion_tokens", None) or (
+            self._count_text_tokens(output_text, request.model) or streamed_chunks
+        )
+        prompt_tokens = getattr(usage, "prompt_tokens", None) or self._count_text_tokens(
+            request.prompt, request.model
+        )
+        if prompt_tokens <= 0:
+            prompt_tokens = prompt_word_count(request.prompt)
+
+        # Calculate TBT using real output token count when available.
+        if first_token_ns is not None and output_tokens > 1:
+            tbt_ms = (end_ns - first_token_ns) / NS_PER_MS / (output_tokens - 1)
+        else:
+            tbt_ms = 0.0
+
+        # TPOT (time per output token)
+        tpot_ms = (total_time_s * 1000 / output_tokens) if output_tokens > 0 else 0.0
+
+        # Throughput
+        throughput_tps = output_tokens / total_time_s if total_time_s > 0 else 0.0
+
+        # Create metrics (OpenAI API doesn't provide all metrics)
+        # Memory / KV cache / speculative fields are unavailable and stay zero.
+        metrics = EMPTY_METRICS.model_copy(
+            update={
+                "ttft_ms": ttft_ms,
+                "tbt_ms": tbt_ms,
+                "tpot_ms": tpot_ms,
+                "throughput_tps": throughput_tps,
+            }
+        )
+
+        return BenchmarkResult(
+            request_id=request.request_id,
+            success=True,
+            error=None,
+            metrics=metrics,
+            output_text=output_text,
+            output_tokens=output_tokens,
+            prompt_tokens=prompt_tokens,
+            itl_list=itl_ms,
+            e2e_latency_ms=(end_ns - start_ns) / NS_PER_MS,
+        )
+
     def _count_text_tokens(self, text: str, model_id: str) -> int:
         """Count real tokenizer tokens for benchmark accounting when tokenizer is available."""
         if not text:
@@ -287,60 +602,103 @@ class GatewayClient(BenchmarkClient):
         1. GET /health  (sagellm-core engine_server)
         2. GET /v1/models  (standard OpenAI-compatible, e.g. vLLM)
 
+        A successful result is reused for ``probe_ttl_s`` seconds.
+
         Args:
             timeout: Connection timeout in seconds.
 
         Returns:
             True if the server is reachable and ready.
         """
+        if self._probe_cache_valid(self._health_cache):
+            return True
+
+        healthy = await self._probe_health(timeout)
+        if healthy:
+            self._health_cache = (time.monotonic(), True)
+        return healthy
+
+    async def _probe_health(self, timeout: float) -> bool:
+        """Probe the server health endpoints without consulting the cache."""
         base = self.base_url.rstrip("/")
         # Strip /v1 suffix to get server root
         root = base[:-3] if base.endswith("/v1") else base
 
-        try:
-            import httpx
-        except ImportError:
+        http = self._get_probe_client()
+        if http is None:
             # Fall back to OpenAI SDK /v1/models probe
             return await self._health_check_openai_sdk()
 
         # 1. Try /health first (sagellm engine_server style)
         try:
-            async with httpx.AsyncClient(timeout=timeout) as http:
-                r = await http.get(f"{root}/health")
+            r = await http.get(f"{root}/health", timeout=timeout)
             if r.status_code < 500:
-                logger.info(f"Health check OK via /health (HTTP {r.status_code})")
+                logger.info("Health check OK via /health (HTTP %s)", r.status_code)
                 return True
         except Exception as e:
-            logger.debug(f"/health probe failed: {e}")
+            logger.debug("/health probe failed: %s", e)
 
         # 2. Try /v1/models (standard OpenAI-compatible)
         try:
-            async with httpx.AsyncClient(timeout=timeout) as http:
-                r = await http.get(f"{base}/models")
+            r = await http.get(f"{base}/models", timeout=timeout)
             if r.status_code < 500:
-                logger.info(f"Health check OK via /v1/models (HTTP {r.status_code})")
+                logger.info("Health check OK via /v1/models (HTTP %s)", r.status_code)
                 return True
         except Exception as e:
-            logger.debug(f"/v1/models probe failed: {e}")
+            logger.debug("/v1/models probe failed: %s", e)
 
         logger.error("All health check probes failed — server may not be ready")
         return False
 
+    async def prime_connections(self, count: int) -> int:
+        """Fill the request connection pool with ``count`` keep-alive sockets.
+
+        Fires ``count`` concurrent lightweight GETs over the same transport
+        that ``generate()`` uses: ``/health`` on the raw SSE client, or
+        ``/v1/models`` through the SDK otherwise. Failures are ignored.
+
+        Args:
+            count: Number of concurrent priming requests.
+
+        Returns:
+            Number of priming requests that succeeded.
+        """
+        if count <= 0:
+            return 0
+
+        stream_client = self._get_stream_client() if self.raw_sse else None
+        if stream_client is not None:
+            base = self.base_url.rstrip("/")
+            root = base[:-3] if base.endswith("/v1") else base
+            url = f"{root}/health"
+            outcomes = await asyncio.gather(
+                *(stream_client.get(url) for _ in range(count)), return_exceptions=True
+            )
+        else:
+            outcomes = await asyncio.gather(
+                *(self.client.models.list() for _ in range(count)), return_exceptions=True
+            )
+
+        primed = sum(1 for outcome in outcomes if not isinstance(outcome, BaseException))
+        logger.debug("Primed %d/%d keep-alive connection(s)", primed, count)
+        return primed
+
     async def _health_check_openai_sdk(self) -> bool:
         """Fallback health check using the OpenAI SDK models.list()."""
         try:
             models = await asyncio.wait_for(self.client.models.list(), timeout=10.0)
-            logger.info(f"Health check OK ({len(list(models.data))} models available)")
+            logger.info("Health check OK (%d models available)", len(list(models.data)))
             return True
         except Exception as e:
-            logger.error(f"SDK health check failed: {e}")
+            logger.error("SDK health check failed: %s", e)
             return False
 
     async def discover_model(self, timeout: float = 5.0) -> str | None:
         """Discover the model name loaded by the server.
 
         Queries /info (sagellm engine_server) or /v1/models.
-        Returns the first model name found, or None.
+        Returns the first model name found, or None. A discovered name is
+        reused for ``probe_ttl_s`` seconds.
 
         Args:
             timeout: Connection timeout in seconds.
@@ -348,45 +706,102 @@ class GatewayClient(BenchmarkClient):
         Returns:
             Model name string, or None if undetectable.
         """
+        if self._probe_cache_valid(self._model_cache):
+            return self._model_cache[1]
+
+        model = await self._probe_model(timeout)
+        if model is not None:
+            self._model_cache = (time.monotonic(), model)
+        return model
+
+    async def _probe_model(self, timeout: float) -> str | None:
+        """Probe the server model endpoints without consulting the cache."""
         base = self.base_url.rstrip("/")
         root = base[:-3] if base.endswith("/v1") else base
 
-        try:
-            import httpx
-        except ImportError:
+        http = self._get_probe_client()
+        if http is None:
             return None
 
         # Try /info first (sagellm engine_server exposes model_path here)
         try:
-            async with httpx.AsyncClient(timeout=timeout) as http:
-                r = await http.get(f"{root}/info")
+            r = await http.get(f"{root}/info", timeout=timeout)
             if r.status_code == 200:
                 data = r.json()
                 model = data.get("model_path") or data.get("model") or data.get("model_name")
                 if model:
-                    logger.info(f"Discovered model from /info: {model}")
+                    logger.info("Discovered model from /info: %s", model)
                     return str(model)
         except Exception as e:
-            logger.debug(f"/info probe failed: {e}")
+            logger.debug("/info probe failed: %s", e)
 
         # Try /v1/models
         try:
-            async with httpx.AsyncClient(timeout=timeout) as http:
-                r = await http.get(f"{base}/models")
+            r = await http.get(f"{base}/models", timeout=timeout)
             if r.status_code == 200:
                 data = r.json()
                 models = data.get("data", [])
                 if models:
                     model = models[0].get("id")
                     if model:
-                        logger.info(f"Discovered model from /v1/models: {model}")
+                        logger.info("Discovered model from /v1/models: %s", model)
                         return str(model)
         except Exception as e:
-            logger.debug(f"/v1/models model discovery failed: {e}")
+            logger.debug("/v1/models model discovery failed: %s", e)
 
         return None
 
+    def _get_probe_client(self) -> Any | None:
+        """Return the shared keep-alive httpx client for probes, or None without httpx."""
+        if self._probe_client is None:
+            try:
+                import httpx
+            except ImportError:
+                return None
+            self._probe_client = httpx.AsyncClient(
+                timeout=5.0,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return self._probe_client
+
+    def _get_stream_client(self) -> Any | None:
+        """Return the httpx client used for raw SSE streaming, or None without httpx."""
+        if self._stream_client is None:
+            try:
+                import httpx
+            except ImportError:
+                return None
+            self._stream_client = httpx.AsyncClient(timeout=self.timeout)
+        return self._stream_client
+
+    def _create_request_pool(self, max_connections: int) -> Any:
+        """Build the explicit request connection pool.
+
+        Every connection stays in the keep-alive pool: benchmark traffic comes
+        in waves of the same concurrency, so each socket is reused by the next
+        wave (and by connections opened in ``prime_connections``).
+        """
+        import httpx
+
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=httpx.Timeout(self.timeout, connect=5.0),
+        )
+
+    def _probe_cache_valid(self, cache: tuple[float, Any] | None) -> bool:
+        """Return True if a cached probe result is still within ``probe_ttl_s``."""
+        return cache is not None and time.monotonic() - cache[0] < self.probe_ttl_s
+
     async def close(self) -> None:
-        """Close HTTP client."""
+        """Close HTTP clients."""
+        if self._probe_client is not None:
+            await self._probe_client.aclose()
+            self._probe_client = None
+        if self._stream_client is not None:
+            await self._stream_client.aclose()
+            self._stream_client = None
         await self.client.close()
         logger.info("OpenAI client closed")
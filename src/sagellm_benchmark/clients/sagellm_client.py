@@ -5,6 +5,10 @@ This client directly uses sagellm-core's LLMEngine:
 - BaseEngine (legacy, still supported)
 
 Provides the most complete metrics since it's the native engine.
+
+The engine runs on the caller's event loop; with uvloop installed,
+``SAGELLM_UVLOOP=1`` makes the benchmark entry points use it (see
+``sagellm_benchmark._loop.run``).
 """
 
 from __future__ import annotations
@@ -12,10 +16,16 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from sagellm_benchmark.clients.base import BenchmarkClient
+from sagellm_benchmark.clients.base import EMPTY_METRICS, BenchmarkClient, prompt_word_count
+from sagellm_benchmark.types import BenchmarkResult
+
+try:
+    from sagellm_protocol import Request
+except ImportError:  # pragma: no cover - sagellm_protocol is a core dependency
+    Request = None
 
 if TYPE_CHECKING:
-    from sagellm_benchmark.types import BenchmarkRequest, BenchmarkResult
+    from sagellm_benchmark.types import BenchmarkRequest
 
 logger = logging.getLogger(__name__)
 
@@ -56,12 +66,14 @@ class SageLLMClient(BenchmarkClient):
         if isinstance(engine, LLMEngine):
             self.engine_type = "llm_engine"
             self.is_legacy = False
+            # Engine call bound once so generate() does not branch per request
+            self._call_engine = self._generate_via_llm_engine
         else:
             raise TypeError(f"Expected LLMEngine, got {type(engine)}")
 
         self.engine = engine
 
-        logger.info(f"SageLLM client initialized: engine_type={self.engine_type}")
+        logger.info("SageLLM client initialized: engine_type=%s", self.engine_type)
 
     async def generate(self, request: BenchmarkRequest) -> BenchmarkResult:
         """Execute request via sagellm engine.
@@ -72,11 +84,7 @@ class SageLLMClient(BenchmarkClient):
         Returns:
             Benchmark result with complete metrics.
         """
-        from sagellm_benchmark.types import BenchmarkResult
-
-        try:
-            from sagellm_protocol import Metrics, Request
-        except ImportError:
+        if Request is None:
             logger.error("sagellm_protocol not installed")
             return BenchmarkResult(
                 request_id=request.request_id,
@@ -98,65 +106,35 @@ class SageLLMClient(BenchmarkClient):
                 stream=request.stream,
             )
 
-            # Execute via engine (adapt to engine type)
-            if self.is_legacy:
-                # BaseEngine has execute() method
-                response = await self.engine.execute(protocol_request)
-            else:
-                # LLMEngine has generate() method
-                response = await self.engine.generate(
-                    prompt=protocol_request.prompt,
-                    max_tokens=protocol_request.max_tokens,
-                    temperature=protocol_request.temperature,
-                    top_p=protocol_request.top_p,
-                    request_id=protocol_request.request_id,
-                    trace_id=protocol_request.trace_id,
-                )
+            # Execute via engine (call chosen for the engine type in __init__)
+            response = await self._call_engine(protocol_request)
 
-            # Extract metrics from response
-            if hasattr(response, "metrics") and response.metrics:
-                metrics = response.metrics
-            else:
+            # Extract metrics from response (single getattr per field; hasattr
+            # would fetch each attribute twice)
+            metrics = getattr(response, "metrics", None)
+            if not metrics:
                 # Fallback: create basic metrics
-                logger.warning(f"No metrics in response for {request.request_id}")
-                metrics = Metrics(
-                    ttft_ms=0.0,
-                    tbt_ms=0.0,
-                    tpot_ms=0.0,
-                    throughput_tps=0.0,
-                    peak_mem_mb=0,
-                    error_rate=0.0,
-                    kv_used_tokens=0,
-                    kv_used_bytes=0,
-                    prefix_hit_rate=0.0,
-                    evict_count=0,
-                    evict_ms=0.0,
-                    spec_accept_rate=0.0,
-                )
+                logger.warning("No metrics in response for %s", request.request_id)
+                metrics = EMPTY_METRICS.model_copy()
 
             # metrics.timestamps 由 llm_engine 直接填充，无需从 response.timestamps 手动注入
 
             # Extract output (adapt field names)
-            output_text = ""
-            if hasattr(response, "output_text"):
-                output_text = response.output_text
-            elif hasattr(response, "text"):
-                output_text = response.text
+            output_text = getattr(response, "output_text", None)
+            if output_text is None:
+                output_text = getattr(response, "text", "")
 
             output_tokens_count = 0
-            if hasattr(response, "output_tokens") and response.output_tokens:
+            output_tokens = getattr(response, "output_tokens", None)
+            if output_tokens:
                 output_tokens_count = (
-                    len(response.output_tokens)
-                    if isinstance(response.output_tokens, list)
-                    else response.output_tokens
+                    len(output_tokens) if isinstance(output_tokens, list) else output_tokens
                 )
 
             # 优先从 response.prompt_tokens 获取，若为 None 则用 request.prompt 词数估算
-            prompt_tokens = 0
-            if hasattr(response, "prompt_tokens") and response.prompt_tokens is not None:
-                prompt_tokens = response.prompt_tokens
-            elif request.prompt:
-                prompt_tokens = len(request.prompt.split())
+            prompt_tokens = getattr(response, "prompt_tokens", None)
+            if prompt_tokens is None:
+                prompt_tokens = prompt_word_count(request.prompt) if request.prompt else 0
 
             # 从 metrics.timestamps 计算 e2e 延迟（ms）
             e2e_latency_ms = 0.0
@@ -177,7 +155,7 @@ class SageLLMClient(BenchmarkClient):
             )
 
         except Exception as e:
-            logger.error(f"SageLLM engine request failed: {e}", exc_info=True)
+            self._log_request_error("SageLLM engine request failed", exc=e)
             return BenchmarkResult(
                 request_id=request.request_id,
                 success=False,
@@ -185,6 +163,17 @@ class SageLLMClient(BenchmarkClient):
                 metrics=None,
             )
 
+    async def _generate_via_llm_engine(self, protocol_request: Any) -> Any:
+        """LLMEngine exposes generate() with keyword sampling arguments."""
+        return await self.engine.generate(
+            prompt=protocol_request.prompt,
+            max_tokens=protocol_request.max_tokens,
+            temperature=protocol_request.temperature,
+            top_p=protocol_request.top_p,
+            request_id=protocol_request.request_id,
+            trace_id=protocol_request.trace_id,
+        )
+
     async def health_check(self) -> bool:
         """Check if engine is healthy.
 
@@ -193,10 +182,10 @@ class SageLLMClient(BenchmarkClient):
         """
         try:
             is_healthy = self.engine.is_running if hasattr(self.engine, "is_running") else True
-            logger.info(f"SageLLM engine health check: {is_healthy}")
+            logger.info("SageLLM engine health check: %s", is_healthy)
             return is_healthy
         except Exception as e:
-            logger.error(f"SageLLM engine health check failed: {e}")
+            logger.error("SageLLM engine health check failed: %s", e)
             return False
 
     async def close(self) -> None:
@@ -12,19 +12,33 @@ Dependency contract:
 - local vLLM integration is declared via benchmark extras in pyproject.toml
 - cross-engine compare should prefer ``sagellm-benchmark compare`` or
     ``GatewayClient`` against endpoints; local mode is a benchmark-side fallback
+
+Server mode timestamps every streamed chunk on the event loop, so loop
+overhead shows up in TTFT/TBT under high concurrency. Installing uvloop and
+setting ``SAGELLM_UVLOOP=1`` runs the benchmark entry points on uvloop
+(see ``sagellm_benchmark._loop.run``).
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from typing import TYPE_CHECKING
-
-from sagellm_benchmark.clients.base import BenchmarkClient
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from sagellm_benchmark.clients.base import (
+    EMPTY_METRICS,
+    NS_PER_S,
+    BenchmarkClient,
+    prompt_word_count,
+)
+from sagellm_benchmark.clients.coalescing import RequestCoalescer
 from sagellm_benchmark.clients.openai_client import GatewayClient
+from sagellm_benchmark.types import BenchmarkResult
 
 if TYPE_CHECKING:
-    from sagellm_benchmark.types import BenchmarkRequest, BenchmarkResult
+    from sagellm_benchmark.types import BenchmarkRequest
 
 logger = logging.getLogger(__name__)
 _LOCAL_MODE_INSTALL_HINT = (
@@ -41,6 +55,8 @@ class VLLMClient(BenchmarkClient):
         base_url: Server URL (server mode only).
         model_path: Model path (local mode only).
         llm: vLLM LLM instance (local mode only).
+        coalesce_window_ms: Micro-batching window (0 disables coalescing).
+        max_in_flight: Cap on concurrently executing requests (None = unbounded).
     """
 
     def __init__(
@@ -51,6 +67,12 @@ class VLLMClient(BenchmarkClient):
         gpu_memory_utilization: float = 0.9,
         api_key: str = "vllm-benchmark",
         timeout: float = 60.0,
+        coalesce_window_ms: float = 0.0,
+        max_batch_size: int = 16,
+        max_connections: int | None = None,
+        token_metrics: bool = True,
+        raw_sse: bool = False,
+        max_in_flight: int | None = None,
     ) -> None:
         """Initialize vLLM client.
 
@@ -61,6 +83,25 @@ class VLLMClient(BenchmarkClient):
             gpu_memory_utilization: GPU memory fraction (local mode).
             api_key: API key used in server mode.
             timeout: Request timeout (seconds).
+            coalesce_window_ms: When > 0, concurrent requests are collected for
+                up to this many milliseconds and executed together: one
+                multi-prompt ``LLM.generate`` call in local mode (with
+                per-prompt sampling parameters), one multi-prompt completions
+                call per model/sampling group in server mode.
+            max_batch_size: Maximum number of prompts per coalesced call.
+            max_connections: Keep-alive connection pool size for server mode
+                (see ``GatewayClient``); None keeps the openai SDK default.
+            token_metrics: Server mode only; False sends non-streaming requests
+                for throughput-only runs (see ``GatewayClient``).
+            raw_sse: Server mode only; stream chat completions through httpx
+                and parse the SSE lines directly instead of building openai
+                SDK chunk objects per token (see ``GatewayClient``). The SDK
+                is still used for health/model probes.
+            max_in_flight: When set, at most this many ``generate()`` calls
+                run at once and the rest wait for a slot, keeping the load
+                below the server's capacity instead of exhausting the
+                connection pool. Queueing time counts toward TTFT, so leave it
+                unset when measuring a fixed offered concurrency.
 
         Raises:
             ImportError: If vLLM not installed.
@@ -70,19 +111,35 @@ class VLLMClient(BenchmarkClient):
 
         if mode not in ("server", "local"):
             raise ValueError(f"Invalid mode: {mode}. Must be 'server' or 'local'.")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
 
         self.mode = mode
         self.base_url = base_url
         self.model_path = model_path
         self.api_key = api_key
+        self.coalesce_window_ms = coalesce_window_ms
+        self._coalescer: RequestCoalescer[BenchmarkRequest, BenchmarkResult] | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self.max_in_flight = max_in_flight
+        # Created lazily per event loop: a semaphore binds to the first loop
+        # that waits on it, and run_workload_sync() starts a new loop per call.
+        self._in_flight_slots: asyncio.Semaphore | None = None
+        self._in_flight_loop: asyncio.AbstractEventLoop | None = None
+        self._in_flight = 0
 
         if mode == "server":
             self.gateway_client = GatewayClient(
                 base_url=base_url,
                 api_key=api_key,
                 timeout=timeout,
+                coalesce_window_ms=coalesce_window_ms,
+                max_batch_size=max_batch_size,
+                max_connections=max_connections,
+                token_metrics=token_metrics,
+                raw_sse=raw_sse,
             )
-            logger.info(f"vLLM client (server mode): {base_url}")
+            logger.info("vLLM client (server mode): %s", base_url)
 
         elif mode == "local":
             # Use vLLM LLM class for local mode
@@ -102,7 +159,22 @@ class VLLMClient(BenchmarkClient):
                 gpu_memory_utilization=gpu_memory_utilization,
             )
             self.SamplingParams = SamplingParams
-            logger.info(f"vLLM client (local mode): {model_path}")
+            # SamplingParams validates on construction and is never mutated by
+            # generate(), so one instance per sampling configuration is reused
+            self._sampling_params_cache: dict[tuple[int, float, float], Any] = {}
+            # LLM.generate blocks until its batch finishes and concurrent calls
+            # only queue on the GPU, so one dedicated worker serializes them
+            # without occupying the loop's default executor.
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vllm-local")
+            if coalesce_window_ms > 0:
+                self._coalescer = RequestCoalescer(
+                    dispatch=self._generate_local_many,
+                    window_ms=coalesce_window_ms,
+                    max_batch_size=max_batch_size,
+                    # One SamplingParams per prompt, so any requests can share a call
+                    key=None,
+                )
+            logger.info("vLLM client (local mode): %s", model_path)
 
     async def generate(self, request: BenchmarkRequest) -> BenchmarkResult:
         """Execute request via vLLM.
@@ -113,89 +185,135 @@ class VLLMClient(BenchmarkClient):
         Returns:
             Benchmark result with metrics.
         """
-        if self.mode == "server":
-            return await self.gateway_client.generate(request)
-        else:
+        if self.max_in_flight is None:
+            return await self._dispatch(request)
+        async with self._slots_for_running_loop():
+            return await self._dispatch(request)
+
+    def _slots_for_running_loop(self) -> asyncio.Semaphore:
+        """Return the ``max_in_flight`` semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._in_flight_slots is None or self._in_flight_loop is not loop:
+            self._in_flight_slots = asyncio.Semaphore(self.max_in_flight)
+            self._in_flight_loop = loop
+        return self._in_flight_slots
+
+    @property
+    def current_in_flight(self) -> int:
+        """Number of requests currently executing (excluding those waiting for a slot)."""
+        return self._in_flight
+
+    async def _dispatch(self, request: BenchmarkRequest) -> BenchmarkResult:
+        """Run one request in the configured mode, tracking the in-flight count."""
+        self._in_flight += 1
+        try:
+            if self.mode == "server":
+                return await self.gateway_client.generate(request)
             return await self._generate_local(request)
+        finally:
+            self._in_flight -= 1
 
     async def _generate_local(self, request: BenchmarkRequest) -> BenchmarkResult:
         """Execute via vLLM LLM class (local in-process)."""
-        import asyncio
+        if self._coalescer is not None:
+            return await self._coalescer.submit(request)
+        return (await self._generate_local_many([request]))[0]
+
+    async def _generate_local_many(
+        self, requests: list[BenchmarkRequest], submitted_ns: list[int] | None = None
+    ) -> list[BenchmarkResult]:
+        """Run several prompts through one ``LLM.generate`` call.
+
+        Each prompt gets its own ``SamplingParams`` (vLLM accepts a list
+        aligned with the prompts), so requests with different sampling
+        settings still share the batch. vLLM batches all prompts of a call into the same forward passes.
+        Per-request timings are not observable from a blocking ``generate``,
+        so each request reports the time from its submit time in
+        ``submitted_ns`` (including any coalescing wait) to the end of the
+        batch. Without ``submitted_ns`` all requests start now.
+        """
+        if EMPTY_METRICS is None:
+            return [
+                BenchmarkResult(
+                    request_id=request.request_id,
+                    success=False,
+                    error="sagellm_protocol not installed",
+                    metrics=None,
+                )
+                for request in requests
+            ]
 
-        from sagellm_benchmark.types import BenchmarkResult
+        if submitted_ns is None:
+            submitted_ns = [time.perf_counter_ns()] * len(requests)
 
         try:
-            from sagellm_protocol import Metrics
-        except ImportError:
-            return BenchmarkResult(
-                request_id=request.request_id,
-                success=False,
-                error="sagellm_protocol not installed",
-                metrics=None,
-            )
-
-        try:
-            start_time = time.perf_counter()
-
-            # Create sampling params
-            sampling_params = self.SamplingParams(
-                max_tokens=request.max_tokens,
-                temperature=request.temperature if request.temperature is not None else 1.0,
-                top_p=request.top_p if request.top_p is not None else 1.0,
-            )
+            sampling_params = [self._sampling_params(request) for request in requests]
 
             # Run in thread pool (vLLM is blocking)
-            loop = asyncio.get_event_loop()
+            prompts = [request.prompt for request in requests]
+            loop = asyncio.get_running_loop()
             outputs = await loop.run_in_executor(
-                None,
-                lambda: self.llm.generate([request.prompt], sampling_params),
+                self._executor, self.llm.generate, prompts, sampling_params
             )
 
-            end_time = time.perf_counter()
+            end_ns = time.perf_counter_ns()
+
+        except Exception as e:
+            self._log_request_error("vLLM local request failed", exc=e)
+            return [
+                BenchmarkResult(
+                    request_id=request.request_id,
+                    success=False,
+                    error=str(e),
+                    metrics=None,
+                )
+                for request in requests
+            ]
 
+        results: list[BenchmarkResult] = []
+        for request, output, start_ns in zip(requests, outputs, submitted_ns, strict=True):
+            total_time_s = (end_ns - start_ns) / NS_PER_S
             # Extract output
-            output = outputs[0]
             output_text = output.outputs[0].text
             output_tokens = len(output.outputs[0].token_ids)
 
             # Calculate metrics (local mode has limited metrics)
-            total_time_s = end_time - start_time
             tpot_ms = (total_time_s * 1000 / output_tokens) if output_tokens > 0 else 0.0
             throughput_tps = output_tokens / total_time_s if total_time_s > 0 else 0.0
 
-            metrics = Metrics(
-                ttft_ms=0.0,  # Not available in local mode
-                tbt_ms=0.0,
-                tpot_ms=tpot_ms,
-                throughput_tps=throughput_tps,
-                peak_mem_mb=0,
-                error_rate=0.0,
-                kv_used_tokens=0,
-                kv_used_bytes=0,
-                prefix_hit_rate=0.0,
-                evict_count=0,
-                evict_ms=0.0,
-                spec_accept_rate=0.0,
-            )
-
-            return BenchmarkResult(
-                request_id=request.request_id,
-                success=True,
-                error=None,
-                metrics=metrics,
-                output_text=output_text,
-                output_tokens=output_tokens,
-                prompt_tokens=len(request.prompt.split()),
+            # TTFT/TBT are not available in local mode and stay zero
+            metrics = EMPTY_METRICS.model_copy(
+                update={
+                    "tpot_ms": tpot_ms,
+                    "throughput_tps": throughput_tps,
+                }
             )
 
-        except Exception as e:
-            logger.error(f"vLLM local request failed: {e}", exc_info=True)
-            return BenchmarkResult(
-                request_id=request.request_id,
-                success=False,
-                error=str(e),
-                metrics=None,
+            results.append(
+                BenchmarkResult(
+                    request_id=request.request_id,
+                    success=True,
+                    error=None,
+                    metrics=metrics,
+                    output_text=output_text,
+                    output_tokens=output_tokens,
+                    prompt_tokens=prompt_word_count(request.prompt),
+                )
             )
+        return results
+
+    def _sampling_params(self, request: BenchmarkRequest) -> Any:
+        """Return the shared ``SamplingParams`` for the request's sampling settings."""
+        key = (
+            request.max_tokens,
+            request.temperature if request.temperature is not None else 1.0,
+            request.top_p if request.top_p is not None else 1.0,
+        )
+        params = self._sampling_params_cache.get(key)
+        if params is None:
+            params = self.SamplingParams(max_tokens=key[0], temperature=key[1], top_p=key[2])
+            self._sampling_params_cache[key] = params
+        return params
 
     async def health_check(self) -> bool:
         """Check vLLM health.
@@ -214,4 +332,7 @@ class VLLMClient(BenchmarkClient):
         """Close client."""
         if self.mode == "server":
             await self.gateway_client.close()
+        elif self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         logger.info("vLLM client closed")
@@ -2,10 +2,24 @@
 
 This module provides:
 - RankingDashboard: Load benchmark results and generate an HTML ranking page.
+
+Exports are imported lazily (PEP 562) so ``import sagellm_benchmark`` does not
+pay for the dashboard's rendering code unless it is used.
 """
 
 from __future__ import annotations
 
-from .ranking import RankingDashboard
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .ranking import RankingDashboard
 
 __all__ = ["RankingDashboard"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "RankingDashboard":
+        from .ranking import RankingDashboard
+
+        return RankingDashboard
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
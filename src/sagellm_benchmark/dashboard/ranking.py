@@ -17,15 +17,99 @@ Usage (Python)::
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import re
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache
+from html import escape
+from importlib.resources import files as resource_files
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on reader threads used by RankingDashboard.load()
+_MAX_LOAD_WORKERS = 32
+# Below this many files to parse, load() reads them on the calling thread
+_PARALLEL_LOAD_MIN_FILES = 8
+
+# Parsed entries per file, reused while a file's mtime and size are unchanged
+_CACHE_FILENAME = ".sagellm_dash_cache.json"
+# Bump when LeaderboardEntry or the parsing rules change
+_CACHE_VERSION = 3
+
+# Row keys mapped onto LeaderboardEntry fields; everything else is "extra"
+_ROW_FIELDS = frozenset(
+    {
+        "model",
+        "scenario",
+        "backend",
+        "hardware",
+        "ttft_ms",
+        "tbt_ms",
+        "throughput_tps",
+        "latency_p50_ms",
+        "latency_p99_ms",
+        "memory_mb",
+    }
+)
+
+_MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
+
+# Characters allowed in scenario-derived DOM ids / JS string arguments
+_UNSAFE_ID_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+# One leaderboard table row; formatted with ``medal``, the HTML-escaped text
+# fields and the entry ``e`` (numeric fields)
+_ROW_TEMPLATE = """
+                <tr>
+                    <td>{medal}</td>
+                    <td class="model-col">{model}</td>
+                    <td>{backend}</td>
+                    <td>{hardware}</td>
+                    <td>{e.ttft_ms:.1f}</td>
+                    <td>{e.tbt_ms:.2f}</td>
+                    <td><b>{e.throughput_tps:.1f}</b></td>
+                    <td>{e.latency_p50_ms:.1f}</td>
+                    <td>{e.latency_p99_ms:.1f}</td>
+                    <td>{e.memory_mb:.0f}</td>
+                </tr>"""
+
+# Page stylesheet and script, shipped in the package's ``static`` directory
+_ASSET_CSS = "dashboard.css"
+_ASSET_JS = "dashboard.js"
+
+# Numeric LeaderboardEntry fields kept as float64 columns for sorting
+_NUMERIC_FIELDS = (
+    "ttft_ms",
+    "tbt_ms",
+    "throughput_tps",
+    "latency_p50_ms",
+    "latency_p99_ms",
+    "memory_mb",
+)
+
+# String LeaderboardEntry fields; with the numeric ones and ``extra`` they
+# make up a dashboard cache row
+_TEXT_FIELDS = ("model", "scenario", "backend", "hardware", "source_file")
+_ENTRY_FIELDS = (*_TEXT_FIELDS, *_NUMERIC_FIELDS, "extra")
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
 # Chart.js CDN
 _CHARTJS_CDN = "https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"
 
@@ -33,7 +117,50 @@ _CHARTJS_CDN = "https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.j
 _SORTABLE_CDN = "https://cdn.jsdelivr.net/npm/sortablejs@1.15.0/Sortable.min.js"
 
 
-@dataclass
+def _intern(value: Any) -> Any:
+    """Intern string labels so the few distinct values share one object each."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _entry_to_cache(entry: LeaderboardEntry) -> dict[str, Any]:
+    """Convert an entry to a JSON-compatible dict for the dashboard cache."""
+    return {name: getattr(entry, name) for name in _ENTRY_FIELDS}
+
+
+def _entry_from_cache(row: dict[str, Any]) -> LeaderboardEntry:
+    """Rebuild an entry from a cache row, validating every field's type.
+
+    Raises:
+        TypeError / ValueError: When the row does not describe an entry.
+    """
+    if not isinstance(row, dict) or set(row) != set(_ENTRY_FIELDS):
+        raise ValueError("malformed dashboard cache row")
+    extra = row["extra"]
+    if not isinstance(extra, dict):
+        raise TypeError("extra must be a dict")
+    for name in _TEXT_FIELDS:
+        if not isinstance(row[name], str):
+            raise TypeError(f"{name} must be a string")
+    return LeaderboardEntry(
+        **{name: _intern(row[name]) for name in _TEXT_FIELDS},
+        **{name: float(row[name]) for name in _NUMERIC_FIELDS},
+        extra=extra,
+    )
+
+
+@cache
+def _read_asset(name: str) -> str:
+    """Return the text of a bundled static asset (read once per process)."""
+    return (resource_files(__package__) / "static" / name).read_text(encoding="utf-8")
+
+
+@cache
+def _asset_version(name: str) -> str:
+    """Short content hash of an asset, used as a cache-busting query string."""
+    return hashlib.sha256(_read_asset(name).encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass(slots=True, frozen=True)
 class LeaderboardEntry:
     """A single row in the ranking leaderboard.
 
@@ -49,7 +176,7 @@ class LeaderboardEntry:
         latency_p99_ms: P99 end-to-end latency (ms).
         memory_mb: Peak memory (MB).
         source_file: Source JSON filename.
-        extra: Any additional fields from the JSON.
+        extra: Additional row fields from the JSON (only with ``keep_extra``).
     """
 
     model: str
@@ -76,16 +203,32 @@ class RankingDashboard:
         results_dir: Directory containing JSON result files. Defaults to
             ``./benchmark_results``.
         extra_files: Additional JSON files to include.
+        keep_extra: Copy unrecognized row fields into ``LeaderboardEntry.extra``.
+            Off by default: the leaderboard never renders them, and rows may
+            carry large per-request payloads.
+        use_cache: Reuse parsed entries of unchanged files from
+            ``results_dir/.sagellm_dash_cache.json`` (keyed by path, mtime and
+            size) and refresh that cache after loading. Off by default, since
+            it writes into the results directory. The cache is plain JSON and
+            only ever yields entry field values.
     """
 
     def __init__(
         self,
         results_dir: str | Path = "./benchmark_results",
         extra_files: list[str | Path] | None = None,
+        keep_extra: bool = False,
+        use_cache: bool = False,
     ) -> None:
         self.results_dir = Path(results_dir)
         self.extra_files: list[Path] = [Path(f) for f in (extra_files or [])]
+        self.keep_extra = keep_extra
+        self.use_cache = use_cache
         self._entries: list[LeaderboardEntry] = []
+        # Column-wise copy of the numeric entry fields, built by load()
+        self._columns: dict[str, np.ndarray] = {}
+        # Sorted entry lists per (sort_by, descending), reset by load()
+        self._sorted_cache: dict[tuple[str, bool], list[LeaderboardEntry]] = {}
 
     # ------------------------------------------------------------------
     # Loading
@@ -94,56 +237,176 @@ class RankingDashboard:
     def load(self) -> None:
         """Load all JSON result files from ``results_dir`` and ``extra_files``."""
         self._entries.clear()
-        files: list[Path] = []
-        if self.results_dir.is_dir():
-            files.extend(sorted(self.results_dir.glob("*.json")))
-        files.extend(self.extra_files)
+        self._columns = {}
+        self._sorted_cache.clear()
+        scanned = self._scan_results_dir()
+        files = [f for f, _ in scanned] + self.extra_files
 
         if not files:
             logger.warning(f"No JSON result files found in {self.results_dir}")
             return
 
-        for f in files:
-            self._load_file(f)
+        cache = self._read_cache() if self.use_cache else {}
+        signatures = [signature for _, signature in scanned]
+        signatures.extend(self._file_signature(f) for f in self.extra_files)
+        loaded: list[list[LeaderboardEntry] | None] = []
+        for f, signature in zip(files, signatures, strict=True):
+            hit = cache.get(str(f))
+            loaded.append(hit[1] if hit and signature and hit[0] == signature else None)
+
+        stale = [f for f, entries in zip(files, loaded, strict=True) if entries is None]
+        if len(stale) >= _PARALLEL_LOAD_MIN_FILES:
+            # Only the file reads release the GIL (JSON parsing holds it), so
+            # threads just overlap I/O; worth it for many files or slow
+            # (network) storage. map() keeps the entries in file order
+            with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(stale))) as pool:
+                parsed = list(pool.map(self._load_file, stale))
+        else:
+            parsed = [self._load_file(f) for f in stale]
+        fresh = iter(parsed)
+        loaded = [entries if entries is not None else next(fresh) for entries in loaded]
+
+        for entries in loaded:
+            self._entries.extend(entries)
+        self._columns = self._build_columns(self._entries)
+
+        if self.use_cache and stale:
+            self._write_cache(
+                {
+                    str(f): (signature, entries)
+                    for f, signature, entries in zip(files, signatures, loaded, strict=True)
+                    if signature is not None
+                }
+            )
 
         logger.info(f"Loaded {len(self._entries)} result row(s) from {len(files)} file(s)")
 
-    def _load_file(self, path: Path) -> None:
-        """Load a single JSON result file."""
+    @staticmethod
+    def _build_columns(entries: list[LeaderboardEntry]) -> dict[str, np.ndarray]:
+        """Copy the numeric entry fields into float64 columns (one per field)."""
+        n = len(entries)
+        return {
+            name: np.fromiter((getattr(e, name) for e in entries), dtype=np.float64, count=n)
+            for name in _NUMERIC_FIELDS
+        }
+
+    def _scan_results_dir(self) -> list[tuple[Path, tuple[int, int] | None]]:
+        """List ``*.json`` files in ``results_dir`` (sorted by name) with their signatures.
+
+        A single ``os.scandir`` pass replaces ``is_dir()`` + ``glob()``; the
+        directory entry's file type comes from the listing and its stat result
+        is reused for the cache signature.
+        """
+        scanned: list[tuple[Path, tuple[int, int] | None]] = []
+        try:
+            with os.scandir(self.results_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json") or entry.name == _CACHE_FILENAME:
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    scanned.append((Path(entry.path), (st.st_mtime_ns, st.st_size)))
+        except OSError:
+            return []
+        scanned.sort(key=lambda item: item[0].name)
+        return scanned
+
+    @staticmethod
+    def _file_signature(path: Path) -> tuple[int, int] | None:
+        """Return ``(mtime_ns, size)`` of ``path``, or None if it cannot be stat'ed."""
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            st = path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _cache_path(self) -> Path:
+        return self.results_dir / _CACHE_FILENAME
+
+    def _read_cache(self) -> dict[str, tuple[tuple[int, int], list[LeaderboardEntry]]]:
+        """Read the entry cache; any unreadable or mismatched cache counts as empty."""
+        path = self._cache_path()
+        if not path.is_file():
+            return {}
+        try:
+            payload = _json_loads(path.read_bytes())
+            if (
+                not isinstance(payload, dict)
+                or payload.get("version") != _CACHE_VERSION
+                or payload.get("keep_extra") != self.keep_extra
+            ):
+                return {}
+            return {
+                name: ((int(mtime_ns), int(size)), [_entry_from_cache(row) for row in rows])
+                for name, (mtime_ns, size, rows) in payload["files"].items()
+            }
         except Exception as exc:  # noqa: BLE001
-            logger.warning(f"Skipping {path.name}: {exc}")
+            logger.debug(f"Ignoring dashboard cache {path}: {exc}")
+            return {}
+
+    def _write_cache(
+        self, files: dict[str, tuple[tuple[int, int], list[LeaderboardEntry]]]
+    ) -> None:
+        """Persist the entry cache next to the results (best effort)."""
+        if not self.results_dir.is_dir():
             return
+        payload = {
+            "version": _CACHE_VERSION,
+            "keep_extra": self.keep_extra,
+            "files": {
+                name: [mtime_ns, size, [_entry_to_cache(e) for e in entries]]
+                for name, ((mtime_ns, size), entries) in files.items()
+            },
+        }
+        try:
+            self._cache_path().write_text(json.dumps(payload), encoding="utf-8")
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug(f"Could not write dashboard cache: {exc}")
+
+    def _load_file(self, path: Path) -> list[LeaderboardEntry]:
+        """Load a single JSON result file and return its entries.
+
+        Runs on loader threads, so it must not touch ``self._entries``.
+        """
+        try:
+            # Both parsers decode UTF-8 bytes directly
+            data = _json_loads(path.read_bytes())
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"Skipping {path.name}: {exc}")
+            return []
 
         stem = path.stem  # used as default backend label
+        entries: list[LeaderboardEntry] = []
 
         # Support the "rows" format (perf_results.json style)
         if "rows" in data and isinstance(data["rows"], list):
             for row in data["rows"]:
                 entry = self._parse_row(row, source=path.name, backend=stem)
                 if entry:
-                    self._entries.append(entry)
-            return
+                    entries.append(entry)
+            return entries
 
         # Support the aggregated "metrics" format (JSONReporter output)
         if "metrics" in data and isinstance(data["metrics"], dict):
             entry = self._parse_metrics(data, source=path.name, backend=stem)
             if entry:
-                self._entries.append(entry)
-            return
+                entries.append(entry)
+            return entries
 
         logger.debug(f"Unrecognized format in {path.name}, skipping")
+        return entries
 
     def _parse_row(self, row: dict[str, Any], source: str, backend: str) -> LeaderboardEntry | None:
         """Parse a single row from the 'rows' array."""
-        model = row.get("model", "unknown")
-        scenario = row.get("scenario", "unknown")
         return LeaderboardEntry(
-            model=model,
-            scenario=scenario,
-            backend=row.get("backend", backend),
-            hardware=row.get("hardware", "unknown"),
+            model=_intern(row.get("model", "unknown")),
+            scenario=_intern(row.get("scenario", "unknown")),
+            backend=_intern(row.get("backend", backend)),
+            hardware=_intern(row.get("hardware", "unknown")),
             ttft_ms=float(row.get("ttft_ms", 0)),
             tbt_ms=float(row.get("tbt_ms", 0)),
             throughput_tps=float(row.get("throughput_tps", 0)),
@@ -151,23 +414,9 @@ class RankingDashboard:
             latency_p99_ms=float(row.get("latency_p99_ms", 0)),
             memory_mb=float(row.get("memory_mb", 0)),
             source_file=source,
-            extra={
-                k: v
-                for k, v in row.items()
-                if k
-                not in {
-                    "model",
-                    "scenario",
-                    "backend",
-                    "hardware",
-                    "ttft_ms",
-                    "tbt_ms",
-                    "throughput_tps",
-                    "latency_p50_ms",
-                    "latency_p99_ms",
-                    "memory_mb",
-                }
-            },
+            extra=(
+                {k: v for k, v in row.items() if k not in _ROW_FIELDS} if self.keep_extra else {}
+            ),
         )
 
     def _parse_metrics(
@@ -175,13 +424,11 @@ class RankingDashboard:
     ) -> LeaderboardEntry | None:
         """Parse aggregated metrics from JSONReporter format."""
         m = data["metrics"]
-        model = data.get("model", source.replace(".json", ""))
-        scenario = data.get("workload", data.get("scenario", "aggregated"))
         return LeaderboardEntry(
-            model=model,
-            scenario=scenario,
-            backend=data.get("backend", backend),
-            hardware=data.get("hardware", "unknown"),
+            model=_intern(data.get("model", source.replace(".json", ""))),
+            scenario=_intern(data.get("workload", data.get("scenario", "aggregated"))),
+            backend=_intern(data.get("backend", backend)),
+            hardware=_intern(data.get("hardware", "unknown")),
             ttft_ms=float(m.get("avg_ttft_ms", 0)),
             tbt_ms=float(m.get("avg_tbt_ms", 0)),
             throughput_tps=float(m.get("output_throughput_tps", 0)),
@@ -201,6 +448,7 @@ class RankingDashboard:
         title: str = "SageLLM Performance Leaderboard",
         sort_by: str = "throughput_tps",
         descending: bool = True,
+        inline_assets: bool = True,
     ) -> str:
         """Generate the HTML ranking dashboard.
 
@@ -209,6 +457,11 @@ class RankingDashboard:
             title: Page title.
             sort_by: Default sort column (throughput_tps, ttft_ms, latency_p99_ms).
             descending: Sort in descending order by default.
+            inline_assets: Embed the stylesheet and script in the page (a
+                single self-contained file). When False, the page links to
+                ``dashboard.css`` / ``dashboard.js`` with a content-hash query
+                string, and those files are copied next to ``output_path`` so
+                browsers can cache them across regenerated dashboards.
 
         Returns:
             HTML string.
@@ -216,82 +469,133 @@ class RankingDashboard:
         if not self._entries:
             self.load()
 
-        entries = sorted(
-            self._entries,
-            key=lambda e: getattr(e, sort_by, 0),
-            reverse=descending,
-        )
-
-        html = self._build_html(entries, title=title)
+        entries = self._sorted_entries(sort_by, descending)
+        html = self._build_html(entries, title=title, inline_assets=inline_assets)
 
         if output_path:
             Path(output_path).write_text(html, encoding="utf-8")
+            if not inline_assets:
+                self._copy_assets(Path(output_path).parent)
             logger.info(f"Dashboard written to {output_path}")
 
         return html
 
-    def _build_html(self, entries: list[LeaderboardEntry], title: str) -> str:
+    def _sorted_entries(self, sort_by: str, descending: bool) -> list[LeaderboardEntry]:
+        """Return the entries ordered by ``sort_by``, reusing earlier sorts since load()."""
+        key = (sort_by, descending)
+        entries = self._sorted_cache.get(key)
+        if entries is not None and len(entries) == len(self._entries):
+            return entries
+
+        column = self._columns.get(sort_by)
+        if column is not None and len(column) == len(self._entries):
+            # Stable argsort on the numeric column; negating for descending
+            # order keeps ties in load order, like sorted(..., reverse=True)
+            order = np.argsort(-column if descending else column, kind="stable")
+            entries = [self._entries[i] for i in order]
+        else:
+            entries = sorted(
+                self._entries,
+                key=lambda e: getattr(e, sort_by, 0),
+                reverse=descending,
+            )
+        self._sorted_cache[key] = entries
+        return entries
+
+    @staticmethod
+    def _copy_assets(target_dir: Path) -> None:
+        """Copy the stylesheet and script into ``target_dir`` for linked pages."""
+        static = resource_files(__package__) / "static"
+        for name in (_ASSET_CSS, _ASSET_JS):
+            with (static / name).open("rb") as src, (target_dir / name).open("wb") as dst:
+                shutil.copyfileobj(src, dst)
+
+    def _build_html(
+        self, entries: list[LeaderboardEntry], title: str, inline_assets: bool = True
+    ) -> str:
         """Build the complete HTML."""
         generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # Unique scenarios for tab navigation
-        scenarios = list(dict.fromkeys(e.scenario for e in entries))
+        # Group entries by scenario and collect the models in one pass (keeps
+        # ranking order within a group); the keys are the unique scenarios
+        # for tab navigation
+        groups: dict[str, list[LeaderboardEntry]] = {}
+        models: set[str] = set()
+        for e in entries:
+            groups.setdefault(e.scenario, []).append(e)
+            models.add(e.model)
+        scenarios = list(groups)
 
         # Build table rows per scenario
         def _rows_for_scenario(sc: str) -> str:
-            rows = ""
-            rank = 1
-            for e in entries:
-                if e.scenario != sc:
-                    continue
-                medal = {1: "🥇", 2: "🥈", 3: "🥉"}.get(rank, str(rank))
-                rows += f"""
-                <tr>
-                    <td>{medal}</td>
-                    <td class="model-col">{e.model}</td>
-                    <td>{e.backend}</td>
-                    <td>{e.hardware}</td>
-                    <td>{e.ttft_ms:.1f}</td>
-                    <td>{e.tbt_ms:.2f}</td>
-                    <td><b>{e.throughput_tps:.1f}</b></td>
-                    <td>{e.latency_p50_ms:.1f}</td>
-                    <td>{e.latency_p99_ms:.1f}</td>
-                    <td>{e.memory_mb:.0f}</td>
-                </tr>"""
-                rank += 1
-            return rows
-
-        # Build tabs
-        tabs_html = ""
-        panels_html = ""
+            return "".join(
+                _ROW_TEMPLATE.format(
+                    medal=_MEDALS.get(rank, str(rank)),
+                    model=escape(str(e.model)),
+                    backend=escape(str(e.backend)),
+                    hardware=escape(str(e.hardware)),
+                    e=e,
+                )
+                for rank, e in enumerate(groups[sc], start=1)
+            )
+
+        # Scenario names go into DOM ids and JS string literals: reduce them
+        # to safe characters once (suffixing collisions) and escape labels
+        dom_ids: dict[str, str] = {}
+        for sc in scenarios:
+            dom_id = base = _UNSAFE_ID_CHARS.sub("_", str(sc)) or "scenario"
+            n = 1
+            while dom_id in dom_ids.values():
+                n += 1
+                dom_id = f"{base}-{n}"
+            dom_ids[sc] = dom_id
+
+        # Build tabs (collected as parts and joined once)
+        tab_parts: list[str] = []
+        panel_parts: list[str] = []
         for i, sc in enumerate(scenarios):
             active = "active" if i == 0 else ""
-            tabs_html += f'<button class="tab-btn {active}" onclick="showTab(\'{sc}\')" id="tab-{sc}">{sc}</button>\n'
-            panels_html += f"""
-            <div class="tab-panel" id="panel-{sc}" {"style='display:block'" if i == 0 else "style='display:none'"}>
-                <table id="table-{sc}" class="ranking-table sortable">
+            sid = dom_ids[sc]
+            tab_parts.append(
+                f'<button class="tab-btn {active}" onclick="showTab(\'{sid}\')" id="tab-{sid}">{escape(str(sc))}</button>\n'
+            )
+            panel_parts.append(f"""
+            <div class="tab-panel" id="panel-{sid}" {"style='display:block'" if i == 0 else "style='display:none'"}>
+                <table id="table-{sid}" class="ranking-table sortable">
                     <thead>
                         <tr>
                             <th>Rank</th>
-                            <th onclick="sortTable('table-{sc}', 1)">Model ▲▼</th>
-                            <th onclick="sortTable('table-{sc}', 2)">Backend ▲▼</th>
-                            <th onclick="sortTable('table-{sc}', 3)">Hardware ▲▼</th>
-                            <th onclick="sortTable('table-{sc}', 4)">TTFT (ms) ▲▼</th>
-                            <th onclick="sortTable('table-{sc}', 5)">TBT (ms) ▲▼</th>
-                            <th onclick="sortTable('table-{sc}', 6)">Throughput (tok/s) ▲▼</th>
-                            <th onclick="sortTable('table-{sc}', 7)">P50 Lat (ms) ▲▼</th>
-                            <th onclick="sortTable('table-{sc}', 8)">P99 Lat (ms) ▲▼</th>
-                            <th onclick="sortTable('table-{sc}', 9)">Mem (MB) ▲▼</th>
+                            <th onclick="sortTable('table-{sid}', 1)">Model ▲▼</th>
+                            <th onclick="sortTable('table-{sid}', 2)">Backend ▲▼</th>
+                            <th onclick="sortTable('table-{sid}', 3)">Hardware ▲▼</th>
+                            <th onclick="sortTable('table-{sid}', 4)">TTFT (ms) ▲▼</th>
+                            <th onclick="sortTable('table-{sid}', 5)">TBT (ms) ▲▼</th>
+                            <th onclick="sortTable('table-{sid}', 6)">Throughput (tok/s) ▲▼</th>
+                            <th onclick="sortTable('table-{sid}', 7)">P50 Lat (ms) ▲▼</th>
+                            <th onclick="sortTable('table-{sid}', 8)">P99 Lat (ms) ▲▼</th>
+                            <th onclick="sortTable('table-{sid}', 9)">Mem (MB) ▲▼</th>
                         </tr>
                     </thead>
                     <tbody>
                         {_rows_for_scenario(sc)}
                     </tbody>
                 </table>
-            </div>"""
-
+            </div>""")
+        tabs_html = "".join(tab_parts)
+        panels_html = "".join(panel_parts)
+
+        if inline_assets:
+            head_assets = f"<style>\n{_read_asset(_ASSET_CSS)}    </style>"
+            body_assets = f"<script>\n{_read_asset(_ASSET_JS)}</script>"
+        else:
+            head_assets = (
+                f'<link rel="stylesheet" href="{_ASSET_CSS}?v={_asset_version(_ASSET_CSS)}" />'
+            )
+            body_assets = f'<script src="{_ASSET_JS}?v={_asset_version(_ASSET_JS)}"></script>'
+
+        title = escape(title)
         total_entries = len(entries)
-        total_models = len({e.model for e in entries})
+        total_models = len(models)
         total_scenarios = len(scenarios)
 
         return f"""<!DOCTYPE html>
@@ -300,80 +604,7 @@ class RankingDashboard:
     <meta charset="UTF-8" />
     <meta name="viewport" content="width=device-width, initial-scale=1.0" />
     <title>{title}</title>
-    <style>
-        * {{ box-sizing: border-box; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #f0f2f5;
-            margin: 0;
-            color: #222;
-        }}
-        header {{
-            background: linear-gradient(135deg, #0d1b2a 0%, #1b2838 50%, #0f3460 100%);
-            color: #fff;
-            padding: 2rem 2.5rem;
-            text-align: center;
-        }}
-        header h1 {{ margin: 0 0 0.5rem; font-size: 2rem; }}
-        header p {{ margin: 0; opacity: 0.75; font-size: 0.9rem; }}
-        .stats-bar {{
-            display: flex;
-            justify-content: center;
-            gap: 2rem;
-            padding: 1.2rem;
-            background: #1b2838;
-            color: #ddd;
-            font-size: 0.9rem;
-        }}
-        .stats-bar span b {{ color: #4fc3f7; font-size: 1.3rem; }}
-        .container {{ max-width: 1300px; margin: 0 auto; padding: 1.5rem; }}
-        .tabs {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.5rem;
-            margin-bottom: 1rem;
-        }}
-        .tab-btn {{
-            padding: 0.5rem 1.2rem;
-            border: 2px solid #0f3460;
-            background: #fff;
-            color: #0f3460;
-            border-radius: 20px;
-            cursor: pointer;
-            font-size: 0.85rem;
-            transition: all 0.2s;
-        }}
-        .tab-btn.active, .tab-btn:hover {{
-            background: #0f3460;
-            color: #fff;
-        }}
-        .tab-panel {{ display: none; }}
-        .ranking-table {{
-            width: 100%;
-            border-collapse: collapse;
-            background: #fff;
-            border-radius: 12px;
-            overflow: hidden;
-            box-shadow: 0 2px 12px rgba(0,0,0,0.08);
-            font-size: 0.88rem;
-        }}
-        .ranking-table thead tr {{
-            background: #0f3460;
-            color: #fff;
-        }}
-        .ranking-table th {{
-            padding: 0.75rem 1rem;
-            text-align: left;
-            cursor: pointer;
-            white-space: nowrap;
-            user-select: none;
-        }}
-        .ranking-table th:hover {{ background: #1a4a80; }}
-        .ranking-table td {{ padding: 0.6rem 1rem; border-bottom: 1px solid #eee; }}
-        .ranking-table tbody tr:hover td {{ background: #f0f4ff; }}
-        .model-col {{ font-weight: 600; color: #0f3460; max-width: 200px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }}
-        footer {{ text-align: center; color: #999; font-size: 0.8rem; padding: 2rem; }}
-    </style>
+    {head_assets}
 </head>
 <body>
 <header>
@@ -396,35 +627,7 @@ class RankingDashboard:
 
 <footer>Generated by sagellm-benchmark dashboard &nbsp;|&nbsp; {generated_at}</footer>
 
-<script>
-function showTab(sc) {{
-    document.querySelectorAll('.tab-panel').forEach(p => p.style.display = 'none');
-    document.querySelectorAll('.tab-btn').forEach(b => b.classList.remove('active'));
-    const panel = document.getElementById('panel-' + sc);
-    const btn = document.getElementById('tab-' + sc);
-    if (panel) panel.style.display = 'block';
-    if (btn) btn.classList.add('active');
-}}
-
-function sortTable(tableId, col) {{
-    const table = document.getElementById(tableId);
-    if (!table) return;
-    const tbody = table.querySelector('tbody');
-    const rows = Array.from(tbody.querySelectorAll('tr'));
-    const asc = table.dataset.sortCol == col && table.dataset.sortDir !== 'asc';
-    table.dataset.sortCol = col;
-    table.dataset.sortDir = asc ? 'asc' : 'desc';
-    rows.sort((a, b) => {{
-        const av = a.cells[col]?.innerText.trim() ?? '';
-        const bv = b.cells[col]?.innerText.trim() ?? '';
-        const an = parseFloat(av), bn = parseFloat(bv);
-        const na = isNaN(an), nb = isNaN(bn);
-        let cmp = na || nb ? av.localeCompare(bv) : an - bn;
-        return asc ? cmp : -cmp;
-    }});
-    rows.forEach(r => tbody.appendChild(r));
-}}
-</script>
+{body_assets}
 </body>
 </html>
 """
@@ -0,0 +1,28 @@
+// SageLLM ranking dashboard: scenario tabs and client-side column sorting
+function showTab(sc) {
+    document.querySelectorAll('.tab-panel').forEach(p => p.style.display = 'none');
+    document.querySelectorAll('.tab-btn').forEach(b => b.classList.remove('active'));
+    const panel = document.getElementById('panel-' + sc);
+    const btn = document.getElementById('tab-' + sc);
+    if (panel) panel.style.display = 'block';
+    if (btn) btn.classList.add('active');
+}
+
+function sortTable(tableId, col) {
+    const table = document.getElementById(tableId);
+    if (!table) return;
+    const tbody = table.querySelector('tbody');
+    const rows = Array.from(tbody.querySelectorAll('tr'));
+    const asc = table.dataset.sortCol == col && table.dataset.sortDir !== 'asc';
+    table.dataset.sortCol = col;
+    table.dataset.sortDir = asc ? 'asc' : 'desc';
+    rows.sort((a, b) => {
+        const av = a.cells[col]?.innerText.trim() ?? '';
+        const bv = b.cells[col]?.innerText.trim() ?? '';
+        const an = parseFloat(av), bn = parseFloat(bv);
+        const na = isNaN(an), nb = isNaN(bn);
+        let cmp = na || nb ? av.localeCompare(bv) : an - bn;
+        return asc ? cmp : -cmp;
+    });
+    rows.forEach(r => tbody.appendChild(r));
+}
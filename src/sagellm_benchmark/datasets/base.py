@@ -6,11 +6,37 @@
 
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+import numpy as np
 
 from sagellm_benchmark.types import BenchmarkRequest, WorkloadSpec
 
 
+def generate_request_ids(n: int) -> list[str]:
+    """一次生成 n 个 UUID4 字符串（与 ``str(uuid.uuid4())`` 格式一致）。
+
+    只调用一次 ``os.urandom(16 * n)``，用 numpy 设置 RFC 4122 版本/变体位，
+    再对整段十六进制串切片格式化，不为每个 ID 构造 ``uuid.UUID`` 对象。
+
+    Args:
+        n: 需要的 ID 数量。
+
+    Returns:
+        n 个形如 ``xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx`` 的字符串。
+    """
+    raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.tobytes().hex()
+    return [
+        f"{h[i : i + 8]}-{h[i + 8 : i + 12]}-{h[i + 12 : i + 16]}-{h[i + 16 : i + 20]}-{h[i + 20 : i + 32]}"
+        for i in range(0, 32 * n, 32)
+    ]
+
+
 class BenchmarkDataset(ABC):
     """Benchmark 数据集抽象基类。
 
@@ -45,6 +71,23 @@ class BenchmarkDataset(ABC):
         """
         ...
 
+    def sample_iter(self, spec: WorkloadSpec) -> Iterator[BenchmarkRequest]:
+        """按需逐个生成请求，适合只遍历一次的大规模 workload。
+
+        默认实现直接迭代 ``sample()`` 的结果；子类可重写为真正的惰性生成，
+        使峰值内存不随 num_requests 增长。
+
+        Args:
+            spec: Workload 规格描述。
+
+        Returns:
+            BenchmarkRequest 迭代器。
+
+        Raises:
+            ValueError: 当规格参数无效时抛出（调用时立即检查）。
+        """
+        return iter(self.sample(spec))
+
     def validate_spec(self, spec: WorkloadSpec) -> None:
         """验证 WorkloadSpec 参数有效性。
 
@@ -8,12 +8,22 @@ from __future__ import annotations
 
 import random
 import string
-import uuid
+from collections.abc import Iterator
 from typing import Literal
 
-from sagellm_benchmark.datasets.base import BenchmarkDataset
+import numpy as np
+
+from sagellm_benchmark.datasets.base import BenchmarkDataset, generate_request_ids
 from sagellm_benchmark.types import BenchmarkRequest, WorkloadSpec
 
+# 简单模式的字符表（ASCII 字节，供 numpy 按索引批量取字符）
+_SIMPLE_ALPHABET = np.frombuffer(
+    (string.ascii_letters + string.digits + " ").encode("ascii"), dtype=np.uint8
+)
+
+# sample_iter 每次批量生成的 request_id 数
+_REQUEST_ID_CHUNK = 4096
+
 # 常用英文词汇表，用于生成更真实的随机 prompt
 WORD_POOL = [
     "the",
@@ -152,6 +162,17 @@ WORD_POOL = [
     "parallel",
 ]
 
+# 词汇表的 numpy 视图与词长，用于整段批量抽词并用整数运算累计长度
+_WORD_ARRAY = np.array(WORD_POOL, dtype=object)
+_WORD_LENS = np.array([len(word) for word in WORD_POOL], dtype=np.int64)
+# 每句词数范围 [_MIN_SENTENCE_WORDS, _MAX_SENTENCE_WORDS]
+_MIN_SENTENCE_WORDS = 8
+_MAX_SENTENCE_WORDS = 15
+# 平均每句字符数（含句号与句间空格），用于估计一次需要抽取的句子数
+_MEAN_SENTENCE_CHARS = (_MIN_SENTENCE_WORDS + _MAX_SENTENCE_WORDS) / 2 * (
+    float(_WORD_LENS.mean()) + 1
+) + 1
+
 # 任务前缀，使 prompt 更真实
 TASK_PREFIXES = [
     "Please explain",
@@ -216,6 +237,7 @@ class RandomDataset(BenchmarkDataset):
         seed: int | None = None,
         length_mode: Literal["char", "token"] = "token",
         realistic: bool = True,
+        prompt_pool_size: int | None = None,
     ) -> None:
         """初始化随机数据集。
 
@@ -225,11 +247,25 @@ class RandomDataset(BenchmarkDataset):
                 - "char": 字符级（精确）
                 - "token": token 级近似（1 token ≈ 4 chars）
             realistic: 是否生成更真实的 prompt（使用词汇表和模板）。
+            prompt_pool_size: 设置后，每个 prompt 长度只生成这么多个 prompt，
+                之后的请求轮流复用（生成开销降为 1/N 量级）。None 表示每个
+                请求都生成新的 prompt。注意复用的 prompt 可能命中服务端
+                前缀缓存，只在不关心 prompt 唯一性时开启。
+
+        Raises:
+            ValueError: 当 prompt_pool_size 小于 1 时。
         """
+        if prompt_pool_size is not None and prompt_pool_size < 1:
+            raise ValueError(f"prompt_pool_size must be >= 1, got {prompt_pool_size}")
         self._seed = seed
         self._length_mode = length_mode
         self._realistic = realistic
         self._rng = random.Random(seed)
+        # 简单模式的字符与真实模式的句长/词索引均由 numpy 批量抽取
+        self._np_rng = np.random.default_rng(seed)
+        self._prompt_pool_size = prompt_pool_size
+        # prompt 长度 -> 预生成的 prompt 池
+        self._prompt_cache: dict[int, list[str]] = {}
 
     @property
     def name(self) -> str:
@@ -247,20 +283,48 @@ class RandomDataset(BenchmarkDataset):
         Raises:
             ValueError: 当规格参数无效时。
         """
-        self.validate_spec(spec)
+        return list(self.sample_iter(spec))
 
-        requests = []
-        for _ in range(spec.num_requests):
-            prompt = self._generate_prompt(spec.prompt_len)
-            request = BenchmarkRequest(
-                prompt=prompt,
-                max_tokens=spec.output_len,
-                request_id=str(uuid.uuid4()),
-                kv_budget_tokens=spec.kv_budget_tokens,
-            )
-            requests.append(request)
+    def sample_iter(self, spec: WorkloadSpec) -> Iterator[BenchmarkRequest]:
+        """惰性生成随机请求，峰值内存与 num_requests 无关。
 
-        return requests
+        request_id 按 ``_REQUEST_ID_CHUNK`` 分块批量生成。
+
+        Args:
+            spec: Workload 规格描述。
+
+        Returns:
+            依次产出 num_requests 个随机请求的迭代器。
+
+        Raises:
+            ValueError: 当规格参数无效时（调用时立即检查）。
+        """
+        self.validate_spec(spec)
+        return self._iter_requests(spec)
+
+    def _iter_requests(self, spec: WorkloadSpec) -> Iterator[BenchmarkRequest]:
+        """``sample_iter`` 的生成器主体（规格已校验）。"""
+        pool = self._prompt_pool(spec.prompt_len)
+        for start in range(0, spec.num_requests, _REQUEST_ID_CHUNK):
+            count = min(_REQUEST_ID_CHUNK, spec.num_requests - start)
+            for i, request_id in enumerate(generate_request_ids(count), start):
+                prompt = pool[i % len(pool)] if pool else self._generate_prompt(spec.prompt_len)
+                yield BenchmarkRequest(
+                    prompt=prompt,
+                    max_tokens=spec.output_len,
+                    request_id=request_id,
+                    kv_budget_tokens=spec.kv_budget_tokens,
+                )
+
+    def _prompt_pool(self, target_len: int) -> list[str]:
+        """返回 ``target_len`` 对应的 prompt 池；未开启 prompt_pool_size 时为空列表。"""
+        if self._prompt_pool_size is None:
+            return []
+        pool = self._prompt_cache.get(target_len)
+        if pool is None:
+            pool = [self._generate_prompt(target_len) for _ in range(self._prompt_pool_size)]
+            self._prompt_cache[target_len] = pool
+        return pool
 
     def _generate_prompt(self, target_len: int) -> str:
         """生成指定长度的随机 prompt。
@@ -292,8 +356,8 @@ class RandomDataset(BenchmarkDataset):
         Returns:
             随机字符串。
         """
-        chars = string.ascii_letters + string.digits + " "
-        return "".join(self._rng.choices(chars, k=target_chars))
+        idx = self._np_rng.integers(0, len(_SIMPLE_ALPHABET), size=target_chars)
+        return _SIMPLE_ALPHABET[idx].tobytes().decode("ascii")
 
     def _generate_realistic_prompt(self, target_chars: int) -> str:
         """生成更真实的随机 prompt。
@@ -317,21 +381,11 @@ class RandomDataset(BenchmarkDataset):
         parts.append(topic)
         parts.append(".")
 
-        # 添加上下文直到达到目标长度
-        current_len = len(" ".join(parts))
-        while current_len < target_chars:
-            # 生成一个句子
-            sentence_words = []
-            sentence_len = self._rng.randint(8, 15)  # 每句 8-15 个词
-            for _ in range(sentence_len):
-                word = self._rng.choice(WORD_POOL)
-                sentence_words.append(word)
-
-            sentence = " ".join(sentence_words) + "."
-            parts.append(sentence)
-            current_len = len(" ".join(parts))
-
-        # 组合并截断到目标长度（允许 ±10% 误差）
+        # 添加句子直到达到目标长度
+        current_len = len(prefix) + 1 + len(topic) + 2
+        parts.extend(self._generate_sentence_words(current_len, target_chars))
+
+        # 组合；仅当前缀本身已超出目标时才需截断（允许 ±10% 误差）
         result = " ".join(parts)
         min_len = int(target_chars * 0.9)
         max_len = int(target_chars * 1.1)
@@ -348,6 +402,45 @@ class RandomDataset(BenchmarkDataset):
 
         return result
 
+    def _generate_sentence_words(self, current_len: int, target_chars: int) -> list[str]:
+        """批量生成句子词，直到总长度（含空格）不小于 ``target_chars``。
+
+        按估计的句数一次抽取句长与词索引，对每个词的字符数（词长 + 前导
+        空格，句末再 + 句号）求累加和，二分查找第一个达到目标的词并在此
+        处停止；不足时再抽下一批。停在句中时该词补上句号，因此结果最多
+        超出目标一个词，无需生成多余文本再截断。
+
+        Args:
+            current_len: 已有前缀部分的长度。
+            target_chars: 目标字符数。
+
+        Returns:
+            按顺序排列的词（句末词带 "."）。
+        """
+        words: list[str] = []
+        while current_len < target_chars:
+            n_sentences = int((target_chars - current_len) / _MEAN_SENTENCE_CHARS) + 1
+            sentence_lens = self._np_rng.integers(
+                _MIN_SENTENCE_WORDS, _MAX_SENTENCE_WORDS + 1, size=n_sentences
+            )
+            word_idx = self._np_rng.integers(0, len(_WORD_ARRAY), size=int(sentence_lens.sum()))
+            last_words = np.cumsum(sentence_lens) - 1
+            word_chars = _WORD_LENS[word_idx] + 1
+            word_chars[last_words] += 1
+            totals = current_len + np.cumsum(word_chars)
+
+            # 第一个使总长度达到目标的词即为最后一个词
+            taken = min(int(np.searchsorted(totals, target_chars)) + 1, len(word_idx))
+            chunk_words = _WORD_ARRAY[word_idx[:taken]]
+            last_words = last_words[last_words < taken]
+            chunk_words[last_words] = chunk_words[last_words] + "."
+            current_len = int(totals[taken - 1])
+            if not len(last_words) or last_words[-1] != taken - 1:
+                chunk_words[-1] = chunk_words[-1] + "."
+                current_len += 1
+            words.extend(chunk_words.tolist())
+        return words
+
     def reset_seed(self, seed: int | None = None) -> None:
         """重置随机种子。
 
@@ -357,3 +450,5 @@ class RandomDataset(BenchmarkDataset):
         if seed is None:
             seed = self._seed
         self._rng = random.Random(seed)
+        self._np_rng = np.random.default_rng(seed)
+        self._prompt_cache.clear()
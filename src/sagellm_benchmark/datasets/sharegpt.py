@@ -8,16 +8,128 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
 import random
-import uuid
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
-from sagellm_benchmark.datasets.base import BenchmarkDataset
+import numpy as np
+
+from sagellm_benchmark.datasets.base import BenchmarkDataset, generate_request_ids
 from sagellm_benchmark.types import BenchmarkRequest, WorkloadSpec
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖
+    orjson = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow 随 datasets 安装；缺失时 prompt 缓存退回 JSON 格式
+    pa = None
+
+# 超过该大小的 ShareGPT 文件在安装了 ijson 时流式解析
+_STREAM_THRESHOLD_BYTES = 100 * 1024 * 1024
+
+# 不超过该长度的 prompt 在提取时去重（重复多为问候、常见问题等短文本）
+_DEDUPE_MAX_CHARS = 4096
+
+# from_file(cache_prompts=True) 的预处理缓存：有 pyarrow 时为 Arrow IPC 文件
+# （<文件名>.prompts.arrow，按内存映射读取），否则为 <文件名>.prompts.json
+_PROMPT_CACHE_VERSION = 1
+
+
+def _first_human_turn(item: dict[str, Any]) -> str | None:
+    """返回对话中第一个 human turn 的文本；没有时返回 None。"""
+    for turn in item.get("conversations") or ():
+        if turn.get("from") == "human":
+            return turn.get("value", "")
+    return None
+
+
+def _as_conversations(prompts: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """把 prompt 包装回只含一个 human turn 的 ShareGPT 对话。"""
+    for prompt in prompts:
+        yield {"conversations": [{"from": "human", "value": prompt}]}
+
+
+def _load_json_file(path: Path) -> Any:
+    """解析 JSON 文件；安装了 orjson 时直接解析内存映射的文件内容。"""
+    if orjson is None or path.stat().st_size == 0:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _prompt_cache_path(path: Path) -> Path:
+    suffix = ".prompts.arrow" if pa is not None else ".prompts.json"
+    return path.with_name(path.name + suffix)
+
+
+def _source_signature(path: Path) -> str:
+    st = path.stat()
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _read_prompt_cache(path: Path) -> list[str] | None:
+    """读取与源文件 (mtime_ns, size) 一致的 prompt 缓存；不可用时返回 None。"""
+    cache_path = _prompt_cache_path(path)
+    if not cache_path.is_file():
+        return None
+    signature = _source_signature(path)
+    try:
+        if pa is not None:
+            with pa.memory_map(str(cache_path)) as source:
+                reader = pa.ipc.open_file(source)
+                metadata = reader.schema.metadata or {}
+                if metadata.get(b"version") != str(_PROMPT_CACHE_VERSION).encode() or (
+                    metadata.get(b"source") != signature.encode()
+                ):
+                    return None
+                return reader.read_all().column("prompt").to_pylist()
+
+        payload = _load_json_file(cache_path)
+    except (OSError, ValueError) as e:  # pa.ArrowInvalid 是 ValueError 的子类
+        logger.debug(f"Ignoring ShareGPT prompt cache {cache_path}: {e}")
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != _PROMPT_CACHE_VERSION
+        or payload.get("source") != signature
+    ):
+        return None
+    return payload.get("prompts")
+
+
+def _write_prompt_cache(path: Path, prompts: list[str]) -> None:
+    """把提取出的 prompt 写入缓存文件（尽力而为，失败只记录日志）。"""
+    cache_path = _prompt_cache_path(path)
+    signature = _source_signature(path)
+    try:
+        if pa is not None:
+            # large_string 使用 64 位偏移，总长度超过 2GB 也能写入
+            schema = pa.schema(
+                [pa.field("prompt", pa.large_string())],
+                metadata={"version": str(_PROMPT_CACHE_VERSION), "source": signature},
+            )
+            table = pa.table({"prompt": pa.array(prompts, type=pa.large_string())}, schema=schema)
+            with pa.OSFile(str(cache_path), "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+                writer.write_table(table)
+            return
+
+        payload = {"version": _PROMPT_CACHE_VERSION, "source": signature, "prompts": prompts}
+        if orjson is not None:
+            cache_path.write_bytes(orjson.dumps(payload))
+        else:
+            cache_path.write_text(json.dumps(payload), encoding="utf-8")
+    except OSError as e:
+        logger.debug(f"Could not write ShareGPT prompt cache: {e}")
+
 
 class ShareGPTDataset(BenchmarkDataset):
     """ShareGPT 对话数据集。
@@ -48,7 +160,7 @@ class ShareGPTDataset(BenchmarkDataset):
 
     def __init__(
         self,
-        data: list[dict[str, Any]],
+        data: Iterable[dict[str, Any]],
         seed: int | None = None,
         min_prompt_len: int = 10,
         max_prompt_len: int = 10000,
@@ -56,22 +168,29 @@ class ShareGPTDataset(BenchmarkDataset):
         """初始化 ShareGPT 数据集。
 
         Args:
-            data: ShareGPT 格式的对话数据列表。
+            data: ShareGPT 格式的对话数据（列表或只遍历一次的迭代器）。
             seed: 随机种子，用于可复现采样。
             min_prompt_len: 最小 prompt 长度（字符），过滤短样本。
             max_prompt_len: 最大 prompt 长度（字符），过滤超长样本。
         """
-        self._raw_data = data
         self._seed = seed
         self._min_prompt_len = min_prompt_len
         self._max_prompt_len = max_prompt_len
         self._rng = random.Random(seed)
 
         # 预处理：提取 prompt
-        self._prompts = self._extract_prompts(data)
+        self._prompts, num_conversations = self._extract_prompts(data)
+        # prompt 长度只算一次；按长度稳定排序的下标让 sample() 用二分查找
+        # 在 O(log N) 内得到长度窗口内的候选区间。长度用 int32 存储
+        # （9 万条约 360KB，可常驻 L2），二分查找只触及这个紧凑数组
+        self._prompt_lens = np.fromiter(
+            (len(p) for p in self._prompts), dtype=np.int32, count=len(self._prompts)
+        )
+        self._length_order = np.argsort(self._prompt_lens, kind="stable").astype(np.int32)
+        self._sorted_lens = self._prompt_lens[self._length_order]
         logger.info(
             f"ShareGPTDataset initialized with {len(self._prompts)} prompts "
-            f"(filtered from {len(data)} conversations)"
+            f"(filtered from {num_conversations} conversations)"
         )
 
     @property
@@ -85,6 +204,7 @@ class ShareGPTDataset(BenchmarkDataset):
         seed: int | None = None,
         min_prompt_len: int = 10,
         max_prompt_len: int = 10000,
+        cache_prompts: bool = False,
     ) -> ShareGPTDataset:
         """从 JSON 文件加载数据集。
 
@@ -93,10 +213,19 @@ class ShareGPTDataset(BenchmarkDataset):
             seed: 随机种子。
             min_prompt_len: 最小 prompt 长度。
             max_prompt_len: 最大 prompt 长度。
+            cache_prompts: 将每段对话的首个 human turn 缓存到
+                ``<文件名>.prompts.arrow``（未安装 pyarrow 时为
+                ``.prompts.json``，均按源文件 mtime 与大小校验），之后的
+                加载直接读取缓存，跳过解析完整对话。
 
         Returns:
             加载的 ShareGPTDataset 实例。
 
+        Note:
+            安装了 ``orjson`` 时直接解析内存映射的文件内容；文件超过
+            100MB 且安装了 ``ijson`` 时逐条流式解析对话，只保留提取出的
+            prompt，不再把整个文件载入内存。
+
         Raises:
             FileNotFoundError: 当文件不存在时。
             json.JSONDecodeError: 当 JSON 格式错误时。
@@ -105,13 +234,45 @@ class ShareGPTDataset(BenchmarkDataset):
         if not path.exists():
             raise FileNotFoundError(f"ShareGPT data file not found: {path}")
 
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        def build(data: Iterable[dict[str, Any]]) -> ShareGPTDataset:
+            if cache_prompts:
+                prompts = [p for p in map(_first_human_turn, data) if p is not None]
+                _write_prompt_cache(path, prompts)
+                data = _as_conversations(prompts)
+            return cls(
+                data, seed=seed, min_prompt_len=min_prompt_len, max_prompt_len=max_prompt_len
+            )
 
+        if cache_prompts:
+            cached = _read_prompt_cache(path)
+            if cached is not None:
+                return cls(
+                    _as_conversations(cached),
+                    seed=seed,
+                    min_prompt_len=min_prompt_len,
+                    max_prompt_len=max_prompt_len,
+                )
+
+        if path.stat().st_size > _STREAM_THRESHOLD_BYTES:
+            try:
+                import ijson
+            except ImportError:
+                logger.debug("ijson not installed, loading ShareGPT file in one pass")
+            else:
+                with open(path, "rb") as f:
+                    # 与一次性加载路径一致：顶层必须是数组
+                    _, event, value = next(ijson.parse(f), ("", "null", None))
+                    if event != "start_array":
+                        got = {"start_map": dict, "null": type(None)}.get(event, type(value))
+                        raise ValueError(f"Expected list, got {got}")
+                    f.seek(0)
+                    return build(ijson.items(f, "item"))
+
+        data = _load_json_file(path)
         if not isinstance(data, list):
             raise ValueError(f"Expected list, got {type(data)}")
 
-        return cls(data, seed=seed, min_prompt_len=min_prompt_len, max_prompt_len=max_prompt_len)
+        return build(data)
 
     @classmethod
     def from_huggingface(
@@ -121,6 +282,7 @@ class ShareGPTDataset(BenchmarkDataset):
         seed: int | None = None,
         min_prompt_len: int = 10,
         max_prompt_len: int = 10000,
+        streaming: bool = False,
     ) -> ShareGPTDataset:
         """从 HuggingFace Hub 加载数据集。
 
@@ -130,6 +292,9 @@ class ShareGPTDataset(BenchmarkDataset):
             seed: 随机种子。
             min_prompt_len: 最小 prompt 长度。
             max_prompt_len: 最大 prompt 长度。
+            streaming: 以流式方式读取（不下载、不落盘完整数据集），边读取边
+                提取 prompt。默认读取本地缓存的数据集，逐行迭代而不整体
+                载入内存。
 
         Returns:
             加载的 ShareGPTDataset 实例。
@@ -146,11 +311,14 @@ class ShareGPTDataset(BenchmarkDataset):
             ) from e
 
         logger.info(f"Loading ShareGPT from HuggingFace: {repo_id}")
-        hf_dataset = load_dataset(repo_id, split=split)
+        hf_dataset = load_dataset(repo_id, split=split, streaming=streaming)
+        # 只解码需要的列，逐行交给 _extract_prompts，不再整体转换为列表
+        if "conversations" in (getattr(hf_dataset, "column_names", None) or ()):
+            hf_dataset = hf_dataset.select_columns(["conversations"])
 
-        # 转换为列表
-        data = list(hf_dataset)
-        return cls(data, seed=seed, min_prompt_len=min_prompt_len, max_prompt_len=max_prompt_len)
+        return cls(
+            hf_dataset, seed=seed, min_prompt_len=min_prompt_len, max_prompt_len=max_prompt_len
+        )
 
     @classmethod
     def from_modelscope(
@@ -160,6 +328,7 @@ class ShareGPTDataset(BenchmarkDataset):
         seed: int | None = None,
         min_prompt_len: int = 10,
         max_prompt_len: int = 10000,
+        streaming: bool = False,
     ) -> ShareGPTDataset:
         """从 ModelScope 加载数据集（支持中文 ShareGPT）。
 
@@ -169,6 +338,9 @@ class ShareGPTDataset(BenchmarkDataset):
             seed: 随机种子。
             min_prompt_len: 最小 prompt 长度。
             max_prompt_len: 最大 prompt 长度。
+            streaming: 以流式方式读取（不下载、不落盘完整数据集），边读取边
+                提取 prompt。默认读取本地缓存的数据集，逐行迭代而不整体
+                载入内存。
 
         Returns:
             加载的 ShareGPTDataset 实例。
@@ -191,39 +363,47 @@ class ShareGPTDataset(BenchmarkDataset):
             ) from e
 
         logger.info(f"Loading ShareGPT from ModelScope: {dataset_id}")
-        ms_dataset = MsDataset.load(dataset_id, split=split)
+        ms_dataset = MsDataset.load(dataset_id, split=split, use_streaming=streaming)
 
-        # 转换为列表
-        data = list(ms_dataset)
-        logger.info(f"Loaded {len(data)} conversations from ModelScope")
-
-        return cls(data, seed=seed, min_prompt_len=min_prompt_len, max_prompt_len=max_prompt_len)
+        # 逐行交给 _extract_prompts，不再整体转换为列表（对话数见初始化日志）
+        return cls(
+            ms_dataset, seed=seed, min_prompt_len=min_prompt_len, max_prompt_len=max_prompt_len
+        )
 
-    def _extract_prompts(self, data: list[dict[str, Any]]) -> list[str]:
+    def _extract_prompts(self, data: Iterable[dict[str, Any]]) -> tuple[list[str], int]:
         """从 ShareGPT 数据中提取 prompt。
 
         Args:
-            data: ShareGPT 格式的对话列表。
+            data: ShareGPT 格式的对话（只遍历一次）。
 
         Returns:
-            过滤后的 prompt 列表。
+            过滤后的 prompt 列表与遍历的对话数。
         """
-        prompts = []
+        # 热循环：阈值与 append 绑定为局部变量，首个 human turn 的查找内联
+        min_len, max_len = self._min_prompt_len, self._max_prompt_len
+        prompts: list[str] = []
+        append = prompts.append
+        # 相同的短 prompt 共享同一个字符串对象；字典只在提取期间存在，
+        # 不像 sys.intern 那样把 prompt 留在解释器全局表中
+        dedupe = {}.setdefault
+        num_conversations = 0
         for item in data:
-            conversations = item.get("conversations", [])
+            num_conversations += 1
+            conversations = item.get("conversations")
             if not conversations:
                 continue
 
-            # 取第一个 human turn 作为 prompt
+            # 取第一个 human turn 作为 prompt，并按长度过滤
             for turn in conversations:
                 if turn.get("from") == "human":
                     prompt = turn.get("value", "")
-                    # 长度过滤
-                    if self._min_prompt_len <= len(prompt) <= self._max_prompt_len:
-                        prompts.append(prompt)
+                    if min_len <= len(prompt) <= max_len:
+                        append(
+                            dedupe(prompt, prompt) if len(prompt) <= _DEDUPE_MAX_CHARS else prompt
+                        )
                     break
 
-        return prompts
+        return prompts, num_conversations
 
     def sample(self, spec: WorkloadSpec) -> list[BenchmarkRequest]:
         """根据 WorkloadSpec 采样请求。
@@ -244,41 +424,48 @@ class ShareGPTDataset(BenchmarkDataset):
 
         # 目标字符长度（近似 token）
         target_chars = spec.prompt_len * 4  # 1 token ≈ 4 chars
-        tolerance = 0.3  # 允许 ±30% 误差
 
-        # 查找长度匹配的 prompt
-        candidates = []
-        for prompt in self._prompts:
-            prompt_len = len(prompt)
-            min_len = target_chars * (1 - tolerance)
-            max_len = target_chars * (1 + tolerance)
-            if min_len <= prompt_len <= max_len:
-                candidates.append(prompt)
+        # 在按长度排序的下标中二分查找长度匹配的区间（允许 ±30% 误差）；
+        # 边界用整数运算算出，与 int 长度比较时无需浮点转换
+        min_len = -(-target_chars * 7 // 10)
+        max_len = target_chars * 13 // 10
+        start = int(np.searchsorted(self._sorted_lens, min_len, side="left"))
+        end = int(np.searchsorted(self._sorted_lens, max_len, side="right"))
 
         # 如果没有严格匹配，使用所有 prompt
-        if not candidates:
+        if start == end:
             logger.warning(
                 f"No prompts found matching length ~{target_chars} chars, "
                 f"using all {len(self._prompts)} prompts"
             )
-            candidates = self._prompts
-
-        # 采样
+            start, end = 0, len(self._prompts)
+
+        # 采样：一次抽取全部位置
+        picks = self._length_order[self._rng.choices(range(start, end), k=spec.num_requests)]
+        max_keep = target_chars * 11 // 10
+        half_target = target_chars // 2
+        # 同一次采样中重复抽到的 prompt 只截断一次（按下标缓存）
+        truncated: dict[int, str] = {}
         requests = []
-        for _ in range(spec.num_requests):
-            prompt = self._rng.choice(candidates)
-            # 截断到目标长度
-            if len(prompt) > target_chars * 1.1:
-                prompt = prompt[: int(target_chars)]
-                # 在空格处截断
-                last_space = prompt.rfind(" ")
-                if last_space > target_chars * 0.5:
-                    prompt = prompt[:last_space]
+        for request_id, idx in zip(
+            generate_request_ids(spec.num_requests), picks.tolist(), strict=True
+        ):
+            prompt = truncated.get(idx)
+            if prompt is None:
+                prompt = self._prompts[idx]
+                # 截断到目标长度
+                if self._prompt_lens[idx] > max_keep:
+                    prompt = prompt[:target_chars]
+                    # 在空格处截断
+                    last_space = prompt.rfind(" ")
+                    if last_space > half_target:
+                        prompt = prompt[:last_space]
+                truncated[idx] = prompt
 
             request = BenchmarkRequest(
                 prompt=prompt,
                 max_tokens=spec.output_len,
-                request_id=str(uuid.uuid4()),
+                request_id=request_id,
                 kv_budget_tokens=spec.kv_budget_tokens,
             )
             requests.append(request)
@@ -350,6 +537,18 @@ class SyntheticShareGPTDataset(BenchmarkDataset):
         """
         self._seed = seed
         self._rng = random.Random(seed)
+        # 预先格式化全部 (模板, 主题1, 主题2) 组合：单槽模板按 topic2 重复，
+        # 从池中均匀抽取与依次抽模板、主题的分布一致
+        self._question_pool = [
+            template.format(topic1, topic2)
+            for template in self.QUESTION_TEMPLATES
+            for topic1 in self.TOPICS
+            for topic2 in self.TOPICS
+        ]
+        # 含分隔空格的平均问题长度，用于估计一次需要抽取的问题数
+        self._mean_question_chars = (
+            sum(map(len, self._question_pool)) / len(self._question_pool) + 1
+        )
 
     @property
     def name(self) -> str:
@@ -369,12 +568,12 @@ class SyntheticShareGPTDataset(BenchmarkDataset):
         target_chars = spec.prompt_len * 4
         requests = []
 
-        for _ in range(spec.num_requests):
+        for request_id in generate_request_ids(spec.num_requests):
             prompt = self._generate_prompt(target_chars)
             request = BenchmarkRequest(
                 prompt=prompt,
                 max_tokens=spec.output_len,
-                request_id=str(uuid.uuid4()),
+                request_id=request_id,
                 kv_budget_tokens=spec.kv_budget_tokens,
             )
             requests.append(request)
@@ -390,28 +589,22 @@ class SyntheticShareGPTDataset(BenchmarkDataset):
         Returns:
             生成的 prompt。
         """
-        parts = []
+        parts: list[str] = []
         current_len = 0
 
         while current_len < target_chars:
-            template = self._rng.choice(self.QUESTION_TEMPLATES)
-            topic1 = self._rng.choice(self.TOPICS)
-            topic2 = self._rng.choice(self.TOPICS)
-
-            if "{}" in template:
-                if template.count("{}") == 2:
-                    question = template.format(topic1, topic2)
-                else:
-                    question = template.format(topic1)
-            else:
-                question = template
-
-            parts.append(question)
-            current_len = len(" ".join(parts))
+            # 按平均长度估计剩余问题数，用 choices 一次抽取整批
+            k = int((target_chars - current_len) / self._mean_question_chars) + 1
+            for question in self._rng.choices(self._question_pool, k=k):
+                # 累加长度（含分隔空格），避免每轮重新拼接全部 parts
+                current_len += len(question) + (1 if parts else 0)
+                parts.append(question)
+                if current_len >= target_chars:
+                    break
 
         result = " ".join(parts)
-        if len(result) > target_chars * 1.1:
-            result = result[: int(target_chars)]
+        if len(result) > target_chars * 11 // 10:
+            result = result[:target_chars]
 
         return result
 
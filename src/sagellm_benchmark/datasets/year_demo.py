@@ -41,11 +41,11 @@ YEAR1_STRESS = WorkloadSpec(
     kv_budget_tokens=4096,  # 触发 KV 驱逐
 )
 
-YEAR1_WORKLOADS: list[WorkloadSpec] = [
+YEAR1_WORKLOADS: tuple[WorkloadSpec, ...] = (
     YEAR1_SHORT,
     YEAR1_LONG,
     YEAR1_STRESS,
-]
+)
 
 
 # ============================================================================
@@ -81,11 +81,11 @@ YEAR2_STRESS = WorkloadSpec(
     kv_budget_tokens=16384,
 )
 
-YEAR2_WORKLOADS: list[WorkloadSpec] = [
+YEAR2_WORKLOADS: tuple[WorkloadSpec, ...] = (
     YEAR2_SHORT,
     YEAR2_LONG,
     YEAR2_STRESS,
-]
+)
 
 
 # ============================================================================
@@ -121,12 +121,26 @@ YEAR3_STRESS = WorkloadSpec(
     kv_budget_tokens=65536,
 )
 
-YEAR3_WORKLOADS: list[WorkloadSpec] = [
+YEAR3_WORKLOADS: tuple[WorkloadSpec, ...] = (
     YEAR3_SHORT,
     YEAR3_LONG,
     YEAR3_STRESS,
-]
+)
+
 
+# 年份 -> 该年 Demo 的 Workload 常量（只读元组，内部查找无需复制）
+_WORKLOADS_BY_YEAR: dict[int, tuple[WorkloadSpec, ...]] = {
+    1: YEAR1_WORKLOADS,
+    2: YEAR2_WORKLOADS,
+    3: YEAR3_WORKLOADS,
+}
+
+# (年份, Workload 类型) -> WorkloadSpec，供 get_workload_by_type 直接查表
+_WORKLOAD_INDEX: dict[tuple[int, WorkloadType], WorkloadSpec] = {
+    (year, spec.workload_type): spec
+    for year, workloads in _WORKLOADS_BY_YEAR.items()
+    for spec in workloads
+}
 
 # ============================================================================
 # 辅助函数
@@ -146,7 +160,7 @@ def get_year1_workloads() -> list[WorkloadSpec]:
         >>> workloads[0].name
         'year1_short'
     """
-    return YEAR1_WORKLOADS.copy()
+    return list(YEAR1_WORKLOADS)
 
 
 def get_year2_workloads() -> list[WorkloadSpec]:
@@ -155,7 +169,7 @@ def get_year2_workloads() -> list[WorkloadSpec]:
     Returns:
         包含 SHORT、LONG、STRESS 三个 WorkloadSpec 的列表。
     """
-    return YEAR2_WORKLOADS.copy()
+    return list(YEAR2_WORKLOADS)
 
 
 def get_year3_workloads() -> list[WorkloadSpec]:
@@ -164,7 +178,7 @@ def get_year3_workloads() -> list[WorkloadSpec]:
     Returns:
         包含 SHORT、LONG、STRESS 三个 WorkloadSpec 的列表。
     """
-    return YEAR3_WORKLOADS.copy()
+    return list(YEAR3_WORKLOADS)
 
 
 def get_workloads_by_year(year: int) -> list[WorkloadSpec]:
@@ -184,14 +198,15 @@ def get_workloads_by_year(year: int) -> list[WorkloadSpec]:
         >>> len(workloads)
         3
     """
-    if year == 1:
-        return get_year1_workloads()
-    elif year == 2:
-        return get_year2_workloads()
-    elif year == 3:
-        return get_year3_workloads()
-    else:
-        raise ValueError(f"Invalid year: {year}. Must be 1, 2, or 3.")
+    return list(_year_workloads(year))
+
+
+def _year_workloads(year: int) -> tuple[WorkloadSpec, ...]:
+    """返回年份对应的 Workload 常量元组（不复制）。"""
+    try:
+        return _WORKLOADS_BY_YEAR[year]
+    except KeyError:
+        raise ValueError(f"Invalid year: {year}. Must be 1, 2, or 3.") from None
 
 
 def get_workload_by_type(
@@ -215,10 +230,10 @@ def get_workload_by_type(
         >>> spec.name
         'year1_short'
     """
-    workloads = get_workloads_by_year(year)
-    for spec in workloads:
-        if spec.workload_type == workload_type:
-            return spec
+    spec = _WORKLOAD_INDEX.get((year, workload_type))
+    if spec is not None:
+        return spec
+    _year_workloads(year)  # 年份无效时抛出更明确的错误
     raise ValueError(f"No workload found for year={year}, type={workload_type}")
 
 
@@ -260,15 +275,17 @@ def create_custom_workload(
         ...     num_requests=10,
         ... )
     """
-    # Fail-fast: 参数校验
-    if prompt_len <= 0:
-        raise ValueError(f"prompt_len must be positive, got {prompt_len}")
-    if output_len <= 0:
-        raise ValueError(f"output_len must be positive, got {output_len}")
-    if num_requests <= 0:
-        raise ValueError(f"num_requests must be positive, got {num_requests}")
-    if kv_budget_tokens is not None and kv_budget_tokens <= 0:
-        raise ValueError(f"kv_budget_tokens must be positive, got {kv_budget_tokens}")
+    # Fail-fast: 参数校验。正常情况只做一次比较，出错时再逐项定位
+    kv = kv_budget_tokens if kv_budget_tokens is not None else 1
+    if min(prompt_len, output_len, num_requests, kv) <= 0:
+        for arg_name, value in (
+            ("prompt_len", prompt_len),
+            ("output_len", output_len),
+            ("num_requests", num_requests),
+            ("kv_budget_tokens", kv),
+        ):
+            if value <= 0:
+                raise ValueError(f"{arg_name} must be positive, got {value}")
 
     return WorkloadSpec(
         name=name,
@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import json
+import math
 import os
 import platform
 import subprocess
 import uuid
 from datetime import UTC, datetime
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 if TYPE_CHECKING:
     from sagellm_benchmark.types import AggregatedMetrics
 
@@ -32,162 +39,281 @@ WORKLOAD_SPECS = {
     "stress_test": {"input_length": 256, "output_length": 256},
 }
 
+# 设为 1/true 时跳过硬件与环境探测（CI、回放等无需真实硬件信息的场景）
+_SKIP_HW_DETECT_ENV = "SAGELLM_SKIP_HW_DETECT"
+
+# 跳过探测时使用的硬件占位信息（与无加速卡时的默认字段一致）
+_STUB_HARDWARE: dict[str, Any] = {
+    "vendor": "Unknown",
+    "chip_model": "unknown",
+    "chip_count": 1,
+    "interconnect": "None",
+    "chips_per_node": 1,
+    "intra_node_interconnect": "None",
+    "memory_per_chip_gb": 0.0,
+    "total_memory_gb": 0.0,
+}
 
-class LeaderboardExporter:
-    """Export benchmark results to leaderboard format.
+# Leaderboard versions 字段：组件名 -> 配置 versions 中按优先级查找的键
+_VERSION_COMPONENTS = (
+    ("protocol", ("sagellm_protocol", "protocol")),
+    ("backend", ("sagellm_backend", "backend")),
+    ("core", ("sagellm_core", "core")),
+    ("control_plane", ("sagellm_control_plane", "control_plane")),
+    ("gateway", ("sagellm_gateway", "gateway")),
+    ("kv_cache", ("sagellm_kv_cache", "kv_cache")),
+    ("comm", ("sagellm_comm", "comm")),
+    ("compression", ("sagellm_compression", "compression")),
+    ("benchmark", ("sagellm_benchmark", "benchmark")),
+)
 
-    Converts internal benchmark metrics to the format required by
-    sagellm-website leaderboard (leaderboard_v1.schema.json).
-    """
+# 决定可见加速卡的环境变量；取值变化时硬件探测结果需重新计算
+_VISIBLE_DEVICES_ENV_VARS = ("CUDA_VISIBLE_DEVICES", "ASCEND_RT_VISIBLE_DEVICES")
 
-    @staticmethod
-    def detect_hardware_info() -> dict[str, Any]:
-        """Detect hardware information from system.
+# 单次读取 procfs 文件头部的字节数（psutil 用 32K，procps 用 8K）
+_PROC_READ_BYTES = 8192
 
-        Returns:
-            Dictionary with hardware fields
-        """
-        # Detect CPU model and vendor
-        cpu_model = platform.processor() or "unknown"
-        if not cpu_model or cpu_model == "unknown":
-            # platform.processor() is often empty on Linux; fall back to /proc/cpuinfo
-            try:
-                with open("/proc/cpuinfo") as f:
-                    for line in f:
-                        if line.startswith("model name"):
-                            cpu_model = line.split(":", 1)[1].strip()
-                            break
-            except OSError:
-                pass
-            if not cpu_model or cpu_model == "unknown":
-                cpu_model = platform.machine() or "CPU"
-
-        # Detect CPU vendor from model string
-        cpu_vendor = "Unknown"
-        cpu_lower = cpu_model.lower()
-        if "intel" in cpu_lower:
-            cpu_vendor = "Intel"
-        elif "amd" in cpu_lower or "ryzen" in cpu_lower or "epyc" in cpu_lower:
-            cpu_vendor = "AMD"
-        elif "apple" in cpu_lower or "m1" in cpu_lower or "m2" in cpu_lower or "m3" in cpu_lower:
-            cpu_vendor = "Apple"
-        elif "arm" in cpu_lower or "aarch" in cpu_lower:
-            cpu_vendor = "ARM"
-
-        # Detect system memory
-        total_memory_gb = 0.0
-        try:
-            import psutil
-
-            total_memory_gb = round(psutil.virtual_memory().total / (1024**3), 2)
-        except ImportError:
-            # Fallback: parse /proc/meminfo on Linux
-            try:
-                with open("/proc/meminfo") as f:
-                    for line in f:
-                        if line.startswith("MemTotal:"):
-                            kb = int(line.split()[1])
-                            total_memory_gb = round(kb / (1024**2), 2)
-                            break
-            except OSError:
-                pass
-
-        # Default to CPU
-        hardware = {
-            "vendor": cpu_vendor,
-            "chip_model": cpu_model,
-            "chip_count": 1,
-            "interconnect": "None",  # Required by schema
-            "chips_per_node": 1,  # Added for clarity
-            "intra_node_interconnect": "None",  # Match example format
-            "memory_per_chip_gb": total_memory_gb,  # For CPU, system memory
-            "total_memory_gb": total_memory_gb,
-        }
 
-        # Try to detect GPU if available
-        try:
-            import torch
-
-            if torch.cuda.is_available():
-                hardware["vendor"] = "NVIDIA"
-                hardware["chip_model"] = torch.cuda.get_device_name(0)
-
-                # 支持通过环境变量强制单卡配置
-                force_single_chip = (
-                    os.getenv("SAGELLM_FORCE_SINGLE_CHIP", "false").lower() == "true"
-                )
-
-                if force_single_chip:
-                    hardware["chip_count"] = 1
-                    hardware["chips_per_node"] = 1
-                else:
-                    hardware["chip_count"] = torch.cuda.device_count()
-                    hardware["chips_per_node"] = torch.cuda.device_count()
-
-                hardware["memory_per_chip_gb"] = round(
-                    torch.cuda.get_device_properties(0).total_memory / (1024**3), 2
-                )
-                hardware["total_memory_gb"] = round(
-                    hardware["memory_per_chip_gb"] * hardware["chip_count"], 2
-                )
-                # Detect interconnect
-                if hardware["chip_count"] > 1:
-                    # Simple heuristic: assume NVLink for multi-GPU
-                    hardware["interconnect"] = "NVLink"
-                    hardware["intra_node_interconnect"] = "NVLink"
-                else:
-                    hardware["interconnect"] = "None"
-                    hardware["intra_node_interconnect"] = "None"
-        except ImportError:
-            pass
+def _skip_hw_detect() -> bool:
+    """Return True when hardware/environment probing is disabled via env."""
+    return os.getenv(_SKIP_HW_DETECT_ENV, "").lower() in ("1", "true")
 
-        # Try to detect Ascend NPU
+
+def _has_non_finite(obj: Any) -> bool:
+    """Return True if ``obj`` contains a NaN or infinite float at any depth."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    return False
+
+
+def _dumps_indented(obj: Any) -> bytes:
+    """Encode ``obj`` as 2-space indented JSON, using orjson when installed.
+
+    The orjson output differs from ``json.dumps`` in one way: non-ASCII text
+    is written as raw UTF-8 instead of ``\\uXXXX`` escapes (the decoded
+    document is the same). orjson would turn NaN/Infinity into ``null``, so
+    payloads containing non-finite floats always use ``json.dumps``, which
+    keeps writing ``NaN`` / ``Infinity``.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        UTF-8 encoded JSON document.
+    """
+    if orjson is not None and not _has_non_finite(obj):
         try:
-            import torch_npu
-
-            if torch_npu.npu.is_available():
-                hardware["vendor"] = "Huawei"
-                hardware["chip_model"] = "Ascend 910B"  # Default
-                hardware["chip_count"] = torch_npu.npu.device_count()
-                hardware["chips_per_node"] = torch_npu.npu.device_count()
-                if hardware["chip_count"] > 1:
-                    hardware["interconnect"] = "HCCS"
-                    hardware["intra_node_interconnect"] = "HCCS"
-                else:
-                    hardware["interconnect"] = "None"
-                    hardware["intra_node_interconnect"] = "None"
-        except ImportError:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # 超出 orjson 支持范围的值（如超过 64 位的整数）交给标准库处理
             pass
+    return json.dumps(obj, indent=2).encode()
 
-        return hardware
 
-    @staticmethod
-    def detect_environment() -> dict[str, Any]:
-        """Detect environment information.
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` so readers never see a partial file.
 
-        Returns:
-            Dictionary with environment fields
-        """
-        env = {
-            "os": f"{platform.system()} {platform.release()}",
-            "python_version": platform.python_version(),
-            "pytorch_version": "",
-            "cuda_version": "",
-            "cann_version": "",
-            "driver_version": "",
-        }
+    The bytes go to a temporary file in the same directory in one write,
+    are fsynced, and then replace ``path`` via ``os.replace``.
 
-        # Detect PyTorch version
+    Args:
+        path: Destination file.
+        data: Complete file contents.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_proc_field(path: str, key: str) -> str | None:
+    """Return the value of the first ``key: value`` line in a procfs file.
+
+    The head of the file is read in one call (the first CPU block of
+    ``/proc/cpuinfo`` and ``MemTotal`` in ``/proc/meminfo`` are near the top),
+    which avoids line-by-line reads of a file the kernel regenerates on demand.
+
+    Args:
+        path: Procfs file to read.
+        key: Field name without the trailing colon.
+
+    Returns:
+        Stripped field value, or None if the field is not present.
+    """
+    with open(path) as f:
+        data = f.read(_PROC_READ_BYTES)
+    for line in data.splitlines():
+        name, sep, value = line.partition(":")
+        if sep and name.strip() == key:
+            return value.strip()
+    return None
+
+
+@lru_cache(maxsize=4)
+def _probe_hardware(
+    force_single_chip: bool, visible_devices: tuple[str | None, ...] = ()
+) -> dict[str, Any]:
+    """Probe CPU, memory and accelerator information.
+
+    Importing torch and querying CUDA/NPU devices is slow, and hardware does
+    not change while the process runs, so results are cached per
+    ``force_single_chip`` value and device-visibility setting.
+
+    Args:
+        force_single_chip: Report a single chip even if more are visible.
+        visible_devices: Values of ``_VISIBLE_DEVICES_ENV_VARS``; only used as
+            part of the cache key.
+
+    Returns:
+        Dictionary with hardware fields (shared; callers must copy)
+    """
+    # Detect CPU model and vendor
+    cpu_model = platform.processor() or "unknown"
+    if not cpu_model or cpu_model == "unknown":
+        # platform.processor() is often empty on Linux; fall back to /proc/cpuinfo
         try:
-            import torch
-
-            env["pytorch_version"] = torch.__version__
-            if torch.cuda.is_available():
-                env["cuda_version"] = torch.version.cuda
-        except ImportError:
+            cpu_model = _read_proc_field("/proc/cpuinfo", "model name") or cpu_model
+        except OSError:
+            pass
+        if not cpu_model or cpu_model == "unknown":
+            cpu_model = platform.machine() or "CPU"
+
+    # Detect CPU vendor from model string
+    cpu_vendor = "Unknown"
+    cpu_lower = cpu_model.lower()
+    if "intel" in cpu_lower:
+        cpu_vendor = "Intel"
+    elif "amd" in cpu_lower or "ryzen" in cpu_lower or "epyc" in cpu_lower:
+        cpu_vendor = "AMD"
+    elif "apple" in cpu_lower or "m1" in cpu_lower or "m2" in cpu_lower or "m3" in cpu_lower:
+        cpu_vendor = "Apple"
+    elif "arm" in cpu_lower or "aarch" in cpu_lower:
+        cpu_vendor = "ARM"
+
+    # Detect system memory
+    total_memory_gb = 0.0
+    try:
+        import psutil
+
+        total_memory_gb = round(psutil.virtual_memory().total / (1024**3), 2)
+    except ImportError:
+        # Fallback: parse /proc/meminfo on Linux
+        try:
+            mem_total = _read_proc_field("/proc/meminfo", "MemTotal")
+            if mem_total:
+                total_memory_gb = round(int(mem_total.split()[0]) / (1024**2), 2)
+        except (OSError, ValueError):
             pass
 
-        # Detect NVIDIA driver
+    # Default to CPU
+    hardware = {
+        "vendor": cpu_vendor,
+        "chip_model": cpu_model,
+        "chip_count": 1,
+        "interconnect": "None",  # Required by schema
+        "chips_per_node": 1,  # Added for clarity
+        "intra_node_interconnect": "None",  # Match example format
+        "memory_per_chip_gb": total_memory_gb,  # For CPU, system memory
+        "total_memory_gb": total_memory_gb,
+    }
+
+    # Try to detect GPU if available
+    try:
+        import torch
+
+        if torch.cuda.is_available():
+            hardware["vendor"] = "NVIDIA"
+            hardware["chip_model"] = torch.cuda.get_device_name(0)
+
+            if force_single_chip:
+                hardware["chip_count"] = 1
+                hardware["chips_per_node"] = 1
+            else:
+                hardware["chip_count"] = torch.cuda.device_count()
+                hardware["chips_per_node"] = torch.cuda.device_count()
+
+            hardware["memory_per_chip_gb"] = round(
+                torch.cuda.get_device_properties(0).total_memory / (1024**3), 2
+            )
+            hardware["total_memory_gb"] = round(
+                hardware["memory_per_chip_gb"] * hardware["chip_count"], 2
+            )
+            # Detect interconnect
+            if hardware["chip_count"] > 1:
+                # Simple heuristic: assume NVLink for multi-GPU
+                hardware["interconnect"] = "NVLink"
+                hardware["intra_node_interconnect"] = "NVLink"
+            else:
+                hardware["interconnect"] = "None"
+                hardware["intra_node_interconnect"] = "None"
+    except ImportError:
+        pass
+
+    # Try to detect Ascend NPU
+    try:
+        import torch_npu
+
+        if torch_npu.npu.is_available():
+            hardware["vendor"] = "Huawei"
+            hardware["chip_model"] = "Ascend 910B"  # Default
+            hardware["chip_count"] = torch_npu.npu.device_count()
+            hardware["chips_per_node"] = torch_npu.npu.device_count()
+            if hardware["chip_count"] > 1:
+                hardware["interconnect"] = "HCCS"
+                hardware["intra_node_interconnect"] = "HCCS"
+            else:
+                hardware["interconnect"] = "None"
+                hardware["intra_node_interconnect"] = "None"
+    except ImportError:
+        pass
+
+    return hardware
+
+
+@cache
+def _probe_environment() -> dict[str, Any]:
+    """Probe software and driver versions once per process.
+
+    ``nvidia-smi`` takes tens of milliseconds normally and can stall for
+    seconds on a misconfigured host, so it is skipped when torch reports no
+    CUDA device and its result is cached.
+
+    Returns:
+        Dictionary with environment fields (shared; callers must copy)
+    """
+    env = {
+        "os": f"{platform.system()} {platform.release()}",
+        "python_version": platform.python_version(),
+        "pytorch_version": "",
+        "cuda_version": "",
+        "cann_version": "",
+        "driver_version": "",
+    }
+
+    # Detect PyTorch version; without torch, CUDA availability is unknown
+    cuda_available: bool | None = None
+    try:
+        import torch
+
+        env["pytorch_version"] = torch.__version__
+        cuda_available = torch.cuda.is_available()
+        if cuda_available:
+            env["cuda_version"] = torch.version.cuda
+    except ImportError:
+        pass
+
+    # Detect NVIDIA driver
+    if cuda_available is not False:
         try:
             result = subprocess.run(
                 ["nvidia-smi", "--query-gpu=driver_version", "--format=csv,noheader"],
@@ -197,10 +323,58 @@ class LeaderboardExporter:
             )
             if result.returncode == 0:
                 env["driver_version"] = result.stdout.strip().split("\n")[0]
-        except (FileNotFoundError, subprocess.TimeoutExpired):
+        except (OSError, subprocess.TimeoutExpired):
             pass
 
-        return env
+    return env
+
+
+class LeaderboardExporter:
+    """Export benchmark results to leaderboard format.
+
+    Converts internal benchmark metrics to the format required by
+    sagellm-website leaderboard (leaderboard_v1.schema.json).
+    """
+
+    @staticmethod
+    def detect_hardware_info() -> dict[str, Any]:
+        """Detect hardware information from system.
+
+        The underlying probe is cached per device-visibility setting; each
+        call returns a copy. When ``SAGELLM_SKIP_HW_DETECT`` is set, a static
+        placeholder is returned without probing.
+
+        Returns:
+            Dictionary with hardware fields
+        """
+        if _skip_hw_detect():
+            return dict(_STUB_HARDWARE)
+        # 支持通过环境变量强制单卡配置
+        force_single_chip = os.getenv("SAGELLM_FORCE_SINGLE_CHIP", "false").lower() == "true"
+        visible_devices = tuple(os.environ.get(name) for name in _VISIBLE_DEVICES_ENV_VARS)
+        return dict(_probe_hardware(force_single_chip, visible_devices))
+
+    @staticmethod
+    def detect_environment() -> dict[str, Any]:
+        """Detect environment information.
+
+        The underlying probe runs once per process; each call returns a copy.
+        When ``SAGELLM_SKIP_HW_DETECT`` is set, only the OS and Python version
+        are reported and torch / nvidia-smi are not touched.
+
+        Returns:
+            Dictionary with environment fields
+        """
+        if _skip_hw_detect():
+            return {
+                "os": f"{platform.system()} {platform.release()}",
+                "python_version": platform.python_version(),
+                "pytorch_version": "",
+                "cuda_version": "",
+                "cann_version": "",
+                "driver_version": "",
+            }
+        return dict(_probe_environment())
 
     @staticmethod
     def infer_config_type(chip_count: int, has_cluster: bool) -> str:
@@ -248,6 +422,9 @@ class LeaderboardExporter:
         workload_name: str,
         output_path: Path,
         custom_metadata: dict[str, Any] | None = None,
+        *,
+        entry_id: str | None = None,
+        submitted_at: str | None = None,
     ) -> dict[str, Any]:
         """Export metrics to leaderboard format.
 
@@ -256,13 +433,21 @@ class LeaderboardExporter:
             config: Run configuration dict
             workload_name: Name of the workload (e.g., "short_input")
             output_path: Path to save the leaderboard entry JSON
-            custom_metadata: Optional custom metadata to include
+            custom_metadata: Optional custom metadata to include; a "hardware"
+                dict in it is used as the entry's hardware instead of probing
+            entry_id: Entry ID to use; a new UUID4 is generated when None
+            submitted_at: ISO-8601 submission time to use, e.g. one timestamp
+                shared by every workload of a sweep; current UTC time when None
 
         Returns:
             The leaderboard entry dictionary
         """
-        # Detect hardware and environment
-        hardware = LeaderboardExporter.detect_hardware_info()
+        # Detect hardware and environment (hardware given in custom_metadata wins)
+        provided_hardware = (custom_metadata or {}).get("hardware")
+        if isinstance(provided_hardware, dict):
+            hardware = {**_STUB_HARDWARE, **provided_hardware}
+        else:
+            hardware = LeaderboardExporter.detect_hardware_info()
         environment = LeaderboardExporter.detect_environment()
 
         # Infer config_type
@@ -318,29 +503,8 @@ class LeaderboardExporter:
         # Build leaderboard entry
         config_versions = config.get("versions", {})
         component_versions = {
-            "protocol": LeaderboardExporter._resolve_version(
-                config_versions, ("sagellm_protocol", "protocol")
-            ),
-            "backend": LeaderboardExporter._resolve_version(
-                config_versions, ("sagellm_backend", "backend")
-            ),
-            "core": LeaderboardExporter._resolve_version(config_versions, ("sagellm_core", "core")),
-            "control_plane": LeaderboardExporter._resolve_version(
-                config_versions, ("sagellm_control_plane", "control_plane")
-            ),
-            "gateway": LeaderboardExporter._resolve_version(
-                config_versions, ("sagellm_gateway", "gateway")
-            ),
-            "kv_cache": LeaderboardExporter._resolve_version(
-                config_versions, ("sagellm_kv_cache", "kv_cache")
-            ),
-            "comm": LeaderboardExporter._resolve_version(config_versions, ("sagellm_comm", "comm")),
-            "compression": LeaderboardExporter._resolve_version(
-                config_versions, ("sagellm_compression", "compression")
-            ),
-            "benchmark": LeaderboardExporter._resolve_version(
-                config_versions, ("sagellm_benchmark", "benchmark")
-            ),
+            name: LeaderboardExporter._resolve_version(config_versions, aliases)
+            for name, aliases in _VERSION_COMPONENTS
         }
         sagellm_version = LeaderboardExporter._resolve_version(
             config_versions, ("sagellm", "sagellm_benchmark", "benchmark")
@@ -368,7 +532,7 @@ class LeaderboardExporter:
         )
 
         entry = {
-            "entry_id": str(uuid.uuid4()),
+            "entry_id": entry_id if entry_id is not None else str(uuid.uuid4()),
             "engine": engine,
             "engine_version": engine_version,
             "sagellm_version": sagellm_version,
@@ -387,7 +551,9 @@ class LeaderboardExporter:
                 "prefix_cache_enabled": True,
             },
             "metadata": {
-                "submitted_at": datetime.now(UTC).isoformat(),
+                "submitted_at": (
+                    submitted_at if submitted_at is not None else datetime.now(UTC).isoformat()
+                ),
                 "submitter": "sagellm-benchmark automated run",
                 "data_source": "automated-benchmark",
                 "engine": engine,
@@ -408,7 +574,6 @@ class LeaderboardExporter:
             entry["metadata"].update(custom_metadata)
 
         # Save to file
-        with open(output_path, "w") as f:
-            json.dump(entry, f, indent=2)
+        _write_atomic(Path(output_path), _dumps_indented(entry))
 
         return entry
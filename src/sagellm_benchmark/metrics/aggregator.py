@@ -1,17 +1,72 @@
 """指标聚合器 - 将多个 BenchmarkResult 聚合为 AggregatedMetrics。
 
 符合 INTERFACE_CONTRACT.md §4 定义。
+
+支持两种用法：
+- 一次性聚合：``MetricsAggregator.aggregate(results)``
+- 增量聚合：每完成一个请求调用 ``aggregator.update(result)``，结束时调用
+  ``aggregator.finalize()``，无需保留完整的 BenchmarkResult 列表。
+
+样本按指标分列存储（SoA）：每个指标一列连续的 float64 numpy 缓冲区，
+``finalize()`` 直接对各列做向量化的均值/标准差/百分位计算。
 """
 
 from __future__ import annotations
 
-import statistics
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from sagellm_benchmark.types import AggregatedMetrics, BenchmarkResult
 
 
+_LATENCY_PERCENTILES = (0.50, 0.95, 0.99)
+_THROUGHPUT_PERCENTILES = (0.01, 0.05, 0.10)
+
+# 未给出容量提示时样本列的初始容量
+_MIN_CAPACITY = 16
+
+
+class _SampleColumn:
+    """单个指标的样本列：预分配容量的 float64 缓冲区，满时按倍数扩容。"""
+
+    __slots__ = ("_data", "_size")
+
+    def __init__(self, capacity: int = 0) -> None:
+        self._data = np.empty(max(capacity, _MIN_CAPACITY), dtype=np.float64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value: float) -> None:
+        """追加一个样本。"""
+        if self._size == len(self._data):
+            self._grow(self._size + 1)
+        self._data[self._size] = value
+        self._size += 1
+
+    def extend(self, values: Sequence[float]) -> None:
+        """批量追加样本（一次切片赋值，不逐个写入）。"""
+        end = self._size + len(values)
+        if end > len(self._data):
+            self._grow(end)
+        self._data[self._size : end] = values
+        self._size = end
+
+    def view(self) -> np.ndarray:
+        """返回已写入部分的 numpy 视图（零拷贝）。"""
+        return self._data[: self._size]
+
+    def _grow(self, min_capacity: int) -> None:
+        data = np.empty(max(min_capacity, 2 * len(self._data)), dtype=np.float64)
+        data[: self._size] = self._data[: self._size]
+        self._data = data
+
+
 class MetricsAggregator:
     """指标聚合器，将多个请求的结果聚合为统计指标。
 
@@ -20,20 +75,105 @@ class MetricsAggregator:
     - 内存（peak_mem_mb）：取 max
     - KV Cache 计数（evict_count, kv_used_tokens）：取 sum
     - 比率类（prefix_hit_rate, spec_accept_rate）：取平均
+
+    增量状态只保存标量累加值和按指标分列的 float64 样本列（8 字节/样本），
+    不持有 BenchmarkResult / Metrics 对象本身。
+
+    Args:
+        n_hint: 预计请求数。每个请求级样本列按此预分配容量，避免运行中扩容；
+            超出时自动扩容，因此只是提示而非上限。
     """
 
-    @staticmethod
-    def aggregate(results: list[BenchmarkResult]) -> AggregatedMetrics:
-        """聚合多个 BenchmarkResult 为 AggregatedMetrics。
+    def __init__(self, n_hint: int = 0) -> None:
+        """初始化空的增量聚合状态。"""
+        self._total_requests = 0
+        self._successful_requests = 0
+
+        # 时间戳（min queued_at / max completed_at）
+        self._start_time: float | None = None
+        self._end_time: float | None = None
+
+        # 百分位/均值样本
+        self._ttft = _SampleColumn(n_hint)
+        self._tbt = _SampleColumn(n_hint)
+        self._tpot = _SampleColumn(n_hint)
+        # ITL 每个请求有多个样本，容量无法从请求数推知
+        self._itl = _SampleColumn()
+        self._e2el = _SampleColumn(n_hint)
+        self._throughput = _SampleColumn(n_hint)
+        self._prefix_hit = _SampleColumn(n_hint)
+        self._spec_accept = _SampleColumn(n_hint)
+
+        # 累加值
+        self._total_input_tokens = 0
+        self._total_output_tokens = 0
+        self._peak_mem_mb = 0
+        self._total_kv_used_tokens = 0
+        self._total_kv_used_bytes = 0
+        self._total_evict_count = 0
+        self._total_evict_ms = 0.0
+
+    def update(self, result: BenchmarkResult) -> None:
+        """累加单个请求结果。
 
         Args:
-            results: BenchmarkResult 列表。
+            result: 单请求执行结果。
+        """
+        self._total_requests += 1
+        metrics = result.metrics
+        if not result.success or metrics is None:
+            return
+        self._successful_requests += 1
+
+        timestamps = metrics.timestamps
+        if timestamps is not None:
+            if timestamps.queued_at > 0 and (
+                self._start_time is None or timestamps.queued_at < self._start_time
+            ):
+                self._start_time = timestamps.queued_at
+            if timestamps.completed_at > 0 and (
+                self._end_time is None or timestamps.completed_at > self._end_time
+            ):
+                self._end_time = timestamps.completed_at
+
+        # === 延迟指标 ===
+        if metrics.ttft_ms > 0:
+            self._ttft.append(metrics.ttft_ms)
+        if metrics.tbt_ms > 0:
+            self._tbt.append(metrics.tbt_ms)
+        if metrics.tpot_ms > 0:
+            self._tpot.append(metrics.tpot_ms)
+        if result.itl_list:
+            self._itl.extend(result.itl_list)
+        if result.e2e_latency_ms > 0:
+            self._e2el.append(result.e2e_latency_ms)
+
+        # === 吞吐 / Token 统计 ===
+        if metrics.throughput_tps > 0:
+            self._throughput.append(metrics.throughput_tps)
+        self._total_input_tokens += result.prompt_tokens
+        self._total_output_tokens += result.output_tokens
+
+        # === 内存 / KV Cache / Speculative ===
+        if metrics.peak_mem_mb > self._peak_mem_mb:
+            self._peak_mem_mb = metrics.peak_mem_mb
+        self._total_kv_used_tokens += metrics.kv_used_tokens
+        self._total_kv_used_bytes += metrics.kv_used_bytes
+        if metrics.prefix_hit_rate >= 0:
+            self._prefix_hit.append(metrics.prefix_hit_rate)
+        self._total_evict_count += metrics.evict_count
+        self._total_evict_ms += metrics.evict_ms
+        if metrics.spec_accept_rate >= 0:
+            self._spec_accept.append(metrics.spec_accept_rate)
+
+    def finalize(self) -> AggregatedMetrics:
+        """根据已累加的结果生成 AggregatedMetrics。
 
         Returns:
             聚合后的 AggregatedMetrics。
 
         Note:
-            - 如果所有请求都失败，返回空 AggregatedMetrics
+            - 如果所有请求都失败，只填充请求计数与错误率
             - 百分位使用排序后的索引法
         """
         from sagellm_benchmark.types import AggregatedMetrics
@@ -41,101 +181,89 @@ class MetricsAggregator:
         # 初始化空指标
         aggregated = AggregatedMetrics()
 
-        if not results:
+        if self._total_requests == 0:
             return aggregated
 
         # 统计总数
-        aggregated.total_requests = len(results)
-        successful = [r for r in results if r.success and r.metrics is not None]
-        aggregated.successful_requests = len(successful)
-        aggregated.failed_requests = aggregated.total_requests - aggregated.successful_requests
-        aggregated.error_rate = (
-            aggregated.failed_requests / aggregated.total_requests
-            if aggregated.total_requests > 0
-            else 0.0
-        )
+        aggregated.total_requests = self._total_requests
+        aggregated.successful_requests = self._successful_requests
+        aggregated.failed_requests = self._total_requests - self._successful_requests
+        aggregated.error_rate = aggregated.failed_requests / aggregated.total_requests
 
         # 如果全部失败，直接返回
-        if not successful:
+        if self._successful_requests == 0:
             return aggregated
 
-        # 收集时间戳（从 timestamps 对象中获取）
-        start_times = [
-            r.metrics.timestamps.queued_at
-            for r in successful
-            if r.metrics.timestamps is not None and r.metrics.timestamps.queued_at > 0
-        ]
-        end_times = [
-            r.metrics.timestamps.completed_at
-            for r in successful
-            if r.metrics.timestamps is not None and r.metrics.timestamps.completed_at > 0
-        ]
-
-        if start_times and end_times:
-            aggregated.start_time = min(start_times)
-            aggregated.end_time = max(end_times)
+        if self._start_time is not None and self._end_time is not None:
+            aggregated.start_time = self._start_time
+            aggregated.end_time = self._end_time
             aggregated.total_time_s = aggregated.end_time - aggregated.start_time
 
         # === 延迟指标 ===
-        ttft_samples = [r.metrics.ttft_ms for r in successful if r.metrics.ttft_ms > 0]
-        tbt_samples = [r.metrics.tbt_ms for r in successful if r.metrics.tbt_ms > 0]
-        tpot_samples = [r.metrics.tpot_ms for r in successful if r.metrics.tpot_ms > 0]
-
-        if ttft_samples:
-            aggregated.avg_ttft_ms = statistics.mean(ttft_samples)
-            aggregated.p50_ttft_ms = MetricsAggregator._percentile(ttft_samples, 0.50)
-            aggregated.p95_ttft_ms = MetricsAggregator._percentile(ttft_samples, 0.95)
-            aggregated.p99_ttft_ms = MetricsAggregator._percentile(ttft_samples, 0.99)
-            if len(ttft_samples) > 1:
-                aggregated.std_ttft_ms = statistics.stdev(ttft_samples)
-
-        if tbt_samples:
-            aggregated.avg_tbt_ms = statistics.mean(tbt_samples)
-
-        if tpot_samples:
-            aggregated.avg_tpot_ms = statistics.mean(tpot_samples)
-            aggregated.p50_tpot_ms = MetricsAggregator._percentile(tpot_samples, 0.50)
-            aggregated.p95_tpot_ms = MetricsAggregator._percentile(tpot_samples, 0.95)
-            aggregated.p99_tpot_ms = MetricsAggregator._percentile(tpot_samples, 0.99)
-            if len(tpot_samples) > 1:
-                aggregated.std_tpot_ms = statistics.stdev(tpot_samples)
-
-        # === ITL 指标（展平所有请求的 itl_list）===
-        all_itl: list[float] = []
-        for r in successful:
-            if r.itl_list:
-                all_itl.extend(r.itl_list)
-
-        if all_itl:
-            aggregated.avg_itl_ms = statistics.mean(all_itl)
-            aggregated.p50_itl_ms = MetricsAggregator._percentile(all_itl, 0.50)
-            aggregated.p95_itl_ms = MetricsAggregator._percentile(all_itl, 0.95)
-            aggregated.p99_itl_ms = MetricsAggregator._percentile(all_itl, 0.99)
-            if len(all_itl) > 1:
-                aggregated.std_itl_ms = statistics.stdev(all_itl)
+        ttft_samples = self._ttft.view()
+        if ttft_samples.size:
+            aggregated.avg_ttft_ms = float(ttft_samples.mean())
+            (
+                aggregated.p50_ttft_ms,
+                aggregated.p95_ttft_ms,
+                aggregated.p99_ttft_ms,
+            ) = MetricsAggregator._percentiles(ttft_samples, _LATENCY_PERCENTILES)
+            if ttft_samples.size > 1:
+                aggregated.std_ttft_ms = float(ttft_samples.std(ddof=1))
+
+        tbt_samples = self._tbt.view()
+        if tbt_samples.size:
+            aggregated.avg_tbt_ms = float(tbt_samples.mean())
+
+        tpot_samples = self._tpot.view()
+        if tpot_samples.size:
+            aggregated.avg_tpot_ms = float(tpot_samples.mean())
+            (
+                aggregated.p50_tpot_ms,
+                aggregated.p95_tpot_ms,
+                aggregated.p99_tpot_ms,
+            ) = MetricsAggregator._percentiles(tpot_samples, _LATENCY_PERCENTILES)
+            if tpot_samples.size > 1:
+                aggregated.std_tpot_ms = float(tpot_samples.std(ddof=1))
+
+        # === ITL 指标（所有请求的 itl_list 已展平到同一列）===
+        all_itl = self._itl.view()
+        if all_itl.size:
+            aggregated.avg_itl_ms = float(all_itl.mean())
+            (
+                aggregated.p50_itl_ms,
+                aggregated.p95_itl_ms,
+                aggregated.p99_itl_ms,
+            ) = MetricsAggregator._percentiles(all_itl, _LATENCY_PERCENTILES)
+            if all_itl.size > 1:
+                aggregated.std_itl_ms = float(all_itl.std(ddof=1))
 
         # === E2E Latency 指标 ===
-        e2el_samples = [r.e2e_latency_ms for r in successful if r.e2e_latency_ms > 0]
-
-        if e2el_samples:
-            aggregated.avg_e2el_ms = statistics.mean(e2el_samples)
-            aggregated.p50_e2el_ms = MetricsAggregator._percentile(e2el_samples, 0.50)
-            aggregated.p95_e2el_ms = MetricsAggregator._percentile(e2el_samples, 0.95)
-            aggregated.p99_e2el_ms = MetricsAggregator._percentile(e2el_samples, 0.99)
-            if len(e2el_samples) > 1:
-                aggregated.std_e2el_ms = statistics.stdev(e2el_samples)
+        e2el_samples = self._e2el.view()
+        if e2el_samples.size:
+            aggregated.avg_e2el_ms = float(e2el_samples.mean())
+            (
+                aggregated.p50_e2el_ms,
+                aggregated.p95_e2el_ms,
+                aggregated.p99_e2el_ms,
+            ) = MetricsAggregator._percentiles(e2el_samples, _LATENCY_PERCENTILES)
+            if e2el_samples.size > 1:
+                aggregated.std_e2el_ms = float(e2el_samples.std(ddof=1))
 
         # === 吞吐 ===
-        throughput_samples = [
-            r.metrics.throughput_tps for r in successful if r.metrics.throughput_tps > 0
-        ]
-
-        if throughput_samples:
-            aggregated.avg_throughput_tps = statistics.mean(throughput_samples)
+        throughput_samples = self._throughput.view()
+        if throughput_samples.size:
+            aggregated.avg_throughput_tps = float(throughput_samples.mean())
+            # 吞吐关注低尾（最慢的请求）
+            (
+                aggregated.p1_throughput_tps,
+                aggregated.p5_throughput_tps,
+                aggregated.p10_throughput_tps,
+            ) = MetricsAggregator._percentiles(throughput_samples, _THROUGHPUT_PERCENTILES)
 
         # 新增：Token 统计与对标吞吐量指标
-        total_input_tokens = sum(r.prompt_tokens for r in successful)
-        total_output_tokens = sum(r.output_tokens for r in successful)
+        total_input_tokens = self._total_input_tokens
+        total_output_tokens = self._total_output_tokens
         aggregated.total_input_tokens = total_input_tokens
         aggregated.total_output_tokens = total_output_tokens
 
@@ -155,34 +283,39 @@ class MetricsAggregator:
             ) / aggregated.total_time_s
 
         # === 内存（取 max）===
-        mem_samples = [r.metrics.peak_mem_mb for r in successful if r.metrics.peak_mem_mb > 0]
-        if mem_samples:
-            aggregated.peak_mem_mb = max(mem_samples)
+        aggregated.peak_mem_mb = self._peak_mem_mb
 
         # === KV Cache（取 sum/avg）===
-        aggregated.total_kv_used_tokens = sum(r.metrics.kv_used_tokens for r in successful)
-        aggregated.total_kv_used_bytes = sum(r.metrics.kv_used_bytes for r in successful)
-
-        prefix_hit_samples = [
-            r.metrics.prefix_hit_rate for r in successful if r.metrics.prefix_hit_rate >= 0
-        ]
-        if prefix_hit_samples:
-            aggregated.avg_prefix_hit_rate = statistics.mean(prefix_hit_samples)
-
-        aggregated.total_evict_count = sum(r.metrics.evict_count for r in successful)
-        aggregated.total_evict_ms = sum(r.metrics.evict_ms for r in successful)
+        aggregated.total_kv_used_tokens = self._total_kv_used_tokens
+        aggregated.total_kv_used_bytes = self._total_kv_used_bytes
+        if self._prefix_hit:
+            aggregated.avg_prefix_hit_rate = float(self._prefix_hit.view().mean())
+        aggregated.total_evict_count = self._total_evict_count
+        aggregated.total_evict_ms = self._total_evict_ms
 
         # === Speculative（取 avg）===
-        spec_samples = [
-            r.metrics.spec_accept_rate for r in successful if r.metrics.spec_accept_rate >= 0
-        ]
-        if spec_samples:
-            aggregated.avg_spec_accept_rate = statistics.mean(spec_samples)
+        if self._spec_accept:
+            aggregated.avg_spec_accept_rate = float(self._spec_accept.view().mean())
 
         return aggregated
 
     @staticmethod
-    def _percentile(samples: list[float], p: float) -> float:
+    def aggregate(results: list[BenchmarkResult]) -> AggregatedMetrics:
+        """聚合多个 BenchmarkResult 为 AggregatedMetrics。
+
+        Args:
+            results: BenchmarkResult 列表。
+
+        Returns:
+            聚合后的 AggregatedMetrics。
+        """
+        aggregator = MetricsAggregator(n_hint=len(results))
+        for result in results:
+            aggregator.update(result)
+        return aggregator.finalize()
+
+    @staticmethod
+    def _percentile(samples: Sequence[float], p: float) -> float:
         """计算百分位。
 
         Args:
@@ -192,15 +325,27 @@ class MetricsAggregator:
         Returns:
             百分位值。
         """
-        if not samples:
-            return 0.0
+        return MetricsAggregator._percentiles(samples, (p,))[0]
 
-        sorted_samples = sorted(samples)
-        n = len(sorted_samples)
-        index = int(n * p)
+    @staticmethod
+    def _percentiles(samples: Sequence[float], ps: Sequence[float]) -> list[float]:
+        """一次性计算多个百分位。
 
-        # 边界保护
-        if index >= n:
-            index = n - 1
+        使用排序后的索引法（第 ``int(n * p)`` 个元素，越界取最后一个），
+        但不做完整排序：``np.partition`` 对所有目标索引做一次 introselect。
+        numpy 视图与 ``array.array("d")`` 样本均可零拷贝转换为 numpy 数组。
+
+        Args:
+            samples: 样本序列。
+            ps: 百分位列表（0-1）。
+
+        Returns:
+            与 ``ps`` 顺序对应的百分位值。
+        """
+        n = len(samples)
+        if n == 0:
+            return [0.0] * len(ps)
 
-        return sorted_samples[index]
+        indices = [min(int(n * p), n - 1) for p in ps]
+        partitioned = np.partition(np.asarray(samples, dtype=np.float64), indices)
+        return [float(partitioned[i]) for i in indices]
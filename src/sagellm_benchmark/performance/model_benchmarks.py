@@ -131,7 +131,9 @@ def run_e2e_model_benchmarks(
                     )
     else:
         # Live mode: send real requests to an OpenAI-compatible API server
-        rows = asyncio.run(
+        from sagellm_benchmark import _loop
+
+        rows = _loop.run(
             _run_live_benchmarks(
                 models=models,
                 scenarios=scenarios,
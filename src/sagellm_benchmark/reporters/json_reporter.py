@@ -45,7 +45,7 @@ class JSONReporter:
         from dataclasses import asdict
 
         report: dict[str, Any] = {
-            "metrics": asdict(metrics),
+            "metrics": metrics.to_dict(),
         }
 
         if contract:
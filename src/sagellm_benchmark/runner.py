@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
@@ -48,6 +49,7 @@ class BenchmarkRunner:
         """
         self.config = config
         self.results: dict[str, AggregatedMetrics] = {}
+        self._submitted_at: str | None = None
 
         # Setup logging
         if config.verbose:
@@ -64,6 +66,9 @@ class BenchmarkRunner:
         # Create output directory
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # 同一次运行导出的所有 leaderboard 条目共用一个提交时间
+        self._submitted_at = datetime.now(UTC).isoformat()
+
         # Ensure engine is started
         if not self.config.engine.is_running:
             await self.config.engine.start()
@@ -277,6 +282,7 @@ class BenchmarkRunner:
                 config=config,
                 workload_name=workload_name,
                 output_path=output_file,
+                submitted_at=self._submitted_at,
             )
             logger.info(f"Exported leaderboard entry to {output_file}")
         except Exception as e:
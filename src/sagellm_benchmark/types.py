@@ -10,11 +10,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from sagellm_protocol import Metrics
 
 
@@ -97,6 +99,8 @@ class BenchmarkResult:
         output_text: 生成的文本输出。
         output_tokens: 输出 token 数。
         prompt_tokens: 输入 token 数。
+        itl_list: 逐 token 延迟（ms），list 或紧凑的 ``array.array("d")``。
+        e2e_latency_ms: 端到端延迟（ms）。
     """
 
     request_id: str
@@ -109,7 +113,7 @@ class BenchmarkResult:
     output_tokens: int = 0
     prompt_tokens: int = 0
     # 新增：benchmark 层面的延迟记录
-    itl_list: list[float] = field(default_factory=list)  # 逐 token 延迟（ms）
+    itl_list: Sequence[float] = field(default_factory=list)  # 逐 token 延迟（ms）
     e2e_latency_ms: float = 0.0  # 端到端延迟（从发送到完成）
 
 
@@ -125,6 +129,9 @@ class AggregatedMetrics:
         avg_tbt_ms: 平均 token 间延迟。
         avg_tpot_ms: 平均每输出 token 时间。
         avg_throughput_tps: 平均吞吐（tokens/s）。
+        p1_throughput_tps: 单请求吞吐 P1（最慢 1% 请求）。
+        p5_throughput_tps: 单请求吞吐 P5。
+        p10_throughput_tps: 单请求吞吐 P10。
         total_throughput_tps: 总吞吐。
         total_requests: 总请求数。
         successful_requests: 成功请求数。
@@ -176,6 +183,9 @@ class AggregatedMetrics:
     # 吞吐
     avg_throughput_tps: float = 0.0
     total_throughput_tps: float = 0.0
+    p1_throughput_tps: float = 0.0  # 新增：单请求吞吐低尾百分位
+    p5_throughput_tps: float = 0.0
+    p10_throughput_tps: float = 0.0
 
     # 新增：对标 vLLM/SGLang 的吞吐量指标
     request_throughput_rps: float = 0.0  # 请求吞吐量 (requests/s)
@@ -211,6 +221,20 @@ class AggregatedMetrics:
     start_time: float = 0.0
     end_time: float = 0.0
 
+    def to_dict(self) -> dict[str, float | int]:
+        """转换为字典。
+
+        字段全部是标量，直接按字段名复制，避免 ``dataclasses.asdict``
+        对每个字段的递归深拷贝。
+
+        Returns:
+            字段名到值的字典，与 ``asdict`` 结果一致。
+        """
+        return {name: getattr(self, name) for name in _AGGREGATED_METRICS_FIELDS}
+
+
+_AGGREGATED_METRICS_FIELDS = tuple(f.name for f in fields(AggregatedMetrics))
+
 
 @dataclass
 class ContractResult:
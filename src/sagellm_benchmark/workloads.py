@@ -58,6 +58,7 @@ class WorkloadConfig:
         repetition_penalty: Repetition penalty factor (1.0 = no penalty).
         stream: Whether to request streaming (SSE) output.
         warmup_rounds: Number of warmup rounds before measurement.
+        warmup_concurrent: Whether warmup requests are sent concurrently.
         concurrency: Explicit concurrency level (overrides ``concurrent`` flag).
         extra_params: Additional backend-specific parameters.
     """
@@ -75,6 +76,7 @@ class WorkloadConfig:
     repetition_penalty: float = 1.0
     stream: bool = False
     warmup_rounds: int = 0
+    warmup_concurrent: bool = False
     concurrency: int | None = None  # explicit concurrency level
 
     # Additional params
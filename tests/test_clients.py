@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import os
 import sys
 from pathlib import Path
@@ -12,7 +13,7 @@ from test_helpers import StubClient
 
 from sagellm_benchmark.clients import BenchmarkClient
 from sagellm_benchmark.clients.openai_client import GatewayClient
-from sagellm_benchmark.types import BenchmarkRequest
+from sagellm_benchmark.types import BenchmarkRequest, BenchmarkResult
 
 
 @pytest.fixture
@@ -233,6 +234,27 @@ async def test_batch_partial_failure() -> None:
     assert successes + failures == len(requests)
 
 
+@pytest.mark.asyncio
+async def test_failed_requests_sample_tracebacks(caplog: pytest.LogCaptureFixture) -> None:
+    """Only the first of every 100 failures logs a traceback."""
+
+    class _FailingClient(BenchmarkClient):
+        async def generate(self, request: BenchmarkRequest) -> BenchmarkResult:
+            raise ConnectionError("provider down")
+
+    client = _FailingClient(name="failing")
+    requests = [BenchmarkRequest(prompt="x", max_tokens=1, request_id=f"f-{i}") for i in range(101)]
+
+    with caplog.at_level(logging.ERROR):
+        results = await client.generate_batch(requests)
+
+    assert not any(r.success for r in results)
+    failures = [rec for rec in caplog.records if "failed" in rec.getMessage()]
+    assert len(failures) == 101
+    assert "ConnectionError: provider down" in failures[0].getMessage()
+    assert [i for i, rec in enumerate(failures) if rec.exc_info] == [0, 100]
+
+
 # ==================== ITL/E2EL Tests ====================
 
 
@@ -374,7 +396,8 @@ async def test_gateway_client_counts_real_tokens_not_stream_chunks(monkeypatch)
             del kwargs
             self.chat = SimpleNamespace(completions=_FakeCompletions())
 
-    perf_times = iter([10.0, 10.05, 10.08, 10.10])
+    # start, first token, end — later chunks are not timestamped.
+    perf_times = iter([10_000_000_000, 10_050_000_000, 10_100_000_000])
 
     monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(AsyncOpenAI=_FakeAsyncOpenAI))
     monkeypatch.setitem(
@@ -385,7 +408,7 @@ async def test_gateway_client_counts_real_tokens_not_stream_chunks(monkeypatch)
         ),
     )
     monkeypatch.setattr(
-        "sagellm_benchmark.clients.openai_client.time.perf_counter",
+        "sagellm_benchmark.clients.openai_client.time.perf_counter_ns",
         lambda: next(perf_times),
     )
 
@@ -492,3 +515,658 @@ def test_gateway_client_remote_tokenizer_defaults_to_hf_mirror(
     assert captured["args"] == ("Qwen/Qwen2.5-1.5B-Instruct",)
     assert captured["kwargs"] == {"trust_remote_code": True, "local_files_only": False}
     assert captured["hf_endpoint"] == "https://hf-mirror.com"
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_collects_itl_when_enabled(monkeypatch) -> None:
+    async def _stream():
+        for content in ["a", "b", "c"]:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+    class _FakeCompletions:
+        async def create(self, **kwargs):
+            del kwargs
+            return _stream()
+
+    class _FakeAsyncOpenAI:
+        def __init__(self, **kwargs) -> None:
+            del kwargs
+            self.chat = SimpleNamespace(completions=_FakeCompletions())
+
+    # start, first token, two more chunks, end
+    perf_times = iter([1_000_000_000, 1_100_000_000, 1_150_000_000, 1_250_000_000, 1_300_000_000])
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(AsyncOpenAI=_FakeAsyncOpenAI))
+    monkeypatch.setitem(sys.modules, "transformers", None)
+    monkeypatch.setattr(
+        "sagellm_benchmark.clients.openai_client.time.perf_counter_ns",
+        lambda: next(perf_times),
+    )
+
+    client = GatewayClient(base_url="http://127.0.0.1:8000/v1", collect_itl=True)
+    request = BenchmarkRequest(prompt="Hi", max_tokens=8, request_id="itl-001", model="m")
+
+    result = await client.generate(request)
+
+    assert result.success is True
+    assert list(result.itl_list) == pytest.approx([50.0, 100.0])
+    assert result.e2e_latency_ms == pytest.approx(300.0)
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_caches_successful_probes(monkeypatch) -> None:
+    monkeypatch.setitem(
+        sys.modules,
+        "openai",
+        SimpleNamespace(AsyncOpenAI=lambda **kwargs: SimpleNamespace()),
+    )
+    client = GatewayClient(base_url="http://127.0.0.1:8000/v1", probe_ttl_s=30.0)
+
+    health_results = iter([False, True])
+    calls = {"health": 0, "model": 0}
+
+    async def _probe_health(timeout: float) -> bool:
+        calls["health"] += 1
+        return next(health_results)
+
+    async def _probe_model(timeout: float) -> str | None:
+        calls["model"] += 1
+        return "Qwen2-7B"
+
+    monkeypatch.setattr(client, "_probe_health", _probe_health)
+    monkeypatch.setattr(client, "_probe_model", _probe_model)
+
+    # Failures are not cached, successes are.
+    assert await client.health_check() is False
+    assert await client.health_check() is True
+    assert await client.health_check() is True
+    assert calls["health"] == 2
+
+    assert await client.discover_model() == "Qwen2-7B"
+    assert await client.discover_model() == "Qwen2-7B"
+    assert calls["model"] == 1
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_reuses_single_probe_client(monkeypatch) -> None:
+    created: list[object] = []
+
+    class _FakeAsyncClient:
+        def __init__(self, **kwargs) -> None:
+            del kwargs
+            self.urls: list[str] = []
+            self.closed = False
+            created.append(self)
+
+        async def get(self, url: str, timeout: float):
+            del timeout
+            self.urls.append(url)
+            return SimpleNamespace(status_code=200, json=lambda: {"model_path": "m"})
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    async def _close() -> None:
+        return None
+
+    monkeypatch.setitem(
+        sys.modules,
+        "openai",
+        SimpleNamespace(AsyncOpenAI=lambda **kwargs: SimpleNamespace(close=_close)),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "httpx",
+        SimpleNamespace(AsyncClient=_FakeAsyncClient, Limits=lambda **kwargs: kwargs),
+    )
+
+    client = GatewayClient(base_url="http://127.0.0.1:8000/v1", probe_ttl_s=0.0)
+    assert await client.health_check() is True
+    assert await client.health_check() is True
+    assert await client.discover_model() == "m"
+    await client.close()
+
+    assert len(created) == 1
+    assert created[0].urls == [
+        "http://127.0.0.1:8000/health",
+        "http://127.0.0.1:8000/health",
+        "http://127.0.0.1:8000/info",
+    ]
+    assert created[0].closed is True
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_prefers_server_usage(monkeypatch) -> None:
+    captured: dict[str, object] = {}
+
+    async def _stream():
+        for content in ["Hel", "lo"]:
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=content))], usage=None
+            )
+        yield SimpleNamespace(
+            choices=[], usage=SimpleNamespace(prompt_tokens=7, completion_tokens=3)
+        )
+
+    class _FakeCompletions:
+        async def create(self, **kwargs):
+            captured.update(kwargs)
+            return _stream()
+
+    class _FakeAsyncOpenAI:
+        def __init__(self, **kwargs) -> None:
+            del kwargs
+            self.chat = SimpleNamespace(completions=_FakeCompletions())
+
+    def _no_tokenizer(*args, **kwargs):
+        raise AssertionError("tokenizer must not be loaded when usage is reported")
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(AsyncOpenAI=_FakeAsyncOpenAI))
+    monkeypatch.setitem(
+        sys.modules,
+        "transformers",
+        SimpleNamespace(AutoTokenizer=SimpleNamespace(from_pretrained=_no_tokenizer)),
+    )
+
+    client = GatewayClient(base_url="http://127.0.0.1:8000/v1")
+    request = BenchmarkRequest(prompt="Hi all", max_tokens=8, request_id="usage-001", model="m")
+
+    result = await client.generate(request)
+
+    assert captured["stream_options"] == {"include_usage": True}
+    assert result.success is True
+    assert result.output_text == "Hello"
+    assert result.prompt_tokens == 7
+    assert result.output_tokens == 3
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_without_token_metrics_skips_streaming(monkeypatch) -> None:
+    captured: dict[str, object] = {}
+
+    class _FakeCompletions:
+        async def create(self, **kwargs):
+            captured.update(kwargs)
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content="Hello there"))],
+                usage=SimpleNamespace(prompt_tokens=4, completion_tokens=2),
+            )
+
+    class _FakeAsyncOpenAI:
+        def __init__(self, **kwargs) -> None:
+            del kwargs
+            self.chat = SimpleNamespace(completions=_FakeCompletions())
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(AsyncOpenAI=_FakeAsyncOpenAI))
+
+    client = GatewayClient(base_url="http://127.0.0.1:8000/v1", token_metrics=False)
+    request = BenchmarkRequest(prompt="Hi", max_tokens=8, request_id="nostream-001", model="m")
+
+    result = await client.generate(request)
+
+    assert captured["stream"] is False
+    assert "stream_options" not in captured
+    assert result.success is True
+    assert result.output_text == "Hello there"
+    assert result.output_tokens == 2
+    assert result.metrics.ttft_ms == 0.0
+    assert result.metrics.throughput_tps > 0
+
+
+def _install_fake_sse_stream(
+    monkeypatch, lines: list[str], captured: dict[str, object] | None = None
+) -> None:
+    """Serve ``lines`` as the SSE body of every raw_sse chat completion."""
+    captured = {} if captured is None else captured
+
+    class _FakeResponse:
+        def raise_for_status(self) -> None:
+            return None
+
+        async def aiter_lines(self):
+            for line in lines:
+                yield line
+
+    class _FakeStream:
+        async def __aenter__(self):
+            return _FakeResponse()
+
+        async def __aexit__(self, *exc_info) -> None:
+            return None
+
+    class _FakeAsyncClient:
+        def __init__(self, **kwargs) -> None:
+            captured["client_kwargs"] = kwargs
+
+        def stream(self, method: str, url: str, json: dict, headers: dict) -> _FakeStream:
+            captured.update(method=method, url=url, body=json, headers=headers)
+            return _FakeStream()
+
+    class _FakeAsyncOpenAI:
+        def __init__(self, **kwargs) -> None:
+            del kwargs
+            self.chat = SimpleNamespace(completions=None)
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(AsyncOpenAI=_FakeAsyncOpenAI))
+    monkeypatch.setitem(sys.modules, "httpx", SimpleNamespace(AsyncClient=_FakeAsyncClient))
+    monkeypatch.setitem(sys.modules, "transformers", None)
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_raw_sse_parses_stream(monkeypatch) -> None:
+    captured: dict[str, object] = {}
+    lines = [
+        'data: {"choices":[{"index":0,"delta":{"role":"assistant"}}]}',
+        "",
+        'data: {"choices":[{"index":0,"delta":{"content":"Hel"}}]}',
+        'data: {"choices":[{"index":0,"delta":{"content":"lo"}}]}',
+        'data: {"choices":[],"usage":{"prompt_tokens":5,"completion_tokens":2}}',
+        "data: [DONE]",
+    ]
+    _install_fake_sse_stream(monkeypatch, lines, captured)
+
+    client = GatewayClient(base_url="http://127.0.0.1:8000/v1/", api_key="k", raw_sse=True)
+    request = BenchmarkRequest(prompt="Hi", max_tokens=8, request_id="sse-001", model="m")
+
+    result = await client.generate(request)
+
+    assert captured["method"] == "POST"
+    assert captured["url"] == "http://127.0.0.1:8000/v1/chat/completions"
+    assert captured["body"]["stream"] is True
+    assert captured["headers"] == {"Authorization": "Bearer k"}
+    assert result.success is True
+    assert result.output_text == "Hello"
+    assert result.prompt_tokens == 5
+    assert result.output_tokens == 2
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_raw_sse_error_event_fails_request(monkeypatch) -> None:
+    lines = [
+        'data: {"choices":[{"index":0,"delta":{"content":"Hel"}}]}',
+        'data: {"error":{"message":"CUDA out of memory"}}',
+        "data: [DONE]",
+    ]
+    _install_fake_sse_stream(monkeypatch, lines)
+
+    client = GatewayClient(base_url="http://127.0.0.1:8000/v1", raw_sse=True)
+    request = BenchmarkRequest(prompt="Hi", max_tokens=8, request_id="sse-err", model="m")
+
+    result = await client.generate(request)
+
+    assert result.success is False
+    assert "CUDA out of memory" in (result.error or "")
+
+
+def test_vllm_server_mode_pool_and_raw_sse_are_opt_in(monkeypatch) -> None:
+    from sagellm_benchmark.clients.vllm_client import VLLMClient
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(AsyncOpenAI=lambda **kw: None))
+    monkeypatch.setitem(
+        sys.modules,
+        "httpx",
+        SimpleNamespace(
+            AsyncClient=lambda **kwargs: SimpleNamespace(**kwargs),
+            Limits=lambda **kwargs: kwargs,
+            Timeout=lambda timeout, connect: (timeout, connect),
+        ),
+    )
+
+    default = VLLMClient(mode="server").gateway_client
+    assert default.raw_sse is False
+    assert default.max_connections is None
+    tuned = VLLMClient(mode="server", max_connections=64, raw_sse=True).gateway_client
+    assert tuned.raw_sse is True
+    assert tuned.max_connections == 64
+
+
+def test_gateway_client_explicit_pool_shared_with_sdk(monkeypatch) -> None:
+    created: list[dict] = []
+    sdk_kwargs: dict[str, object] = {}
+
+    class _FakeAsyncClient:
+        def __init__(self, **kwargs) -> None:
+            created.append(kwargs)
+
+    class _FakeAsyncOpenAI:
+        def __init__(self, **kwargs) -> None:
+            sdk_kwargs.update(kwargs)
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(AsyncOpenAI=_FakeAsyncOpenAI))
+    monkeypatch.setitem(
+        sys.modules,
+        "httpx",
+        SimpleNamespace(
+            AsyncClient=_FakeAsyncClient,
+            Limits=lambda **kwargs: kwargs,
+            Timeout=lambda timeout, connect: (timeout, connect),
+        ),
+    )
+
+    client = GatewayClient(base_url="http://127.0.0.1:8000/v1", max_connections=64, raw_sse=True)
+
+    assert len(created) == 1
+    assert created[0]["limits"] == {"max_connections": 64, "max_keepalive_connections": 64}
+    assert sdk_kwargs["http_client"] is client._get_stream_client()
+    assert len(created) == 1
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_prime_connections_counts_successes(monkeypatch) -> None:
+    outcomes = iter([None, ConnectionError("refused"), None])
+
+    async def _list_models():
+        outcome = next(outcomes)
+        if outcome is not None:
+            raise outcome
+        return SimpleNamespace(data=[])
+
+    class _FakeAsyncOpenAI:
+        def __init__(self, **kwargs) -> None:
+            del kwargs
+            self.models = SimpleNamespace(list=_list_models)
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(AsyncOpenAI=_FakeAsyncOpenAI))
+
+    client = GatewayClient(base_url="http://127.0.0.1:8000/v1")
+
+    assert await client.prime_connections(0) == 0
+    assert await client.prime_connections(3) == 2
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_coalesces_concurrent_requests(monkeypatch) -> None:
+    calls: list[dict] = []
+
+    async def _stream(prompts: list[str]):
+        for step in range(2):
+            for index, prompt in enumerate(prompts):
+                yield SimpleNamespace(
+                    choices=[
+                        SimpleNamespace(
+                            index=index,
+                            text=f"{prompt}-{step} ",
+                            finish_reason="length" if step == 1 else None,
+                        )
+                    ]
+                )
+
+    class _FakeCompletions:
+        async def create(self, **kwargs):
+            calls.append(kwargs)
+            return _stream(kwargs["prompt"])
+
+    class _FakeAsyncOpenAI:
+        def __init__(self, **kwargs) -> None:
+            del kwargs
+            self.completions = _FakeCompletions()
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(AsyncOpenAI=_FakeAsyncOpenAI))
+    monkeypatch.setitem(sys.modules, "transformers", None)
+
+    client = GatewayClient(base_url="http://127.0.0.1:8000/v1", coalesce_window_ms=20.0)
+    requests = [
+        BenchmarkRequest(prompt=f"p{i}", max_tokens=2, request_id=f"c-{i}", model="m")
+        for i in range(3)
+    ]
+
+    results = await client.generate_batch(requests, concurrent=True)
+
+    assert len(calls) == 1
+    assert calls[0]["prompt"] == ["p0", "p1", "p2"]
+    assert [r.request_id for r in results] == ["c-0", "c-1", "c-2"]
+    assert all(r.success for r in results)
+    assert results[1].output_text == "p1-0 p1-1 "
+    assert results[1].output_tokens == 2
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_coalesced_ttft_includes_window(monkeypatch) -> None:
+    async def _stream(prompts: list[str]):
+        for index, _ in enumerate(prompts):
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(index=index, text="tok ", finish_reason="stop")]
+            )
+
+    class _FakeCompletions:
+        async def create(self, **kwargs):
+            return _stream(kwargs["prompt"])
+
+    class _FakeAsyncOpenAI:
+        def __init__(self, **kwargs) -> None:
+            del kwargs
+            self.completions = _FakeCompletions()
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(AsyncOpenAI=_FakeAsyncOpenAI))
+    monkeypatch.setitem(sys.modules, "transformers", None)
+
+    window_ms = 50.0
+    client = GatewayClient(base_url="http://127.0.0.1:8000/v1", coalesce_window_ms=window_ms)
+    requests = [
+        BenchmarkRequest(prompt=f"p{i}", max_tokens=1, request_id=f"w-{i}", model="m")
+        for i in range(2)
+    ]
+
+    results = await client.generate_batch(requests, concurrent=True)
+
+    assert all(r.success for r in results)
+    # The wait for the batch to fill counts towards each request's latency
+    assert all(r.metrics.ttft_ms >= window_ms for r in results)
+    assert all(r.e2e_latency_ms >= window_ms for r in results)
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_reports_each_result(batch_requests: list[BenchmarkRequest]) -> None:
+    client = StubClient(ttft_ms=1.0, tbt_ms=0.1)
+    seen: list[str] = []
+
+    results = await client.generate_batch(
+        batch_requests, concurrent=True, on_result=lambda r: seen.append(r.request_id)
+    )
+
+    assert sorted(seen) == sorted(r.request_id for r in results)
+
+
+@pytest.mark.asyncio
+async def test_sagellm_client_keeps_per_request_trace_ids(monkeypatch) -> None:
+    from sagellm_benchmark.clients.sagellm_client import SageLLMClient
+
+    trace_ids: list[str] = []
+
+    class _FakeLLMEngine:
+        async def generate(self, **kwargs):
+            trace_ids.append(kwargs["trace_id"])
+            return SimpleNamespace(
+                metrics=None, output_text=kwargs["prompt"], output_tokens=[1, 2], prompt_tokens=1
+            )
+
+    monkeypatch.setitem(sys.modules, "sagellm_core", SimpleNamespace(LLMEngine=_FakeLLMEngine))
+
+    client = SageLLMClient(engine=_FakeLLMEngine())
+    requests = [
+        BenchmarkRequest(prompt=f"p{i}", max_tokens=2, request_id=f"s-{i}", model="m")
+        for i in range(3)
+    ]
+
+    results = await client.generate_batch(requests, concurrent=True)
+
+    assert [r.output_text for r in results] == ["p0", "p1", "p2"]
+    assert all(r.success for r in results)
+    assert sorted(trace_ids) == ["benchmark-s-0", "benchmark-s-1", "benchmark-s-2"]
+
+
+@pytest.mark.asyncio
+async def test_vllm_local_coalesces_into_one_generate_call(monkeypatch) -> None:
+    from sagellm_benchmark.clients.vllm_client import VLLMClient
+
+    calls: list[list[str]] = []
+    params: list[list[dict]] = []
+
+    class _FakeLLM:
+        def __init__(self, **kwargs) -> None:
+            del kwargs
+
+        def generate(self, prompts, sampling_params):
+            calls.append(list(prompts))
+            params.append(list(sampling_params))
+            return [
+                SimpleNamespace(outputs=[SimpleNamespace(text=f"{p}!", token_ids=[1, 2, 3])])
+                for p in prompts
+            ]
+
+    monkeypatch.setitem(
+        sys.modules, "vllm", SimpleNamespace(LLM=_FakeLLM, SamplingParams=lambda **kw: kw)
+    )
+
+    client = VLLMClient(mode="local", model_path="/tmp/m", coalesce_window_ms=20.0)
+    requests = [
+        BenchmarkRequest(prompt=f"p{i}", max_tokens=3 + i, request_id=f"v-{i}", model="m")
+        for i in range(3)
+    ]
+
+    results = await client.generate_batch(requests, concurrent=True)
+
+    # Different max_tokens still share one call, with aligned per-prompt params
+    assert calls == [["p0", "p1", "p2"]]
+    assert [sp["max_tokens"] for sp in params[0]] == [3, 4, 5]
+
+    # Sampling configurations are built once and reused by later requests
+    await client.generate(
+        BenchmarkRequest(prompt="again", max_tokens=4, request_id="v-again", model="m")
+    )
+    assert params[1][0] is params[0][1]
+    assert [r.output_text for r in results] == ["p0!", "p1!", "p2!"]
+    assert all(r.output_tokens == 3 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_vllm_local_coalesced_timing_includes_window(monkeypatch) -> None:
+    from sagellm_benchmark.clients.vllm_client import VLLMClient
+
+    class _FakeLLM:
+        def __init__(self, **kwargs) -> None:
+            del kwargs
+
+        def generate(self, prompts, sampling_params):
+            del sampling_params
+            return [
+                SimpleNamespace(outputs=[SimpleNamespace(text="x", token_ids=[1])]) for _ in prompts
+            ]
+
+    monkeypatch.setitem(
+        sys.modules, "vllm", SimpleNamespace(LLM=_FakeLLM, SamplingParams=lambda **kw: kw)
+    )
+
+    window_ms = 50.0
+    client = VLLMClient(mode="local", model_path="/tmp/m", coalesce_window_ms=window_ms)
+    requests = [
+        BenchmarkRequest(prompt=f"p{i}", max_tokens=1, request_id=f"t-{i}", model="m")
+        for i in range(2)
+    ]
+
+    results = await client.generate_batch(requests, concurrent=True)
+
+    # One output token, so TPOT is the request's full time including the window
+    assert all(r.metrics.tpot_ms >= window_ms for r in results)
+
+
+@pytest.mark.asyncio
+async def test_vllm_local_runs_generate_on_dedicated_worker(monkeypatch) -> None:
+    import threading
+
+    from sagellm_benchmark.clients.vllm_client import VLLMClient
+
+    threads: list[str] = []
+
+    class _FakeLLM:
+        def __init__(self, **kwargs) -> None:
+            del kwargs
+
+        def generate(self, prompts, sampling_params):
+            del sampling_params
+            threads.append(threading.current_thread().name)
+            return [
+                SimpleNamespace(outputs=[SimpleNamespace(text=p, token_ids=[1])]) for p in prompts
+            ]
+
+    monkeypatch.setitem(
+        sys.modules, "vllm", SimpleNamespace(LLM=_FakeLLM, SamplingParams=lambda **kw: kw)
+    )
+
+    client = VLLMClient(mode="local", model_path="/tmp/m")
+    requests = [
+        BenchmarkRequest(prompt=f"p{i}", max_tokens=1, request_id=f"w-{i}", model="m")
+        for i in range(3)
+    ]
+
+    results = await client.generate_batch(requests, concurrent=True)
+    await client.close()
+
+    assert all(r.success for r in results)
+    assert len(threads) == 3
+    assert all(name.startswith("vllm-local") for name in threads)
+    assert client._executor is None
+
+
+@pytest.mark.asyncio
+async def test_vllm_max_in_flight_bounds_concurrency(monkeypatch) -> None:
+    import asyncio
+
+    from sagellm_benchmark.clients.vllm_client import VLLMClient
+
+    monkeypatch.setitem(
+        sys.modules,
+        "vllm",
+        SimpleNamespace(LLM=lambda **kw: None, SamplingParams=lambda **kw: kw),
+    )
+    client = VLLMClient(mode="local", model_path="/tmp/m", max_in_flight=2)
+    peak = 0
+
+    async def _slow_local(request: BenchmarkRequest) -> BenchmarkResult:
+        nonlocal peak
+        peak = max(peak, client.current_in_flight)
+        await asyncio.sleep(0.01)
+        return BenchmarkResult(
+            request_id=request.request_id, success=True, error=None, metrics=None
+        )
+
+    monkeypatch.setattr(client, "_generate_local", _slow_local)
+    requests = [
+        BenchmarkRequest(prompt="p", max_tokens=1, request_id=f"g-{i}", model="m") for i in range(6)
+    ]
+
+    results = await client.generate_batch(requests, concurrent=True)
+
+    assert all(r.success for r in results)
+    assert peak == 2
+    assert client.current_in_flight == 0
+
+
+def test_vllm_max_in_flight_survives_new_event_loop(monkeypatch) -> None:
+    import asyncio
+
+    from sagellm_benchmark.clients.vllm_client import VLLMClient
+
+    monkeypatch.setitem(
+        sys.modules,
+        "vllm",
+        SimpleNamespace(LLM=lambda **kw: None, SamplingParams=lambda **kw: kw),
+    )
+    client = VLLMClient(mode="local", model_path="/tmp/m", max_in_flight=1)
+
+    async def _slow_local(request: BenchmarkRequest) -> BenchmarkResult:
+        await asyncio.sleep(0.005)
+        return BenchmarkResult(
+            request_id=request.request_id, success=True, error=None, metrics=None
+        )
+
+    monkeypatch.setattr(client, "_generate_local", _slow_local)
+    requests = [
+        BenchmarkRequest(prompt="p", max_tokens=1, request_id=f"l-{i}", model="m") for i in range(3)
+    ]
+
+    # Each run contends for the single slot on its own loop, as repeated
+    # MultiEngineRunner.run_workload_sync() calls do.
+    for _ in range(2):
+        results = asyncio.run(client.generate_batch(requests, concurrent=True))
+        assert all(r.success for r in results)
@@ -0,0 +1,84 @@
+"""Tests for RequestCoalescer micro-batching."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from sagellm_benchmark.clients.coalescing import RequestCoalescer
+
+
+@pytest.mark.asyncio
+async def test_coalescer_batches_concurrent_submissions() -> None:
+    batches: list[list[int]] = []
+
+    async def _dispatch(items: list[int], submitted_ns: list[int]) -> list[int]:
+        batches.append(items)
+        return [item * 10 for item in items]
+
+    coalescer = RequestCoalescer(_dispatch, window_ms=20.0, max_batch_size=8)
+
+    results = await asyncio.gather(*(coalescer.submit(i) for i in range(5)))
+
+    assert results == [0, 10, 20, 30, 40]
+    assert batches == [[0, 1, 2, 3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_coalescer_flushes_at_max_batch_size_and_groups_by_key() -> None:
+    batches: list[list[int]] = []
+
+    async def _dispatch(items: list[int], submitted_ns: list[int]) -> list[int]:
+        batches.append(items)
+        return items
+
+    coalescer = RequestCoalescer(
+        _dispatch, window_ms=20.0, max_batch_size=2, key=lambda item: item % 2
+    )
+
+    results = await asyncio.gather(*(coalescer.submit(i) for i in range(5)))
+
+    assert results == [0, 1, 2, 3, 4]
+    assert sorted(batches) == [[0, 2], [1, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_coalescer_propagates_dispatch_errors() -> None:
+    async def _dispatch(items: list[int], submitted_ns: list[int]) -> list[int]:
+        raise RuntimeError("backend down")
+
+    coalescer = RequestCoalescer(_dispatch, window_ms=1.0)
+
+    results = await asyncio.gather(coalescer.submit(1), coalescer.submit(2), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_coalescer_rejects_invalid_config() -> None:
+    async def _dispatch(items: list[int], submitted_ns: list[int]) -> list[int]:
+        return items
+
+    with pytest.raises(ValueError, match="window_ms"):
+        RequestCoalescer(_dispatch, window_ms=-1.0)
+    with pytest.raises(ValueError, match="max_batch_size"):
+        RequestCoalescer(_dispatch, window_ms=1.0, max_batch_size=0)
+
+
+@pytest.mark.asyncio
+async def test_coalescer_passes_submit_times_before_window() -> None:
+    seen: list[tuple[list[int], int]] = []
+
+    async def _dispatch(items: list[int], submitted_ns: list[int]) -> list[int]:
+        seen.append((submitted_ns, time.perf_counter_ns()))
+        return items
+
+    coalescer = RequestCoalescer(_dispatch, window_ms=50.0)
+
+    await asyncio.gather(coalescer.submit(1), coalescer.submit(2))
+
+    ((submitted_ns, dispatched_ns),) = seen
+    assert len(submitted_ns) == 2
+    # Submit times are taken before the window elapses, not at dispatch
+    assert all(dispatched_ns - ns >= 45_000_000 for ns in submitted_ns)
@@ -136,3 +136,236 @@ def test_dashboard_leaderboard_entry() -> None:
     assert e.model == "test-model"
     assert e.backend == "unknown"
     assert e.throughput_tps == 100.0
+
+
+def test_dashboard_parallel_load_preserves_file_order(tmp_path: Path) -> None:
+    for i in range(12):
+        row = {"model": f"m{i:02d}", "scenario": "s", "throughput_tps": float(i)}
+        (tmp_path / f"r{i:02d}.json").write_text(json.dumps({"rows": [row]}), encoding="utf-8")
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+    db = RankingDashboard(results_dir=tmp_path)
+    db.load()
+
+    assert [e.model for e in db._entries] == [f"m{i:02d}" for i in range(12)]
+
+
+def test_dashboard_loads_small_result_sets_without_threads(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sagellm_benchmark.dashboard import ranking
+
+    for i in range(3):
+        row = {"model": f"m{i}", "scenario": "s"}
+        (tmp_path / f"r{i}.json").write_text(json.dumps({"rows": [row]}), encoding="utf-8")
+
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("small result sets must load on the calling thread")
+
+    monkeypatch.setattr(ranking, "ThreadPoolExecutor", _no_pool)
+    db = RankingDashboard(results_dir=tmp_path)
+    db.load()
+
+    assert [e.model for e in db._entries] == ["m0", "m1", "m2"]
+
+
+def test_dashboard_scan_lists_json_files_only(tmp_path: Path) -> None:
+    row = {"model": "m", "scenario": "s"}
+    for name in ("b.json", "a.json"):
+        (tmp_path / name).write_text(json.dumps({"rows": [row]}), encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "nested.json").mkdir()
+
+    scanned = RankingDashboard(results_dir=tmp_path)._scan_results_dir()
+
+    assert [p.name for p, _ in scanned] == ["a.json", "b.json"]
+    assert all(signature is not None for _, signature in scanned)
+    assert RankingDashboard(results_dir=tmp_path / "missing")._scan_results_dir() == []
+
+
+def test_dashboard_extra_fields_are_opt_in(tmp_path: Path) -> None:
+    row = {"model": "m", "scenario": "s", "precision": "fp16", "samples": [1, 2, 3]}
+    (tmp_path / "r.json").write_text(json.dumps({"rows": [row]}), encoding="utf-8")
+
+    lean = RankingDashboard(results_dir=tmp_path)
+    lean.load()
+    full = RankingDashboard(results_dir=tmp_path, keep_extra=True)
+    full.load()
+
+    assert lean._entries[0].extra == {}
+    assert full._entries[0].extra == {"precision": "fp16", "samples": [1, 2, 3]}
+
+
+def test_dashboard_cache_skips_unchanged_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    for name in ("a", "b"):
+        row = {"model": name, "scenario": "s", "throughput_tps": 1.0}
+        (tmp_path / f"{name}.json").write_text(json.dumps({"rows": [row]}), encoding="utf-8")
+    RankingDashboard(results_dir=tmp_path, use_cache=True).load()
+    assert (tmp_path / ".sagellm_dash_cache.json").is_file()
+
+    # Rewrite b with a new size and mtime; only b may be parsed again
+    b = tmp_path / "b.json"
+    b.write_text(json.dumps({"rows": [{"model": "b2", "scenario": "s"}]}), encoding="utf-8")
+    st = b.stat()
+    os.utime(b, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    parsed: list[str] = []
+    original = RankingDashboard._load_file
+
+    def _tracking_load(self, path: Path):
+        parsed.append(path.name)
+        return original(self, path)
+
+    monkeypatch.setattr(RankingDashboard, "_load_file", _tracking_load)
+    db = RankingDashboard(results_dir=tmp_path, use_cache=True)
+    db.load()
+
+    assert parsed == ["b.json"]
+    assert [e.model for e in db._entries] == ["a", "b2"]
+
+    uncached = RankingDashboard(results_dir=tmp_path, use_cache=False)
+    uncached.load()
+    assert sorted(parsed[1:]) == ["a.json", "b.json"]
+
+
+def test_dashboard_cache_is_opt_in(tmp_path: Path) -> None:
+    (tmp_path / "a.json").write_text(
+        json.dumps({"rows": [{"model": "a", "scenario": "s"}]}), encoding="utf-8"
+    )
+
+    RankingDashboard(results_dir=tmp_path).load()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.json"]
+
+
+def test_dashboard_cache_never_unpickles(tmp_path: Path) -> None:
+    import pickle
+
+    (tmp_path / "a.json").write_text(
+        json.dumps({"rows": [{"model": "a", "scenario": "s"}]}), encoding="utf-8"
+    )
+    marker = tmp_path / "pwned"
+
+    class _Payload:
+        def __reduce__(self):
+            return (marker.write_text, ("x",))
+
+    (tmp_path / ".sagellm_dash_cache.pkl").write_bytes(pickle.dumps(_Payload()))
+    (tmp_path / ".sagellm_dash_cache.json").write_bytes(pickle.dumps(_Payload()))
+
+    db = RankingDashboard(results_dir=tmp_path, use_cache=True)
+    db.load()
+
+    assert not marker.exists()
+    assert [e.model for e in db._entries] == ["a"]
+
+
+def test_dashboard_cache_ignores_malformed_rows(tmp_path: Path) -> None:
+    path = tmp_path / "a.json"
+    path.write_text(json.dumps({"rows": [{"model": "a", "scenario": "s"}]}), encoding="utf-8")
+    RankingDashboard(results_dir=tmp_path, use_cache=True).load()
+
+    cache_path = tmp_path / ".sagellm_dash_cache.json"
+    payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    payload["files"][str(path)][2][0]["model"] = {"not": "a string"}
+    cache_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    db = RankingDashboard(results_dir=tmp_path, use_cache=True)
+    db.load()
+
+    assert [e.model for e in db._entries] == ["a"]
+
+
+def test_dashboard_sorts_by_numeric_column(tmp_path: Path) -> None:
+    rows = [
+        {"model": "slow", "scenario": "s", "throughput_tps": 10.0, "ttft_ms": 90.0},
+        {"model": "fast", "scenario": "s", "throughput_tps": 30.0, "ttft_ms": 10.0},
+        {"model": "mid-a", "scenario": "s", "throughput_tps": 20.0, "ttft_ms": 50.0},
+        {"model": "mid-b", "scenario": "s", "throughput_tps": 20.0, "ttft_ms": 50.0},
+    ]
+    (tmp_path / "r.json").write_text(json.dumps({"rows": rows}), encoding="utf-8")
+    db = RankingDashboard(results_dir=tmp_path, use_cache=False)
+
+    by_tps = db.generate()
+    by_ttft = db.generate(sort_by="ttft_ms", descending=False)
+
+    # Ties keep load order in both directions
+    assert [by_tps.index(m) for m in ("fast", "mid-a", "mid-b", "slow")] == sorted(
+        by_tps.index(m) for m in ("fast", "mid-a", "mid-b", "slow")
+    )
+    assert [by_ttft.index(m) for m in ("fast", "mid-a", "mid-b", "slow")] == sorted(
+        by_ttft.index(m) for m in ("fast", "mid-a", "mid-b", "slow")
+    )
+
+
+def test_dashboard_reuses_sort_until_reload(tmp_path: Path) -> None:
+    rows = [{"model": "a", "scenario": "s", "throughput_tps": 1.0}]
+    (tmp_path / "r.json").write_text(json.dumps({"rows": rows}), encoding="utf-8")
+    db = RankingDashboard(results_dir=tmp_path, use_cache=False)
+    db.load()
+
+    first = db._sorted_entries("throughput_tps", True)
+    assert db._sorted_entries("throughput_tps", True) is first
+    assert db._sorted_entries("throughput_tps", False) is not first
+
+    db.load()
+    assert db._sorted_cache == {}
+
+
+def test_dashboard_linked_assets_are_copied(tmp_path: Path) -> None:
+    rows = [{"model": "a", "scenario": "s", "throughput_tps": 1.0}]
+    (tmp_path / "r.json").write_text(json.dumps({"rows": rows}), encoding="utf-8")
+    out_dir = tmp_path / "site"
+    out_dir.mkdir()
+    db = RankingDashboard(results_dir=tmp_path, use_cache=False)
+
+    inline = db.generate()
+    linked = db.generate(output_path=out_dir / "index.html", inline_assets=False)
+
+    assert "function showTab" in inline and "<style>" in inline
+    assert "function showTab" not in linked
+    assert 'href="dashboard.css?v=' in linked and 'src="dashboard.js?v=' in linked
+    assert "function sortTable" in (out_dir / "dashboard.js").read_text(encoding="utf-8")
+    assert ".ranking-table" in (out_dir / "dashboard.css").read_text(encoding="utf-8")
+
+
+def test_dashboard_interns_label_fields(tmp_path: Path) -> None:
+    rows = [{"model": "m", "scenario": "chat", "hardware": "A100"} for _ in range(2)]
+    for i in range(2):
+        (tmp_path / f"r{i}.json").write_text(json.dumps({"rows": rows}), encoding="utf-8")
+    db = RankingDashboard(results_dir=tmp_path, use_cache=False)
+    db.load()
+
+    first, *rest = db._entries
+    assert all(e.scenario is first.scenario and e.hardware is first.hardware for e in rest)
+
+
+def test_leaderboard_entry_is_frozen() -> None:
+    from dataclasses import FrozenInstanceError
+
+    e = LeaderboardEntry(model="m", scenario="s")
+    with pytest.raises(FrozenInstanceError):
+        e.model = "other"  # type: ignore[misc]
+
+
+def test_dashboard_escapes_result_fields(tmp_path: Path) -> None:
+    rows = [
+        {"model": "<script>alert(1)</script>", "scenario": "chat 'v2'", "backend": "a&b"},
+        {"model": "m", "scenario": "chat_'v2'"},
+    ]
+    (tmp_path / "r.json").write_text(json.dumps({"rows": rows}), encoding="utf-8")
+
+    html = RankingDashboard(results_dir=tmp_path, use_cache=False).generate(title="<b>T</b>")
+
+    assert "<script>alert(1)</script>" not in html
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+    assert "a&amp;b" in html
+    assert "&lt;b&gt;T&lt;/b&gt;" in html
+    # Scenario names become safe, unique DOM ids
+    assert "showTab('chat__v2_')" in html
+    assert "showTab('chat__v2_-2')" in html
+    assert "chat &#x27;v2&#x27;" in html
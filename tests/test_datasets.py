@@ -28,6 +28,19 @@ from sagellm_benchmark.datasets import (
 from sagellm_benchmark.types import BenchmarkRequest, WorkloadSpec, WorkloadType
 
 
+def _fake_parse(fh):
+    """简易 ijson.parse 替身：只产出顶层的第一个事件。"""
+    import json
+
+    top = json.load(fh)
+    if isinstance(top, list):
+        yield "", "start_array", None
+    elif isinstance(top, dict):
+        yield "", "start_map", None
+    else:
+        yield "", "string", top
+
+
 class TestWorkloadSpec:
     """WorkloadSpec 数据类测试。"""
 
@@ -143,6 +156,49 @@ class TestRandomDataset:
         # 所有 ID 必须唯一
         assert len(request_ids) == len(set(request_ids))
 
+    def test_sample_iter_is_lazy(self) -> None:
+        """测试 sample_iter：立即校验规格，惰性产出与 sample 一致的请求。"""
+        spec = WorkloadSpec(
+            name="iter",
+            workload_type=WorkloadType.SHORT,
+            prompt_len=20,
+            output_len=5,
+            num_requests=3,
+        )
+        dataset = RandomDataset(seed=11)
+
+        iterator = dataset.sample_iter(spec)
+        first = next(iterator)
+        rest = list(iterator)
+        dataset.reset_seed()
+        eager = dataset.sample(spec)
+
+        assert [r.prompt for r in [first, *rest]] == [r.prompt for r in eager]
+        with pytest.raises(ValueError, match="num_requests"):
+            dataset.sample_iter(
+                WorkloadSpec(
+                    name="bad",
+                    workload_type=WorkloadType.SHORT,
+                    prompt_len=20,
+                    output_len=5,
+                    num_requests=0,
+                )
+            )
+
+    def test_generate_request_ids_are_uuid4(self) -> None:
+        """测试批量生成的 ID 与 str(uuid.uuid4()) 格式一致。"""
+        from sagellm_benchmark.datasets.base import generate_request_ids
+
+        ids = generate_request_ids(64)
+
+        assert len(set(ids)) == 64
+        for request_id in ids:
+            parsed = uuid.UUID(request_id)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == request_id
+        assert generate_request_ids(0) == []
+
     def test_sample_reproducible(self) -> None:
         """测试采样可复现性。"""
         spec = WorkloadSpec(
@@ -243,6 +299,224 @@ class TestRandomDataset:
         for r1, r2 in zip(requests1, requests2):
             assert r1.prompt == r2.prompt
 
+    def test_simple_prompt_alphabet_and_determinism(self) -> None:
+        """测试简单模式：精确长度、字符表与种子可复现。"""
+        import string
+
+        spec = WorkloadSpec(
+            name="simple",
+            workload_type=WorkloadType.SHORT,
+            prompt_len=300,
+            output_len=10,
+            num_requests=3,
+        )
+        allowed = set(string.ascii_letters + string.digits + " ")
+
+        dataset = RandomDataset(seed=7, length_mode="char", realistic=False)
+        requests1 = dataset.sample(spec)
+        dataset.reset_seed()
+        requests2 = dataset.sample(spec)
+
+        for r1, r2 in zip(requests1, requests2, strict=True):
+            assert len(r1.prompt) == 300
+            assert set(r1.prompt) <= allowed
+            assert r1.prompt == r2.prompt
+        assert requests1[0].prompt != requests1[1].prompt
+
+    def test_realistic_prompt_sentences(self) -> None:
+        """测试真实模式：长度在 ±10% 内，句子由词表中的词组成。"""
+        from sagellm_benchmark.datasets.random import WORD_POOL
+
+        dataset = RandomDataset(seed=3)
+        words = set(WORD_POOL)
+
+        for target in (200, 2000):
+            prompt = dataset._generate_realistic_prompt(target)
+            # 停在第一个达到目标的词：不短于目标，且以句号结尾
+            assert target <= len(prompt) <= target * 1.1
+            assert prompt.endswith(".")
+            body = prompt.split(" . ", 1)[1]
+            for sentence in body.split(".")[:-1]:
+                assert set(sentence.split()) <= words
+
+    def test_prompt_pool_reuses_prompts(self) -> None:
+        """测试 prompt_pool_size：每个长度只生成一池 prompt 并轮流复用。"""
+        spec = WorkloadSpec(
+            name="pool",
+            workload_type=WorkloadType.SHORT,
+            prompt_len=64,
+            output_len=8,
+            num_requests=10,
+        )
+        dataset = RandomDataset(seed=5, prompt_pool_size=4)
+
+        prompts = [r.prompt for r in dataset.sample(spec)]
+
+        assert len(set(prompts)) == 4
+        assert prompts[4:8] == prompts[:4]
+        assert [r.prompt for r in dataset.sample(spec)][:4] == prompts[:4]
+        with pytest.raises(ValueError, match="prompt_pool_size"):
+            RandomDataset(prompt_pool_size=0)
+
+
+class TestShareGPTDataset:
+    """ShareGPTDataset 测试。"""
+
+    def test_sample_prefers_matching_lengths(self) -> None:
+        """测试按目标长度（±30%）筛选候选 prompt。"""
+        from sagellm_benchmark.datasets import ShareGPTDataset
+
+        data = [
+            {"conversations": [{"from": "human", "value": "short " * 4}]},
+            {"conversations": [{"from": "human", "value": "x" * 400}]},
+            {"conversations": [{"from": "gpt", "value": "no human turn"}]},
+        ]
+        dataset = ShareGPTDataset(data, seed=1)
+        spec = WorkloadSpec(
+            name="test",
+            workload_type=WorkloadType.SHORT,
+            prompt_len=100,
+            output_len=10,
+            num_requests=8,
+        )
+
+        requests = dataset.sample(spec)
+
+        assert len(dataset) == 2
+        assert all(req.prompt == "x" * 400 for req in requests)
+
+    def test_duplicate_prompts_share_one_string(self) -> None:
+        """测试重复的短 prompt 提取后共享同一个字符串对象。"""
+        import json
+
+        from sagellm_benchmark.datasets import ShareGPTDataset
+
+        # 经 JSON 解析后每条 value 都是独立的字符串对象
+        data = json.loads(
+            json.dumps([{"conversations": [{"from": "human", "value": "hello there"}]}] * 3)
+        )
+
+        prompts = ShareGPTDataset(data)._prompts
+
+        assert len(prompts) == 3
+        assert prompts[0] is prompts[1] is prompts[2]
+
+    def test_from_file_streams_large_files_with_ijson(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """测试大文件在安装 ijson 时流式解析（以简易 ijson 替身验证调用）。"""
+        import json
+        import sys
+        from types import SimpleNamespace
+
+        from sagellm_benchmark.datasets import ShareGPTDataset, sharegpt
+
+        data = [{"conversations": [{"from": "human", "value": "p" * 20}]}] * 3
+        path = tmp_path / "sharegpt.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        calls: list[str] = []
+
+        def _items(fh, prefix):
+            calls.append(prefix)
+            yield from json.load(fh)
+
+        monkeypatch.setattr(sharegpt, "_STREAM_THRESHOLD_BYTES", 0)
+        monkeypatch.setitem(sys.modules, "ijson", SimpleNamespace(items=_items, parse=_fake_parse))
+
+        dataset = ShareGPTDataset.from_file(path)
+
+        assert calls == ["item"]
+        assert len(dataset) == 3
+
+    def test_from_file_streaming_rejects_non_list_top_level(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """测试流式解析路径与一次性加载路径一样拒绝非数组的顶层结构。"""
+        import json
+        import sys
+        from types import SimpleNamespace
+
+        from sagellm_benchmark.datasets import ShareGPTDataset, sharegpt
+
+        path = tmp_path / "sharegpt.json"
+        path.write_text(json.dumps({"conversations": []}), encoding="utf-8")
+
+        def _items(fh, prefix):
+            raise AssertionError("items() must not run for a non-list top level")
+
+        monkeypatch.setattr(sharegpt, "_STREAM_THRESHOLD_BYTES", 0)
+        monkeypatch.setitem(sys.modules, "ijson", SimpleNamespace(items=_items, parse=_fake_parse))
+
+        with pytest.raises(ValueError, match="Expected list, got <class 'dict'>"):
+            ShareGPTDataset.from_file(path)
+
+    def test_from_file_prompt_cache(self, tmp_path) -> None:
+        """测试 cache_prompts：首次写缓存，再次加载读缓存，源文件变化后失效。"""
+        import json
+
+        from sagellm_benchmark.datasets import ShareGPTDataset, sharegpt
+
+        data = [
+            {
+                "conversations": [
+                    {"from": "human", "value": "a" * 20},
+                    {"from": "gpt", "value": "x"},
+                ]
+            },
+            {"conversations": [{"from": "gpt", "value": "no human"}]},
+        ]
+        path = tmp_path / "sharegpt.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        assert len(ShareGPTDataset.from_file(path, cache_prompts=True)) == 1
+        assert sharegpt._read_prompt_cache(path) == ["a" * 20]
+
+        # 缓存命中时不再解析源文件
+        sharegpt._write_prompt_cache(path, ["c" * 30] * 3)
+        assert len(ShareGPTDataset.from_file(path, cache_prompts=True)) == 3
+
+        data.append({"conversations": [{"from": "human", "value": "b" * 40}]})
+        path.write_text(json.dumps(data), encoding="utf-8")
+        assert sharegpt._read_prompt_cache(path) is None
+        assert len(ShareGPTDataset.from_file(path, cache_prompts=True)) == 2
+
+    def test_prompt_cache_json_fallback(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """测试未安装 pyarrow 时 prompt 缓存使用 JSON 文件。"""
+        from sagellm_benchmark.datasets import sharegpt
+
+        monkeypatch.setattr(sharegpt, "pa", None)
+        path = tmp_path / "sharegpt.json"
+        path.write_text("[]", encoding="utf-8")
+
+        sharegpt._write_prompt_cache(path, ["p" * 12])
+
+        assert (tmp_path / "sharegpt.json.prompts.json").is_file()
+        assert sharegpt._read_prompt_cache(path) == ["p" * 12]
+
+    def test_from_huggingface_iterates_without_materializing(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """测试 from_huggingface 直接迭代数据集并透传 streaming。"""
+        datasets = pytest.importorskip("datasets")
+        from sagellm_benchmark.datasets import ShareGPTDataset
+
+        rows = [
+            {"id": str(i), "conversations": [{"from": "human", "value": "q" * (20 + i)}]}
+            for i in range(3)
+        ]
+        calls: list[dict] = []
+
+        def _load_dataset(repo_id, split, **kwargs):
+            calls.append(kwargs)
+            return datasets.Dataset.from_list(rows)
+
+        monkeypatch.setattr(datasets, "load_dataset", _load_dataset)
+
+        dataset = ShareGPTDataset.from_huggingface("org/sharegpt", streaming=True)
+
+        assert calls == [{"streaming": True}]
+        assert len(dataset) == 3
+
 
 class TestSyntheticShareGPTDataset:
     """SyntheticShareGPTDataset 测试。"""
@@ -40,3 +40,17 @@ def test_import_performance_modules():
     assert hasattr(benchmark_utils, "benchmark_function")
     assert hasattr(model_benchmarks, "run_e2e_model_benchmarks")
     assert hasattr(plotting, "generate_perf_charts")
+
+
+def test_dashboard_exports_are_lazy():
+    """RankingDashboard is resolved on first access, not at package import."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, sagellm_benchmark.dashboard as d;"
+        "assert 'sagellm_benchmark.dashboard.ranking' not in sys.modules;"
+        "assert d.RankingDashboard.__name__ == 'RankingDashboard';"
+        "assert 'sagellm_benchmark.dashboard.ranking' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,247 @@
+"""Tests for LeaderboardExporter hardware and environment detection."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from sagellm_benchmark.exporters import leaderboard
+from sagellm_benchmark.exporters.leaderboard import LeaderboardExporter
+
+
+@pytest.fixture(autouse=True)
+def _clear_hardware_cache():
+    leaderboard._probe_hardware.cache_clear()
+    leaderboard._probe_environment.cache_clear()
+    yield
+    leaderboard._probe_hardware.cache_clear()
+    leaderboard._probe_environment.cache_clear()
+
+
+def test_detect_hardware_info_probes_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("SAGELLM_FORCE_SINGLE_CHIP", raising=False)
+
+    first = LeaderboardExporter.detect_hardware_info()
+    second = LeaderboardExporter.detect_hardware_info()
+
+    assert first == second
+    assert leaderboard._probe_hardware.cache_info().hits == 1
+
+
+def test_detect_hardware_info_returns_independent_copies() -> None:
+    first = LeaderboardExporter.detect_hardware_info()
+    first["chip_count"] = 99
+
+    assert LeaderboardExporter.detect_hardware_info()["chip_count"] != 99
+
+
+def test_detect_hardware_info_honours_force_single_chip(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SAGELLM_FORCE_SINGLE_CHIP", "true")
+    LeaderboardExporter.detect_hardware_info()
+    monkeypatch.setenv("SAGELLM_FORCE_SINGLE_CHIP", "false")
+    LeaderboardExporter.detect_hardware_info()
+
+    # The env override is part of the cache key, so both settings are probed
+    assert leaderboard._probe_hardware.cache_info().currsize == 2
+
+
+def test_detect_environment_runs_nvidia_smi_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+
+    def _fake_run(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="550.54\n", stderr="")
+
+    monkeypatch.setitem(sys.modules, "torch", None)
+    monkeypatch.setattr(leaderboard.subprocess, "run", _fake_run)
+
+    first = LeaderboardExporter.detect_environment()
+    first["driver_version"] = "changed"
+
+    assert LeaderboardExporter.detect_environment()["driver_version"] == "550.54"
+    assert len(calls) == 1
+
+
+def test_detect_environment_skips_nvidia_smi_without_cuda(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake_torch = SimpleNamespace(
+        __version__="2.0.0", cuda=SimpleNamespace(is_available=lambda: False)
+    )
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+    monkeypatch.setattr(
+        leaderboard.subprocess, "run", lambda *a, **k: pytest.fail("nvidia-smi should not run")
+    )
+
+    env = LeaderboardExporter.detect_environment()
+
+    assert env["pytorch_version"] == "2.0.0"
+    assert env["driver_version"] == ""
+
+
+def test_read_proc_field_parses_first_match(tmp_path) -> None:
+    cpuinfo = tmp_path / "cpuinfo"
+    cpuinfo.write_text(
+        "processor\t: 0\nmodel name\t: Test CPU @ 2.0GHz\n\n"
+        "processor\t: 1\nmodel name\t: Other CPU\n"
+    )
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text("MemTotal:       16384000 kB\nMemFree:         1024 kB\n")
+
+    assert leaderboard._read_proc_field(str(cpuinfo), "model name") == "Test CPU @ 2.0GHz"
+    assert leaderboard._read_proc_field(str(meminfo), "MemTotal") == "16384000 kB"
+    assert leaderboard._read_proc_field(str(meminfo), "SwapTotal") is None
+
+
+def test_detect_hardware_info_reprobes_on_visible_devices_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "0")
+    LeaderboardExporter.detect_hardware_info()
+    LeaderboardExporter.detect_hardware_info()
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "0,1")
+    LeaderboardExporter.detect_hardware_info()
+
+    info = leaderboard._probe_hardware.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_dumps_indented_round_trips() -> None:
+    entry = {"model": {"name": "Qwen2-7B"}, "metrics": {"ttft_ms": 12.5}, "notes": "吞吐"}
+
+    assert json.loads(leaderboard._dumps_indented(entry)) == entry
+
+
+def test_dumps_indented_falls_back_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(leaderboard, "orjson", None)
+
+    assert (
+        leaderboard._dumps_indented({"a": [1, 2]}) == json.dumps({"a": [1, 2]}, indent=2).encode()
+    )
+
+
+def test_dumps_indented_handles_values_orjson_rejects() -> None:
+    big = 2**70
+
+    assert json.loads(leaderboard._dumps_indented({"big": big})) == {"big": big}
+
+
+def test_write_atomic_replaces_file(tmp_path) -> None:
+    target = tmp_path / "entry.json"
+    target.write_text("old")
+
+    leaderboard._write_atomic(target, b'{"new": true}')
+
+    assert target.read_bytes() == b'{"new": true}'
+    assert [p.name for p in tmp_path.iterdir()] == ["entry.json"]
+
+
+def test_write_atomic_keeps_old_file_on_failure(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    target = tmp_path / "entry.json"
+    target.write_text("old")
+
+    def _fail(*args: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(leaderboard.os, "replace", _fail)
+
+    with pytest.raises(OSError, match="disk full"):
+        leaderboard._write_atomic(target, b"new")
+
+    assert target.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["entry.json"]
+
+
+def test_export_to_leaderboard_uses_given_entry_id_and_submitted_at(tmp_path) -> None:
+    from sagellm_benchmark.types import AggregatedMetrics
+
+    output = tmp_path / "Q1_leaderboard.json"
+    entry = LeaderboardExporter.export_to_leaderboard(
+        metrics=AggregatedMetrics(total_requests=1, successful_requests=1),
+        config={"model": "gpt2"},
+        workload_name="Q1",
+        output_path=output,
+        entry_id="entry-1",
+        submitted_at="2026-01-01T00:00:00+00:00",
+    )
+
+    assert entry["entry_id"] == "entry-1"
+    assert entry["metadata"]["submitted_at"] == "2026-01-01T00:00:00+00:00"
+    assert json.loads(output.read_bytes())["entry_id"] == "entry-1"
+
+
+def test_export_to_leaderboard_resolves_component_versions(tmp_path) -> None:
+    from sagellm_benchmark.types import AggregatedMetrics
+
+    entry = LeaderboardExporter.export_to_leaderboard(
+        metrics=AggregatedMetrics(total_requests=1, successful_requests=1),
+        config={"model": "gpt2", "versions": {"sagellm_core": "0.5.1", "comm": "0.4.0"}},
+        workload_name="Q1",
+        output_path=tmp_path / "Q1_leaderboard.json",
+    )
+
+    versions = entry["versions"]
+    assert list(versions) == [name for name, _ in leaderboard._VERSION_COMPONENTS]
+    assert versions["core"] == "0.5.1"
+    assert versions["comm"] == "0.4.0"
+    assert versions["protocol"] == "N/A"
+
+
+def test_skip_hw_detect_env_avoids_probing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SAGELLM_SKIP_HW_DETECT", "1")
+    monkeypatch.setattr(
+        leaderboard.subprocess, "run", lambda *a, **k: pytest.fail("nvidia-smi should not run")
+    )
+
+    hardware = LeaderboardExporter.detect_hardware_info()
+    environment = LeaderboardExporter.detect_environment()
+
+    assert hardware == leaderboard._STUB_HARDWARE
+    assert environment["driver_version"] == ""
+    assert leaderboard._probe_hardware.cache_info().currsize == 0
+    assert leaderboard._probe_environment.cache_info().currsize == 0
+
+
+def test_export_to_leaderboard_uses_hardware_from_custom_metadata(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sagellm_benchmark.types import AggregatedMetrics
+
+    monkeypatch.setattr(
+        LeaderboardExporter,
+        "detect_hardware_info",
+        staticmethod(lambda: pytest.fail("hardware should not be probed")),
+    )
+
+    entry = LeaderboardExporter.export_to_leaderboard(
+        metrics=AggregatedMetrics(total_requests=1, successful_requests=1),
+        config={"model": "gpt2"},
+        workload_name="Q1",
+        output_path=tmp_path / "Q1_leaderboard.json",
+        custom_metadata={"hardware": {"vendor": "NVIDIA", "chip_model": "A100", "chip_count": 2}},
+    )
+
+    assert entry["hardware"]["chip_model"] == "A100"
+    assert entry["hardware"]["chip_count"] == 2
+    assert entry["hardware"]["interconnect"] == "None"
+    assert entry["config_type"] == "multi_gpu"
+
+
+def test_dumps_indented_keeps_non_finite_floats() -> None:
+    payload = {"metrics": {"ttft_ms": float("nan"), "tps": [float("inf"), -float("inf")]}}
+
+    assert leaderboard._dumps_indented(payload) == json.dumps(payload, indent=2).encode()
+    assert b"NaN" in leaderboard._dumps_indented(payload)
+    assert b"null" not in leaderboard._dumps_indented(payload)
+
+
+def test_dumps_indented_writes_non_ascii_as_utf8() -> None:
+    payload = {"notes": "吞吐"}
+    expected = "吞吐".encode() if leaderboard.orjson is not None else b"\\u541e\\u5410"
+
+    encoded = leaderboard._dumps_indented(payload)
+
+    assert expected in encoded
+    assert json.loads(encoded) == payload
@@ -0,0 +1,57 @@
+"""Tests for the uvloop opt-in in sagellm_benchmark._loop."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from sagellm_benchmark import _loop
+
+
+def _fake_uvloop(created: list[asyncio.AbstractEventLoop]) -> SimpleNamespace:
+    def _new_event_loop() -> asyncio.AbstractEventLoop:
+        loop = asyncio.new_event_loop()
+        created.append(loop)
+        return loop
+
+    return SimpleNamespace(new_event_loop=_new_event_loop)
+
+
+def test_loop_factory_requires_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "uvloop", _fake_uvloop([]))
+    monkeypatch.delenv("SAGELLM_UVLOOP", raising=False)
+    assert _loop.uvloop_loop_factory() is None
+
+
+def test_loop_factory_missing_dependency(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    monkeypatch.setenv("SAGELLM_UVLOOP", "1")
+    assert _loop.uvloop_loop_factory() is None
+
+
+def test_run_uses_uvloop_without_changing_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: list[asyncio.AbstractEventLoop] = []
+    monkeypatch.setitem(sys.modules, "uvloop", _fake_uvloop(created))
+    monkeypatch.setenv("SAGELLM_UVLOOP", "1")
+    policy = asyncio.get_event_loop_policy()
+
+    async def _current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    loop = _loop.run(_current_loop())
+
+    assert created == [loop]
+    assert loop.is_closed()
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_run_without_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("SAGELLM_UVLOOP", raising=False)
+
+    async def _answer() -> int:
+        return 42
+
+    assert _loop.run(_answer()) == 42
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import random
+
 import pytest
 from sagellm_protocol import Metrics, Timestamps
 
@@ -80,6 +82,39 @@ def test_aggregator_basic(sample_results: list[BenchmarkResult]) -> None:
     assert aggregated.total_evict_count == 0 + 1 + 2 + 3 + 4  # 10
 
 
+def test_aggregator_incremental_matches_batch(sample_results: list[BenchmarkResult]) -> None:
+    """测试增量 update/finalize 与一次性 aggregate 结果一致。"""
+    aggregator = MetricsAggregator()
+    for result in reversed(sample_results):
+        aggregator.update(result)
+    aggregator.update(BenchmarkResult(request_id="failed", success=False, error="x"))
+
+    incremental = aggregator.finalize()
+    batch = MetricsAggregator.aggregate(
+        [*sample_results, BenchmarkResult(request_id="failed", success=False, error="x")]
+    )
+
+    assert incremental == batch
+    assert incremental.total_requests == 6
+    assert incremental.start_time == 1000.0
+    assert incremental.end_time == 1043.0
+
+
+def test_aggregator_n_hint_is_not_a_limit(sample_results: list[BenchmarkResult]) -> None:
+    """测试 n_hint 小于实际请求数时样本列自动扩容，结果不变。"""
+    aggregator = MetricsAggregator(n_hint=1)
+    for result in sample_results * 10:
+        aggregator.update(result)
+
+    aggregated = aggregator.finalize()
+
+    assert aggregated.successful_requests == len(sample_results) * 10
+    assert aggregated == MetricsAggregator.aggregate(sample_results * 10)
+    assert aggregated.avg_ttft_ms == pytest.approx(
+        MetricsAggregator.aggregate(sample_results).avg_ttft_ms
+    )
+
+
 def test_aggregator_with_failures() -> None:
     """测试包含失败请求的情况。"""
     results = [
@@ -659,3 +694,31 @@ def test_throughput_fields_presence() -> None:
     assert aggregated.input_throughput_tps == pytest.approx(200 / total_time, abs=0.1)
     assert aggregated.output_throughput_tps == pytest.approx(100 / total_time, abs=0.1)
     assert aggregated.total_throughput_tps == pytest.approx(300 / total_time, abs=0.1)
+
+
+def test_percentiles_match_sorted_index_method() -> None:
+    """np.partition 百分位应与排序索引法结果一致。"""
+    rng = random.Random(0)
+    for n in (1, 2, 3, 7, 10, 101):
+        samples = [rng.uniform(0.0, 100.0) for _ in range(n)]
+        ordered = sorted(samples)
+        expected = [ordered[min(int(n * p), n - 1)] for p in (0.01, 0.5, 0.95, 0.99)]
+        assert MetricsAggregator._percentiles(samples, (0.01, 0.5, 0.95, 0.99)) == expected
+
+
+def test_throughput_low_tail_percentiles(sample_results: list[BenchmarkResult]) -> None:
+    """单请求吞吐低尾百分位（throughput: 100, 90, 80, 70, 60）。"""
+    aggregated = MetricsAggregator.aggregate(sample_results)
+
+    assert aggregated.p1_throughput_tps == 60.0
+    assert aggregated.p5_throughput_tps == 60.0
+    assert aggregated.p10_throughput_tps == 60.0
+
+
+def test_aggregated_metrics_to_dict_matches_asdict(sample_results: list[BenchmarkResult]) -> None:
+    """to_dict 应与 dataclasses.asdict 的键顺序和取值一致。"""
+    from dataclasses import asdict
+
+    aggregated = MetricsAggregator.aggregate(sample_results)
+
+    assert list(aggregated.to_dict().items()) == list(asdict(aggregated).items())
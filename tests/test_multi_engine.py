@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 import pytest
@@ -219,3 +222,122 @@ def test_multi_engine_exported_from_clients() -> None:
     assert EngineType.SAGELLM == "sagellm"
     assert EngineInfo is not None
     assert MultiEngineRunner is not None
+
+
+@pytest.mark.asyncio
+async def test_multi_engine_runner_warmup_passes() -> None:
+    """Warmup requests are replayed warmup_passes times before measurement."""
+    client = SimulatedBenchmarkClient(latency_ms=1.0)
+    engine = EngineInfo(engine_type=EngineType.SIMULATED, client=client, label="warm")
+    runner = MultiEngineRunner(engines=[engine], warmup_passes=2, warmup_settle_s=0.01)
+
+    workload = _make_workload()
+    workload.warmup_rounds = 2
+    requests = _make_requests(3)
+
+    results = await runner.run_workload(workload, requests)
+
+    assert results[0].success
+    # 2 warmup requests x 2 passes + 3 measured requests
+    assert client.call_count == 7
+    assert results[0].metrics.total_requests == 3
+
+
+@pytest.mark.asyncio
+async def test_multi_engine_runner_default_warmup_is_single_pass() -> None:
+    client = SimulatedBenchmarkClient(latency_ms=1.0)
+    engine = EngineInfo(engine_type=EngineType.SIMULATED, client=client)
+    runner = MultiEngineRunner(engines=[engine])
+
+    workload = _make_workload()
+    workload.warmup_rounds = 2
+    await runner.run_workload(workload, _make_requests(3))
+
+    assert runner.warmup_settle_s == 0.0
+    assert not workload.warmup_concurrent
+    # 2 warmup requests x 1 pass + 3 measured requests
+    assert client.call_count == 5
+
+
+def test_multi_engine_runner_rejects_zero_warmup_passes() -> None:
+    engine = EngineInfo(engine_type=EngineType.SIMULATED, client=SimulatedBenchmarkClient())
+    with pytest.raises(ValueError, match="warmup_passes"):
+        MultiEngineRunner(engines=[engine], warmup_passes=0)
+
+
+def test_multi_engine_runner_run_workload_sync() -> None:
+    client = SimulatedBenchmarkClient(latency_ms=1.0)
+    runner = MultiEngineRunner(
+        engines=[EngineInfo(engine_type=EngineType.SIMULATED, client=client, label="sync")]
+    )
+
+    results = runner.run_workload_sync(_make_workload(), _make_requests(2))
+
+    assert len(results) == 1
+    assert results[0].success
+
+
+@pytest.mark.asyncio
+async def test_multi_engine_runner_run_workload_sync_inside_loop_raises() -> None:
+    runner = MultiEngineRunner(
+        engines=[EngineInfo(engine_type=EngineType.SIMULATED, client=SimulatedBenchmarkClient())]
+    )
+
+    with pytest.raises(RuntimeError, match="running event loop"):
+        runner.run_workload_sync(_make_workload(), _make_requests(1))
+
+
+def test_run_workload_sync_uses_uvloop_when_requested(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: list[asyncio.AbstractEventLoop] = []
+
+    def _new_event_loop() -> asyncio.AbstractEventLoop:
+        loop = asyncio.new_event_loop()
+        created.append(loop)
+        return loop
+
+    monkeypatch.setitem(sys.modules, "uvloop", SimpleNamespace(new_event_loop=_new_event_loop))
+    monkeypatch.setenv("SAGELLM_UVLOOP", "1")
+    runner = MultiEngineRunner(
+        engines=[EngineInfo(engine_type=EngineType.SIMULATED, client=SimulatedBenchmarkClient())]
+    )
+
+    results = runner.run_workload_sync(_make_workload(), _make_requests(1))
+
+    assert results[0].success
+    assert len(created) == 1
+
+
+@pytest.mark.asyncio
+async def test_multi_engine_runner_primes_connections_to_concurrency() -> None:
+    primed: list[int] = []
+
+    class _PrimingClient(SimulatedBenchmarkClient):
+        async def prime_connections(self, count: int) -> int:
+            primed.append(count)
+            return count
+
+    workload = _make_workload()
+    workload.concurrent = True
+    engine = EngineInfo(engine_type=EngineType.SIMULATED, client=_PrimingClient())
+
+    await MultiEngineRunner(engines=[engine], prime_connection_pool=True).run_workload(
+        workload, _make_requests(3)
+    )
+    await MultiEngineRunner(engines=[engine]).run_workload(workload, _make_requests(3))
+
+    assert primed == [3]
+
+
+@pytest.mark.asyncio
+async def test_multi_engine_runner_ignores_priming_failure() -> None:
+    class _BrokenPrimingClient(SimulatedBenchmarkClient):
+        async def prime_connections(self, count: int) -> int:
+            raise ConnectionError("refused")
+
+    engine = EngineInfo(engine_type=EngineType.SIMULATED, client=_BrokenPrimingClient())
+
+    results = await MultiEngineRunner(engines=[engine], prime_connection_pool=True).run_workload(
+        _make_workload(), _make_requests(2)
+    )
+
+    assert results[0].success